@@ -0,0 +1,60 @@
+#!/bin/bash
+# Data migration 015: reverse-direction indexes on the tag junction tables
+#
+# Mirrors library/backend/migrations/026_tag_junction_indexes.sql for
+# environments that won't re-run schema.sql on upgrade. The junction tables'
+# composite PRIMARY KEYs (audiobook_id, <tag>_id) only serve audiobook-led
+# lookups; tag-led queries — the library listing's genre filter and bulk tag
+# removal in utilities_crud.py — full-scan the junction table without these.
+#
+# Required after upgrades from any version < 8.4.2.0 to >= 8.4.2.0.
+#
+# Idempotency: CREATE INDEX IF NOT EXISTS — safe to re-run.
+#
+# Variables set by caller:
+#   DB_PATH       — path to audiobooks.db
+#   USE_SUDO      — "sudo" or "" for privilege elevation
+#   DRY_RUN       — "true" or "false"
+
+# shellcheck disable=SC2154
+
+MIN_VERSION="8.4.2.0"
+
+_dm015_sqlite() {
+    if [[ -n "$USE_SUDO" ]]; then
+        sudo -u audiobooks sqlite3 "$DB_PATH" "$@"
+    else
+        sqlite3 "$DB_PATH" "$@"
+    fi
+}
+
+_dm015_index_exists() {
+    local index="$1"
+    _dm015_sqlite "SELECT name FROM sqlite_master WHERE type='index' AND name='${index}';" 2>/dev/null \
+        | grep -q "^${index}$"
+}
+
+run_migration() {
+    if _dm015_index_exists "idx_audiobook_genres_genre" \
+        && _dm015_index_exists "idx_audiobook_topics_topic" \
+        && _dm015_index_exists "idx_audiobook_eras_era"; then
+        echo "  [015] tag junction indexes already present — skipping"
+        return 0
+    fi
+
+    if [[ "$DRY_RUN" == "true" ]]; then
+        echo "  [015] DRY RUN: would CREATE INDEX on audiobook_genres/topics/eras tag columns"
+        return 0
+    fi
+
+    echo "  [015] Creating tag junction indexes..."
+    if _dm015_sqlite "CREATE INDEX IF NOT EXISTS idx_audiobook_genres_genre ON audiobook_genres(genre_id);" 2>&1 \
+        && _dm015_sqlite "CREATE INDEX IF NOT EXISTS idx_audiobook_topics_topic ON audiobook_topics(topic_id);" 2>&1 \
+        && _dm015_sqlite "CREATE INDEX IF NOT EXISTS idx_audiobook_eras_era ON audiobook_eras(era_id);" 2>&1; then
+        echo "  [015] tag junction indexes created"
+        return 0
+    else
+        echo "  [015] ERROR: failed to create tag junction indexes"
+        return 1
+    fi
+}
@@ -0,0 +1,58 @@
+#!/bin/bash
+# Data migration 016: partial indexes for the missing-metadata dashboard scans
+#
+# Mirrors library/backend/migrations/027_missing_metadata_indexes.sql for
+# environments that won't re-run schema.sql on upgrade. The missing-narrator
+# and missing-hash endpoints in utilities_crud.py full-scan audiobooks and
+# temp-sort by title without these; the partial indexes store only the
+# deficient rows and serve both the filter and the ORDER BY ... LIMIT 200.
+#
+# Required after upgrades from any version < 8.4.2.0 to >= 8.4.2.0.
+#
+# Idempotency: CREATE INDEX IF NOT EXISTS — safe to re-run.
+#
+# Variables set by caller:
+#   DB_PATH       — path to audiobooks.db
+#   USE_SUDO      — "sudo" or "" for privilege elevation
+#   DRY_RUN       — "true" or "false"
+
+# shellcheck disable=SC2154
+
+MIN_VERSION="8.4.2.0"
+
+_dm016_sqlite() {
+    if [[ -n "$USE_SUDO" ]]; then
+        sudo -u audiobooks sqlite3 "$DB_PATH" "$@"
+    else
+        sqlite3 "$DB_PATH" "$@"
+    fi
+}
+
+_dm016_index_exists() {
+    local index="$1"
+    _dm016_sqlite "SELECT name FROM sqlite_master WHERE type='index' AND name='${index}';" 2>/dev/null \
+        | grep -q "^${index}$"
+}
+
+run_migration() {
+    if _dm016_index_exists "idx_audiobooks_missing_narrator" \
+        && _dm016_index_exists "idx_audiobooks_missing_hash"; then
+        echo "  [016] missing-metadata indexes already present — skipping"
+        return 0
+    fi
+
+    if [[ "$DRY_RUN" == "true" ]]; then
+        echo "  [016] DRY RUN: would CREATE partial INDEXes for missing-narrator/missing-hash"
+        return 0
+    fi
+
+    echo "  [016] Creating missing-metadata partial indexes..."
+    if _dm016_sqlite "CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_narrator ON audiobooks(title COLLATE NOCASE) WHERE narrator IS NULL OR narrator = '' OR narrator = 'Unknown Narrator';" 2>&1 \
+        && _dm016_sqlite "CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_hash ON audiobooks(title COLLATE NOCASE) WHERE sha256_hash IS NULL OR sha256_hash = '';" 2>&1; then
+        echo "  [016] missing-metadata partial indexes created"
+        return 0
+    else
+        echo "  [016] ERROR: failed to create missing-metadata partial indexes"
+        return 1
+    fi
+}
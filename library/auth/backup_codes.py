@@ -9,6 +9,7 @@ be used once to recover access to their account.
 """
 
 import hashlib
+import hmac
 import secrets
 from dataclasses import dataclass
 from datetime import datetime
@@ -61,6 +62,12 @@ def hash_backup_code(code: str) -> str:
     """
     Hash a backup code for storage.
 
+    A single SHA-256 is deliberate: backup codes carry ~77 bits of random
+    entropy (see generate_backup_code), so a slow KDF (bcrypt/argon2) adds
+    nothing against brute force and would only burn 50-200ms of request
+    time per verification. Verification stays microsecond-cheap and never
+    needs to leave the Flask worker.
+
     Args:
         code: Raw or normalized backup code
 
@@ -171,23 +178,27 @@ class BackupCodeRepository:
         code_hash = hash_backup_code(code)
 
         with self.db.connection() as conn:
-            # Find unused code matching hash
+            # Fetch all unused hashes for the user and compare in Python with
+            # hmac.compare_digest instead of matching in SQL — the SQL string
+            # comparison is a byte-wise early-exit compare. Scanning every
+            # candidate (at most NUM_BACKUP_CODES rows) without breaking keeps
+            # verification timing independent of which code matched.
             cursor = conn.execute(
-                """
-                SELECT id FROM backup_codes
-                WHERE user_id = ? AND code_hash = ? AND used_at IS NULL
-                """,
-                (user_id, code_hash),
+                "SELECT id, code_hash FROM backup_codes WHERE user_id = ? AND used_at IS NULL",
+                (user_id,),
             )
-            row = cursor.fetchone()
+            matched_id = None
+            for row_id, stored_hash in cursor.fetchall():
+                if hmac.compare_digest(stored_hash, code_hash) and matched_id is None:
+                    matched_id = row_id
 
-            if row is None:
+            if matched_id is None:
                 return False
 
             # Mark as used
             conn.execute(
                 "UPDATE backup_codes SET used_at = ? WHERE id = ?",
-                (datetime.now().isoformat(), row[0]),
+                (datetime.now().isoformat(), matched_id),
             )
 
         return True
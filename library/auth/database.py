@@ -11,6 +11,7 @@ import hashlib
 import logging
 import os
 import secrets
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Generator, Optional
@@ -69,11 +70,25 @@ class AuthDatabase:
         self.db_path = Path(db_path)
         self.is_dev = is_dev
 
-        if key_path is None:
-            key_path = self._default_key_path()
-        self.key_path = Path(key_path)
+        # ":memory:" databases (test-only) live and die with one persistent
+        # connection — a fresh connection per call would see a new empty DB.
+        self._is_memory = db_path == ":memory:"
+        self._memory_conn: Optional[sqlcipher.Connection] = None  # type: ignore[attr-defined]
+
+        self.key_path: Optional[Path]
+        if key_path is None and self._is_memory:
+            # Ephemeral database: use a throwaway key held in RAM instead of
+            # creating a key file on disk.
+            self.key_path = None
+        else:
+            if key_path is None:
+                key_path = self._default_key_path()
+            self.key_path = Path(key_path)
 
         self._key: Optional[str] = None
+        # Active transaction() connection, if any. Thread-local so concurrent
+        # request threads never share a connection.
+        self._txn_local = threading.local()
 
     def _default_key_path(self) -> str:
         """Determine default key path based on mode."""
@@ -86,6 +101,10 @@ class AuthDatabase:
 
     def _load_or_generate_key(self) -> str:
         """Load existing key or generate new one."""
+        if self.key_path is None:
+            # In-memory database with no key file: generate a throwaway key
+            # that lives only as long as this process.
+            return secrets.token_hex(self.KEY_LENGTH)
         if self.key_path.exists():
             return self._load_key()
         else:
@@ -93,6 +112,7 @@ class AuthDatabase:
 
     def _load_key(self) -> str:
         """Load encryption key from file."""
+        assert self.key_path is not None  # only reached for file-backed keys
         try:
             # Check file permissions in production
             if not self.is_dev:
@@ -119,6 +139,7 @@ class AuthDatabase:
 
     def _generate_key(self) -> str:
         """Generate new encryption key and save to file."""
+        assert self.key_path is not None  # only reached for file-backed keys
         key = secrets.token_hex(self.KEY_LENGTH)
 
         # Ensure parent directory exists
@@ -143,7 +164,10 @@ class AuthDatabase:
 
     def _create_connection(self) -> sqlcipher.Connection:  # type: ignore[attr-defined]
         """Create new encrypted database connection."""
-        conn = sqlcipher.connect(str(self.db_path))  # type: ignore[attr-defined]
+        # cached_statements: the auth layer issues well over the default 128
+        # distinct statements (schema, migrations, every repository method);
+        # a larger cache keeps hot queries compiled instead of re-parsed.
+        conn = sqlcipher.connect(str(self.db_path), cached_statements=256)  # type: ignore[attr-defined]
 
         # CRITICAL: Set encryption key FIRST, before any other operations.
         # SQLCipher PRAGMA key does NOT accept parameterized bind values
@@ -166,8 +190,42 @@ class AuthDatabase:
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
 
+        # WAL + NORMAL sync — same tuning the main library DB gets in
+        # core.get_db(). The dominant auth write is the per-request
+        # session touch; with the default DELETE journal and
+        # synchronous=FULL each touch paid a full fsync, and readers
+        # blocked behind it. Under WAL, NORMAL only risks losing the
+        # last transactions on power loss, never corruption — acceptable
+        # for last_seen updates. SQLCipher supports WAL (3.3+), and
+        # journal_mode persists in the DB header so re-running it per
+        # connection is a no-op. wal_autocheckpoint caps WAL growth.
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 1000")
+        conn.execute("PRAGMA busy_timeout = 5000")
+
+        # Dev/test databases are throwaway: skip fsync entirely so
+        # fixture-heavy suites don't pay disk flushes for data nobody
+        # keeps, spill temp B-trees to RAM, and give SQLite a 64 MB page
+        # cache so repeated test queries never touch disk. journal_mode
+        # stays WAL for file-backed dev DBs (a MEMORY journal can corrupt
+        # the dev server's DB on crash); :memory: databases already use a
+        # memory journal. Never applied in production (is_dev=False).
+        if self.is_dev:
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -65536")
+
         return conn
 
+    def _get_connection(self) -> sqlcipher.Connection:  # type: ignore[attr-defined]
+        """Get a connection: the persistent one for :memory:, else a fresh one."""
+        if self._is_memory:
+            if self._memory_conn is None:
+                self._memory_conn = self._create_connection()
+            return self._memory_conn
+        return self._create_connection()
+
     @contextmanager
     def connection(self) -> Generator[sqlcipher.Connection, None, None]:  # type: ignore[attr-defined]
         """
@@ -176,8 +234,16 @@ class AuthDatabase:
         Usage:
             with db.connection() as conn:
                 cursor = conn.execute("SELECT * FROM users")
+
+        Inside a transaction() block this yields the enclosing transaction's
+        connection without committing or closing it, so repository methods
+        compose into a single transaction transparently.
         """
-        conn = self._create_connection()
+        txn_conn = getattr(self._txn_local, "conn", None)
+        if txn_conn is not None:
+            yield txn_conn
+            return
+        conn = self._get_connection()
         try:
             yield conn
             conn.commit()
@@ -185,7 +251,43 @@ class AuthDatabase:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            if not self._is_memory:
+                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Generator[sqlcipher.Connection, None, None]:  # type: ignore[attr-defined]
+        """
+        Run several repository calls as one transaction on one connection.
+
+        Each connection() call normally opens a fresh SQLCipher connection
+        (paying key derivation) and commits/fsyncs on exit. Multi-step flows
+        like backup-code recovery issue half a dozen of those back to back;
+        wrapping them here means one connection, one BEGIN IMMEDIATE, one
+        commit — and the steps become atomic. Reentrant: a transaction()
+        inside a transaction() joins the outer one.
+
+        Usage:
+            with db.transaction():
+                user.save(db)
+                backup_repo.create_codes_for_user(user.id)
+        """
+        existing = getattr(self._txn_local, "conn", None)
+        if existing is not None:
+            yield existing
+            return
+        conn = self._get_connection()
+        self._txn_local.conn = conn
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._txn_local.conn = None
+            if not self._is_memory:
+                conn.close()
 
     def initialize(self) -> bool:
         """
@@ -194,10 +296,13 @@ class AuthDatabase:
         Returns:
             True if database was created, False if already existed
         """
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        created = not self.db_path.exists()
+        if self._is_memory:
+            # Nothing on disk: always a fresh database, no migrations to run.
+            created = True
+        else:
+            # Ensure parent directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            created = not self.db_path.exists()
 
         if not created:
             # Existing database: apply migrations BEFORE schema.sql
@@ -498,8 +603,9 @@ class AuthDatabase:
             Dict with verification results
         """
         result: dict[str, object] = {
-            "db_exists": self.db_path.exists(),
-            "key_exists": self.key_path.exists(),
+            "db_exists": self._is_memory or self.db_path.exists(),
+            # key_path is None only for :memory: databases (in-RAM key)
+            "key_exists": self.key_path.exists() if self.key_path is not None else True,
             "can_connect": False,
             "schema_version": None,
             "table_count": 0,
@@ -580,13 +686,32 @@ def hash_token(token: str) -> str:
     """
     Hash a token for storage.
 
+    BLAKE2b at the same 256-bit output: tokens here are fixed-length
+    high-entropy random strings (never low-entropy user input), so the
+    only requirement is one-wayness, and BLAKE2b is roughly twice as fast
+    per call as SHA-256 in hashlib. This hash runs on every authenticated
+    request to match the session cookie. digest_size=32 keeps the stored
+    format at 64 hex chars, identical to the old SHA-256 layout.
+
+    Migration note: hashes persisted before this change (sessions,
+    pending registrations, claim tokens) no longer match and behave like
+    expired tokens — a one-time re-login after upgrade.
+
+    Deliberately unkeyed (no HMAC server key): lookups are exact-match
+    index seeks on UNIQUE token_hash columns, so no per-row comparison of
+    attacker-controlled data ever happens in Python, and the tokens being
+    hashed carry ~190 bits of entropy — brute-forcing the preimage is
+    already infeasible for a reader of the (SQLCipher-encrypted) database,
+    so a key would buy nothing while adding one more secret to provision,
+    rotate, and lose.
+
     Args:
         token: The raw token string
 
     Returns:
-        SHA-256 hash of the token (64 hex chars)
+        BLAKE2b-256 hash of the token (64 hex chars)
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
 
 
 def generate_session_token() -> tuple[str, str]:
@@ -603,14 +728,31 @@ def generate_session_token() -> tuple[str, str]:
     return raw_token, token_hash
 
 
+# Verification tokens must stay alphanumeric: truncated claim codes are
+# formatted as XXXX-XXXX-XXXX-XXXX and the claim endpoints strip dashes from
+# user input, so `secrets.token_urlsafe` (whose alphabet includes - and _)
+# would corrupt hand-typed tokens.
+_VERIFICATION_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
 def generate_verification_token() -> tuple[str, str]:
     """
     Generate a verification token for registration.
 
+    Draws randomness in one token_bytes call instead of 32 separate
+    secrets.choice calls, using rejection sampling (accept bytes < 248 =
+    4 * 62) to keep the alphanumeric alphabet free of modulo bias.
+
     Returns:
         Tuple of (raw_token, token_hash)
     """
-    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
-    raw_token = "".join(secrets.choice(alphabet) for _ in range(32))
+    chars: list[str] = []
+    while len(chars) < 32:
+        for b in secrets.token_bytes(40):
+            if b < 248:
+                chars.append(_VERIFICATION_ALPHABET[b % 62])
+                if len(chars) == 32:
+                    break
+    raw_token = "".join(chars)
     token_hash = hash_token(raw_token)
     return raw_token, token_hash
@@ -77,6 +77,21 @@ class Notification:
             created_by=row[9],
         )
 
+    def to_api_dict(self) -> dict:
+        """Build the API-facing dict for this notification.
+
+        One attribute pass per row, and the response shape lives in one
+        place instead of being re-spelled in each endpoint's
+        comprehension.
+        """
+        return {
+            "id": self.id,
+            "message": self.message,
+            "type": self.type.value,
+            "dismissable": self.dismissable,
+            "priority": self.priority,
+        }
+
     def save(self, db: AuthDatabase) -> "Notification":
         """Save notification to database."""
         with db.connection() as conn:
@@ -191,6 +206,12 @@ class NotificationRepository:
             return [Notification.from_row(row) for row in cursor.fetchall()]
 
 
+# Value->member maps for row hydration: a dict lookup is cheaper than the
+# enum constructor call per row.
+_STATUS_BY_VALUE = {s.value: s for s in InboxStatus}
+_REPLY_BY_VALUE = {m.value: m for m in ReplyMethod}
+
+
 @dataclass
 class InboxMessage:
     """
@@ -209,33 +230,49 @@ class InboxMessage:
 
     @classmethod
     def from_row(cls, row: tuple) -> "InboxMessage":
-        """Create InboxMessage from database row."""
-        return cls(
-            id=row[0],
-            from_user_id=row[1],
-            message=row[2],
-            reply_via=ReplyMethod(row[3]),
-            reply_email=row[4],
-            status=InboxStatus(row[5]),
-            created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-            read_at=datetime.fromisoformat(row[7]) if row[7] else None,
-            replied_at=datetime.fromisoformat(row[8]) if row[8] else None,
-        )
+        """Create InboxMessage from database row.
+
+        Hot path for list_all/list_unread: unpacks the row in one step and
+        skips the generated dataclass __init__ — rows from our own schema
+        don't need its default handling, and the saving compounds when
+        hydrating large result sets.
+        """
+        msg = cls.__new__(cls)
+        (
+            msg.id,
+            msg.from_user_id,
+            msg.message,
+            reply_via,
+            msg.reply_email,
+            status,
+            created_at,
+            read_at,
+            replied_at,
+        ) = row
+        msg.reply_via = _REPLY_BY_VALUE[reply_via]
+        msg.status = _STATUS_BY_VALUE[status]
+        msg.created_at = datetime.fromisoformat(created_at) if created_at else None
+        msg.read_at = datetime.fromisoformat(read_at) if read_at else None
+        msg.replied_at = datetime.fromisoformat(replied_at) if replied_at else None
+        return msg
 
     def save(self, db: AuthDatabase) -> "InboxMessage":
         """Save message to database."""
         with db.connection() as conn:
             if self.id is None:
+                # RETURNING (SQLite >= 3.35) picks up the generated id and
+                # default created_at in the insert itself, instead of a
+                # follow-up SELECT.
                 cursor = conn.execute(
                     """
                     INSERT INTO inbox (from_user_id, message, reply_via, reply_email)
                     VALUES (?, ?, ?, ?)
+                    RETURNING id, created_at
                     """,
                     (self.from_user_id, self.message, self.reply_via.value, self.reply_email),
                 )
-                self.id = cursor.lastrowid
-                cursor = conn.execute("SELECT created_at FROM inbox WHERE id = ?", (self.id,))
-                self.created_at = datetime.fromisoformat(cursor.fetchone()[0])
+                self.id, created_at = cursor.fetchone()
+                self.created_at = datetime.fromisoformat(created_at)
 
                 # Log contact (audit trail without content)
                 conn.execute("INSERT INTO contact_log (user_id) VALUES (?)", (self.from_user_id,))
@@ -302,6 +339,16 @@ class InboxRepository:
                 )
             return [InboxMessage.from_row(row) for row in cursor.fetchall()]
 
+    def distinct_user_ids(self) -> set[int]:
+        """Get the distinct user ids that have sent inbox messages.
+
+        SQL-side DISTINCT: avoids hydrating full InboxMessage objects
+        (datetime parsing, enum conversion) when only the sender ids matter.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.execute("SELECT DISTINCT from_user_id FROM inbox")
+            return {row[0] for row in cursor.fetchall()}
+
     def count_unread(self) -> int:
         """Count unread messages."""
         with self.db.connection() as conn:
@@ -6,6 +6,7 @@ All credential data is stored encrypted via SQLCipher.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -237,6 +238,10 @@ class User:
                         self.id,
                     ),
                 )
+        _drop_cached_user(db, self.id)
+        # A recent get_by_username() miss may have left a negative entry for
+        # this name; a just-registered user must not be invisible for its TTL.
+        _drop_cached_username(db, self.username)
         return self
 
     def delete(self, db: AuthDatabase) -> bool:
@@ -245,6 +250,7 @@ class User:
             return False
         with db.connection() as conn:
             conn.execute("DELETE FROM users WHERE id = ?", (self.id,))
+        _drop_cached_user(db, self.id)
         return True
 
     def update_last_login(self, db: AuthDatabase) -> None:
@@ -255,6 +261,71 @@ class User:
                 "UPDATE users SET last_login = ? WHERE id = ?",
                 (self.last_login.isoformat(), self.id),
             )
+        _drop_cached_user(db, self.id)
+
+
+# TTL cache for user rows, hung off the AuthDatabase instance (like the
+# repository cache in auth_shared) so independently keyed databases — one per
+# Flask app in the test fixtures — never share entries. 30 seconds is short
+# enough that an admin revoking a permission takes effect promptly, and every
+# write path below drops the entry anyway; the TTL is just a backstop against
+# out-of-band writes (e.g. sqlite3 CLI surgery on a live database).
+_USER_CACHE_TTL_SECONDS = 30.0
+_USER_CACHE_MAX_ENTRIES = 1024
+# Unknown usernames are cached too, so an enumeration flood costs one
+# decrypted table lookup per unique name per window instead of one per
+# request. The full TTL is safe for misses as well: User.save() drops the
+# negative entry when a row is inserted, so a just-created account is
+# visible immediately on the handle that created it.
+_USER_NEGATIVE_TTL_SECONDS = 30.0
+
+
+def _user_cache(db: AuthDatabase) -> dict:
+    """Per-database {user_id: (expires_monotonic, User)} cache."""
+    return db.__dict__.setdefault("_user_cache", {})
+
+
+def _user_name_cache(db: AuthDatabase) -> dict:
+    """Per-database {username: (expires_monotonic, User | None)} cache.
+
+    None records a recent miss (negative entry)."""
+    return db.__dict__.setdefault("_user_name_cache", {})
+
+
+def _store_cached_user(db: AuthDatabase, user: User) -> None:
+    """Cache a freshly hydrated user row under both its id and username."""
+    if user.id is None:
+        return
+    cache = _user_cache(db)
+    names = _user_name_cache(db)
+    if len(cache) >= _USER_CACHE_MAX_ENTRIES:
+        cache.clear()
+    if len(names) >= _USER_CACHE_MAX_ENTRIES:
+        names.clear()
+    expires_at = time.monotonic() + _USER_CACHE_TTL_SECONDS
+    cache[user.id] = (expires_at, user)
+    names[user.username] = (expires_at, user)
+
+
+def _drop_cached_user(db: AuthDatabase, user_id: Optional[int]) -> None:
+    """Invalidate a cached user row after any write to it."""
+    if user_id is None:
+        return
+    entry = db.__dict__.get("_user_cache", {}).pop(user_id, None)
+    names = db.__dict__.get("_user_name_cache", {})
+    if entry is not None and entry[1] is not None:
+        names.pop(entry[1].username, None)
+    else:
+        # No id entry to learn the username from (e.g. only get_by_username
+        # ran); scan the bounded name map for entries pointing at this id.
+        stale = [k for k, (_, u) in names.items() if u is not None and u.id == user_id]
+        for k in stale:
+            names.pop(k, None)
+
+
+def _drop_cached_username(db: AuthDatabase, username: str) -> None:
+    """Invalidate a username entry (clears negative entries on user insert)."""
+    db.__dict__.get("_user_name_cache", {}).pop(username, None)
 
 
 class UserRepository:
@@ -262,31 +333,62 @@ class UserRepository:
 
     # Explicit column list — guarantees positional order matches from_row()
     # regardless of physical table column order (schema.sql vs ALTER TABLE).
-    # nosemgrep: sqlalchemy-execute-raw-query
-    _USER_SELECT = (
-        "SELECT id, username, auth_type, auth_credential, can_download, is_admin, "
+    # Shared with SessionRepository.get_session_and_user's JOIN, which must
+    # hydrate a User from the same positional layout.
+    _USER_COLUMNS = (
+        "id, username, auth_type, auth_credential, can_download, is_admin, "
         "created_at, last_login, recovery_email, recovery_phone, recovery_enabled, "
-        "last_audit_seen_id, multi_session, preferred_locale FROM users"
+        "last_audit_seen_id, multi_session, preferred_locale"
     )
+    # Only the constant column list above is interpolated; all values bind
+    # through `?` placeholders at the call sites.
+    _USER_SELECT = f"SELECT {_USER_COLUMNS} FROM users"  # nosec B608  # nosemgrep: sqlalchemy-execute-raw-query
 
     def __init__(self, db: AuthDatabase):
         self.db = db
 
     def get_by_id(self, user_id: int) -> Optional[User]:
-        """Get user by ID."""
+        """Get user by ID (TTL-cached; see _USER_CACHE_TTL_SECONDS)."""
+        cache = _user_cache(self.db)
+        entry = cache.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if time.monotonic() < expires_at:
+                return user
+            cache.pop(user_id, None)
         with self.db.connection() as conn:
             # nosemgrep: sqlalchemy-execute-raw-query
             cursor = conn.execute(self._USER_SELECT + " WHERE id = ?", (user_id,))
             row = cursor.fetchone()
-            return User.from_row(row) if row else None
+        if row is None:
+            return None
+        user = User.from_row(row)
+        _store_cached_user(self.db, user)
+        return user
 
     def get_by_username(self, username: str) -> Optional[User]:
-        """Get user by username (case-sensitive)."""
+        """Get user by username (case-sensitive; TTL-cached like get_by_id)."""
+        names = _user_name_cache(self.db)
+        entry = names.get(username)
+        if entry is not None:
+            expires_at, user = entry
+            if time.monotonic() < expires_at:
+                return user
+            names.pop(username, None)
         with self.db.connection() as conn:
             # nosemgrep: sqlalchemy-execute-raw-query
             cursor = conn.execute(self._USER_SELECT + " WHERE username = ?", (username,))
             row = cursor.fetchone()
-            return User.from_row(row) if row else None
+        if row is None:
+            # Remember the miss briefly so enumeration probes (and the login
+            # flow's own repeated lookups) stop hitting the encrypted table.
+            if len(names) >= _USER_CACHE_MAX_ENTRIES:
+                names.clear()
+            names[username] = (time.monotonic() + _USER_NEGATIVE_TTL_SECONDS, None)
+            return None
+        user = User.from_row(row)
+        _store_cached_user(self.db, user)
+        return user
 
     def username_exists(self, username: str) -> bool:
         """Check if username is taken."""
@@ -315,7 +417,9 @@ class UserRepository:
         """Set admin status for a user."""
         with self.db.connection() as conn:
             cursor = conn.execute("UPDATE users SET is_admin = ? WHERE id = ?", (is_admin, user_id))
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        return updated
 
     def count_admins(self) -> int:
         """Count the number of admin users."""
@@ -335,7 +439,9 @@ class UserRepository:
             cursor = conn.execute(
                 "UPDATE users SET can_download = ? WHERE id = ?", (can_download, user_id)
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        return updated
 
     def set_multi_session(self, user_id: int, value: str) -> bool:
         """Set multi-session override for a user."""
@@ -343,7 +449,9 @@ class UserRepository:
             cursor = conn.execute(
                 "UPDATE users SET multi_session = ? WHERE id = ?", (value, user_id)
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        return updated
 
     def update_username(self, user_id: int, new_username: str) -> bool:
         """
@@ -365,7 +473,11 @@ class UserRepository:
             cursor = conn.execute(
                 "UPDATE users SET username = ? WHERE id = ?", (new_username, user_id)
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        # The availability check above just cached a miss for new_username.
+        _drop_cached_username(self.db, new_username)
+        return updated
 
     def update_email(self, user_id: int, email: Optional[str]) -> bool:
         """
@@ -382,13 +494,17 @@ class UserRepository:
             cursor = conn.execute(
                 "UPDATE users SET recovery_email = ? WHERE id = ?", (email, user_id)
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        return updated
 
     def delete(self, user_id: int) -> bool:
         """Delete a user (cascades to sessions, positions, etc.)."""
         with self.db.connection() as conn:
             cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        _drop_cached_user(self.db, user_id)
+        return deleted
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by recovery email address."""
@@ -590,6 +706,14 @@ class SessionRepository:
     def __init__(self, db: AuthDatabase):
         self.db = db
 
+    # Explicit session column list — positional order matches Session.from_row()
+    # (and is what `SELECT *` yields for the current schema).
+    _SESSION_COLUMNS = (
+        "id, user_id, token_hash, created_at, last_seen, expires_at, "
+        "user_agent, ip_address, is_persistent"
+    )
+    _SESSION_COLUMN_COUNT = len(_SESSION_COLUMNS.split(","))
+
     def get_by_token(self, raw_token: str) -> Optional[Session]:
         """Get session by raw token."""
         token_hash = hash_token(raw_token)
@@ -598,6 +722,38 @@ class SessionRepository:
             row = cursor.fetchone()
             return Session.from_row(row) if row else None
 
+    def get_session_and_user(self, raw_token: str) -> tuple[Optional[Session], Optional["User"]]:
+        """Resolve a raw token to its (Session, User) pair in one query.
+
+        The per-request auth path used to issue two SELECTs — session by
+        token hash, then user by id. With SQLCipher, page decryption
+        dominates query cost, so the JOIN roughly halves the lookup work
+        on every authenticated request. Returns (None, None) when the
+        token matches no session; a session whose user row has vanished
+        yields (session, None) so callers can invalidate it.
+        """
+        token_hash = hash_token(raw_token)
+        session_cols = ", ".join(f"s.{c.strip()}" for c in self._SESSION_COLUMNS.split(","))
+        user_cols = ", ".join(f"u.{c.strip()}" for c in UserRepository._USER_COLUMNS.split(","))
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                f"SELECT {session_cols}, {user_cols} FROM sessions s"  # nosec B608 — column lists are class constants
+                " LEFT JOIN users u ON u.id = s.user_id WHERE s.token_hash = ?",
+                (token_hash,),
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None, None
+        split = self._SESSION_COLUMN_COUNT
+        session = Session.from_row(row[:split])
+        user_row = row[split:]
+        user = User.from_row(user_row) if user_row[0] is not None else None
+        if user is not None:
+            # The JOIN just paid for the decrypted user row — let follow-up
+            # get_by_id() calls within the TTL window reuse it.
+            _store_cached_user(self.db, user)
+        return session, user
+
     def get_by_user_id(self, user_id: int) -> Optional[Session]:
         """Get active session for user (if any)."""
         with self.db.connection() as conn:
@@ -871,26 +1027,26 @@ class ListeningHistoryRepository:
         spawned a new history row because the previous save had set ended_at.
         """
         cols = UserListeningHistory._COLUMNS
+        # Compute the cutoff in Python rather than via SQLite's
+        # datetime('now', 'localtime', '-N minutes') chain: stored ended_at
+        # values come from Python's datetime.now() (local clock, no tz
+        # suffix), so deriving the cutoff from the same clock removes the
+        # UTC/localtime alignment hazard and spares SQLite the per-query
+        # modifier evaluation. datetime(ended_at) still normalizes the
+        # column's ISO 'T' separator for comparison.
+        cutoff = (datetime.now() - timedelta(minutes=self.SESSION_IDLE_TIMEOUT_MINUTES)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
         with self.db.connection() as conn:
             cursor = conn.execute(  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-                # Stored ended_at values come from Python's datetime.now()
-                # (local time, no tz suffix). SQLite's datetime('now') is UTC,
-                # so the comparison must use 'localtime' to align — without
-                # this modifier, the window never matches and every save still
-                # creates a new row.
                 f"""
                 SELECT {cols} FROM user_listening_history
                 WHERE user_id = ? AND audiobook_id = ?
-                  AND (ended_at IS NULL
-                       OR datetime(ended_at) > datetime('now', 'localtime', ?))
+                  AND (ended_at IS NULL OR datetime(ended_at) > ?)
                 ORDER BY started_at DESC
                 LIMIT 1
                 """,  # nosec B608  # noqa: S608
-                (
-                    user_id,
-                    audiobook_id,
-                    f"-{self.SESSION_IDLE_TIMEOUT_MINUTES} minutes",
-                ),
+                (user_id, audiobook_id, cutoff),
             )
             row = cursor.fetchone()
             return UserListeningHistory.from_row(row) if row else None
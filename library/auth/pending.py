@@ -224,3 +224,17 @@ class PendingRecoveryRepository:
         with self.db.connection() as conn:
             cursor = conn.execute("DELETE FROM pending_recovery WHERE user_id = ?", (user_id,))
             return cursor.rowcount
+
+    def replace_for_user(
+        self, user_id: int, expiry_minutes: int = 15
+    ) -> tuple[PendingRecovery, str]:
+        """Atomically replace a user's pending recoveries with a fresh one.
+
+        Equivalent to ``delete_for_user()`` followed by
+        ``PendingRecovery.create()``, but in one transaction — a single
+        connection open and a single commit instead of two of each, and no
+        window in which the user has zero valid tokens.
+        """
+        with self.db.transaction():
+            self.delete_for_user(user_id)
+            return PendingRecovery.create(self.db, user_id, expiry_minutes=expiry_minutes)
@@ -29,7 +29,7 @@ CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE TABLE IF NOT EXISTS sessions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    token_hash TEXT UNIQUE NOT NULL,  -- SHA-256 of session token
+    token_hash TEXT UNIQUE NOT NULL,  -- BLAKE2b-256 of session token (see hash_token)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     expires_at TIMESTAMP,  -- NULL = no expiry (until logout/kick)
@@ -39,7 +39,9 @@ CREATE TABLE IF NOT EXISTS sessions (
 );
 
 CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
-CREATE INDEX IF NOT EXISTS idx_sessions_token_hash ON sessions(token_hash);
+-- token_hash is UNIQUE, which already creates an implicit unique index; the
+-- old explicit index duplicated it and just added write amplification.
+DROP INDEX IF EXISTS idx_sessions_token_hash;
 
 -- User positions table
 CREATE TABLE IF NOT EXISTS user_positions (
@@ -113,12 +115,13 @@ CREATE INDEX IF NOT EXISTS idx_user_settings_user ON user_settings(user_id);
 CREATE TABLE IF NOT EXISTS pending_registrations (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     username TEXT NOT NULL,
-    token_hash TEXT UNIQUE NOT NULL,  -- SHA-256 of verification token
+    token_hash TEXT UNIQUE NOT NULL,  -- BLAKE2b-256 of verification token (see hash_token)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     expires_at TIMESTAMP NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_pending_token_hash ON pending_registrations(token_hash);
+-- token_hash is UNIQUE (implicit unique index); drop the old duplicate.
+DROP INDEX IF EXISTS idx_pending_token_hash;
 
 -- Notifications table
 CREATE TABLE IF NOT EXISTS notifications (
@@ -159,7 +162,11 @@ CREATE TABLE IF NOT EXISTS inbox (
     replied_at TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_inbox_status ON inbox(status);
+-- Composite index: list_unread filters on status and orders by created_at,
+-- so (status, created_at) serves both the filter and the sort; count_unread
+-- becomes an index-only scan. Supersedes the old single-column status index.
+CREATE INDEX IF NOT EXISTS idx_inbox_status_created ON inbox(status, created_at);
+DROP INDEX IF EXISTS idx_inbox_status;
 
 -- Contact log (audit trail, no content)
 CREATE TABLE IF NOT EXISTS contact_log (
@@ -177,20 +184,27 @@ CREATE TABLE IF NOT EXISTS backup_codes (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_backup_codes_user_id ON backup_codes(user_id);
-CREATE INDEX IF NOT EXISTS idx_backup_codes_hash ON backup_codes(code_hash);
+-- Covering index for verify_and_consume and get_remaining_count: both filter
+-- on (user_id, used_at IS NULL) and read code_hash, so SQLCipher can answer
+-- from index pages without decrypting any table rows.
+CREATE INDEX IF NOT EXISTS idx_backup_codes_user_unused
+    ON backup_codes(user_id, used_at, code_hash);
+DROP INDEX IF EXISTS idx_backup_codes_user_id;
+-- Nothing queries code_hash without user_id; drop the old single-column index.
+DROP INDEX IF EXISTS idx_backup_codes_hash;
 
 -- Pending recovery requests (for magic link recovery)
 CREATE TABLE IF NOT EXISTS pending_recovery (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    token_hash TEXT UNIQUE NOT NULL,  -- SHA-256 of recovery token
+    token_hash TEXT UNIQUE NOT NULL,  -- BLAKE2b-256 of recovery token (see hash_token)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     expires_at TIMESTAMP NOT NULL,
     used_at TIMESTAMP                 -- NULL if unused
 );
 
-CREATE INDEX IF NOT EXISTS idx_pending_recovery_token ON pending_recovery(token_hash);
+-- token_hash is UNIQUE (implicit unique index); drop the old duplicate.
+DROP INDEX IF EXISTS idx_pending_recovery_token;
 CREATE INDEX IF NOT EXISTS idx_pending_recovery_user ON pending_recovery(user_id);
 
 -- Access requests table (pending admin approval)
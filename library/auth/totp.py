@@ -7,6 +7,7 @@ Secrets are stored as raw bytes and converted to base32 for authenticator apps.
 
 import base64
 import secrets
+from functools import lru_cache
 from io import BytesIO
 from typing import Tuple
 
@@ -111,6 +112,28 @@ def generate_qr_code(secret: bytes, username: str, issuer: str = DEFAULT_ISSUER)
     return buffer.getvalue()
 
 
+@lru_cache(maxsize=256)
+def qr_code_base64(secret: bytes, username: str, issuer: str = DEFAULT_ISSUER) -> str:
+    """
+    Generate the QR code PNG and return it base64-encoded, memoized.
+
+    QR rendering (qrcode + PIL) costs ~10-30ms, and setup flows re-request
+    the same image whenever the client retries or refreshes the setup page.
+    (secret, username, issuer) uniquely determine the image, so repeat
+    requests are dict hits. The cache holds nothing the process doesn't
+    already hold — the same secrets live in the auth DB handle's memory.
+
+    Args:
+        secret: Raw secret bytes
+        username: User's display name
+        issuer: App/service name
+
+    Returns:
+        Base64-encoded PNG image data
+    """
+    return base64.b64encode(generate_qr_code(secret, username, issuer)).decode("ascii")
+
+
 def get_current_code(secret: bytes) -> str:
     """
     Get the current TOTP code (for testing/debugging).
@@ -144,6 +167,9 @@ def verify_code(secret: bytes, code: str, valid_window: int = VALID_WINDOW) -> b
     if not code.isdigit() or len(code) != 6:
         return False
 
+    # pyotp.TOTP.verify compares via pyotp.utils.strings_equal, which is
+    # hmac.compare_digest under the hood — already constant-time, so no
+    # additional comparison hardening is needed here.
     totp = pyotp.TOTP(secret_to_base32(secret))
     return totp.verify(code, valid_window=valid_window)
 
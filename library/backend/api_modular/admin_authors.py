@@ -405,7 +405,7 @@ def reassign_book_authors(book_id: int):
     conn = _get_db()
     try:
         # Verify book exists
-        book = conn.execute("SELECT id FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
+        book = conn.execute("SELECT 1 FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
         if not book:
             return jsonify({"error": "Book not found"}), 404
 
@@ -569,7 +569,7 @@ def reassign_book_narrators(book_id: int):
 
     conn = _get_db()
     try:
-        book = conn.execute("SELECT id FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
+        book = conn.execute("SELECT 1 FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
         if not book:
             return jsonify({"error": "Book not found"}), 404
 
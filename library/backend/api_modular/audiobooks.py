@@ -6,8 +6,11 @@ Note: All queries filter by content_type to exclude non-audiobook content
 """
 
 import logging
+import os
 import subprocess  # nosec B404 — import subprocess — subprocess usage is intentional; all calls use hardcoded system tool names
 import sys
+import threading
+import time
 from collections import OrderedDict
 from pathlib import Path
 
@@ -24,7 +27,7 @@ from ._audio_paths import (
 )
 from .auth import auth_if_enabled, download_permission_required, guest_allowed
 from .collections import get_collections_lookup
-from .core import FlaskResponse, get_db
+from .core import FlaskResponse, clamp_int, get_db, ojson
 from .editions import has_edition_marker, normalize_base_title
 from .search_cjk import cjk_bigram_like_clause, contains_cjk
 
@@ -84,10 +87,55 @@ def _get_audiobooks_db():
     return get_db(db_path)
 
 
+# /api/stats and /api/filters aggregate the whole audiobooks table on every
+# request, but the underlying data only changes when the scanner syncs or an
+# admin edits metadata. Successful payloads are served from this short TTL
+# cache, keyed by database path so test apps pointing at different temp DBs
+# never see each other's numbers. The scanner runs in a separate process and
+# cannot invalidate in-process caches, so the TTL is the staleness bound;
+# the CRUD endpoints in this process call invalidate_aggregate_cache() on
+# mutation for immediate consistency.
+_AGG_CACHE_TTL_SECONDS = 30.0
+_agg_cache: dict[tuple[str, str], tuple[float, dict]] = {}
+_agg_cache_lock = threading.Lock()
+
+
+def _agg_cache_get(kind: str) -> dict | None:
+    """Return a cached aggregate payload for the current DB, or None."""
+    key = (kind, str(current_app.config.get("DATABASE_PATH", "")))
+    with _agg_cache_lock:
+        entry = _agg_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        _agg_cache.pop(key, None)
+    return None
+
+
+def _agg_cache_put(kind: str, payload: dict) -> None:
+    """Cache an aggregate payload for the current DB."""
+    key = (kind, str(current_app.config.get("DATABASE_PATH", "")))
+    with _agg_cache_lock:
+        _agg_cache[key] = (time.monotonic() + _AGG_CACHE_TTL_SECONDS, payload)
+
+
+def invalidate_aggregate_cache() -> None:
+    """Drop cached stats/filters payloads after an in-process mutation."""
+    with _agg_cache_lock:
+        _agg_cache.clear()
+
+
 @audiobooks_bp.route("/api/stats", methods=["GET"])
 @guest_allowed
 def get_stats() -> Response:
-    """Get library statistics (audiobooks only)"""
+    """Get library statistics (audiobooks only; TTL-cached).
+
+    Pass ``?fresh=1`` to bypass the cache (same convention as /auth/health).
+    """
+    if request.args.get("fresh") != "1":
+        cached = _agg_cache_get("stats")
+        if cached is not None:
+            return ojson(cached)
+
     conn = _get_audiobooks_db()
     cursor = conn.cursor()
 
@@ -148,27 +196,25 @@ def get_stats() -> Response:
     # Get database file size
     database_size_mb: float = 0.0
     try:
-        import os
-
         db_path_str = str(current_app.config.get("DATABASE_PATH", ""))
         if os.path.exists(db_path_str):
             database_size_mb = os.path.getsize(db_path_str) / (1024 * 1024)
     except OSError:
         pass  # Non-critical: database size is for informational display only
 
-    return jsonify(
-        {
-            "total_audiobooks": total_books,
-            "total_hours": round(total_hours),
-            "total_days": round(total_hours / 24),
-            "total_size_gb": round(total_size_gb, 2),
-            "database_size_mb": round(database_size_mb, 2),
-            "unique_authors": unique_authors,
-            "unique_narrators": unique_narrators,
-            "unique_publishers": unique_publishers,
-            "unique_genres": unique_genres,
-        }
-    )
+    payload = {
+        "total_audiobooks": total_books,
+        "total_hours": round(total_hours),
+        "total_days": round(total_hours / 24),
+        "total_size_gb": round(total_size_gb, 2),
+        "database_size_mb": round(database_size_mb, 2),
+        "unique_authors": unique_authors,
+        "unique_narrators": unique_narrators,
+        "unique_publishers": unique_publishers,
+        "unique_genres": unique_genres,
+    }
+    _agg_cache_put("stats", payload)
+    return ojson(payload)
 
 
 # --- Sort configuration constants (module-level, shared by helpers) ---
@@ -223,8 +269,8 @@ def _parse_query_params(req) -> dict:
     Returns a dict with all parsed/validated parameters ready for use
     by the query builder and sort clause builder.
     """
-    page = max(1, int(req.args.get("page", 1)))
-    per_page = min(200, max(1, int(req.args.get("per_page", 50))))
+    page = clamp_int(req.args, "page", 1, 1, 1_000_000)
+    per_page = clamp_int(req.args, "per_page", 50, 1, 200)
     sort_order = req.args.get("order", "asc").lower()
     if sort_order not in ("asc", "desc"):
         sort_order = "asc"
@@ -666,21 +712,15 @@ def get_audiobooks() -> Response:
     conn = _get_audiobooks_db()
     cursor = conn.cursor()
 
-    # Count total matching audiobooks
-    # where_sql is built from validated allowlists (filter specs + AUDIOBOOK_FILTER const), not user input.
-    count_query = f"SELECT COUNT(*) as total FROM audiobooks{join_sql} {where_sql}"  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query  # noqa: S608
-    cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-        count_query, join_params + params
-    )
-    total_count = cursor.fetchone()["total"]
-
     # Get paginated audiobooks
     page = qp["page"]
     per_page = qp["per_page"]
     offset = (page - 1) * per_page
 
     # CodeQL: sort_sql from allowlist (_SORT_MAPPINGS), sort_order validated
-    # where_sql/sort_sql built from validated allowlists, not user input
+    # where_sql/sort_sql built from validated allowlists, not user input.
+    # COUNT(*) OVER () rides along as the last column so the filtered set is
+    # walked once instead of running a separate COUNT with the same WHERE.
     query = (
         "SELECT audiobooks.id, audiobooks.title, audiobooks.author,"  # nosec B608  # noqa: S608
         " audiobooks.narrator, audiobooks.publisher, audiobooks.series,"
@@ -690,7 +730,8 @@ def get_audiobooks() -> Response:
         " audiobooks.narrator_last_name, audiobooks.narrator_first_name,"
         " audiobooks.duration_hours, audiobooks.duration_formatted,"
         " audiobooks.file_size_mb, audiobooks.file_path, audiobooks.cover_path,"
-        " audiobooks.format, audiobooks.quality, audiobooks.description"
+        " audiobooks.format, audiobooks.quality, audiobooks.description,"
+        " COUNT(*) OVER () AS _total"
         " FROM audiobooks"
         f"{join_sql}"
         f" {where_sql}"
@@ -699,15 +740,23 @@ def get_audiobooks() -> Response:
     )
 
     cursor.execute(query, join_params + params + [per_page, offset])
-    rows = cursor.fetchall()
 
-    # Convert to list of dicts
-    audiobooks = []
-    book_ids = []
-    for row in rows:
-        book = dict(row)
-        audiobooks.append(book)
-        book_ids.append(book["id"])
+    # Build the dict list straight off the cursor — fetchall() would hold a
+    # parallel list of Row tuples at peak alongside the dicts.
+    audiobooks = [dict(row) for row in cursor]
+    total_count = audiobooks[0]["_total"] if audiobooks else 0
+    for book in audiobooks:
+        del book["_total"]
+    book_ids = [book["id"] for book in audiobooks]
+
+    if not audiobooks:
+        # Page beyond the end (or no matches): the window function returned
+        # no rows to read the total from, so fall back to a bare COUNT.
+        count_query = f"SELECT COUNT(*) as total FROM audiobooks{join_sql} {where_sql}"  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query  # noqa: S608
+        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+            count_query, join_params + params
+        )
+        total_count = cursor.fetchone()["total"]
 
     if book_ids:
         _enrich_books_with_metadata(cursor, audiobooks, book_ids)
@@ -723,7 +772,7 @@ def get_audiobooks() -> Response:
     # Calculate pagination metadata
     total_pages = max(1, (total_count + per_page - 1) // per_page)
 
-    return jsonify(
+    return ojson(
         {
             "audiobooks": audiobooks,
             "pagination": {
@@ -741,7 +790,15 @@ def get_audiobooks() -> Response:
 @audiobooks_bp.route("/api/filters", methods=["GET"])
 @guest_allowed
 def get_filters() -> Response:
-    """Get all available filter options (audiobooks only)"""
+    """Get all available filter options (audiobooks only; TTL-cached).
+
+    Pass ``?fresh=1`` to bypass the cache (same convention as /auth/health).
+    """
+    if request.args.get("fresh") != "1":
+        cached = _agg_cache_get("filters")
+        if cached is not None:
+            return ojson(cached)
+
     conn = _get_audiobooks_db()
     cursor = conn.cursor()
 
@@ -799,17 +856,17 @@ def get_filters() -> Response:
 
     conn.close()
 
-    return jsonify(
-        {
-            "authors": authors,
-            "narrators": narrators,
-            "publishers": publishers,
-            "genres": genres,
-            "eras": eras,
-            "topics": topics,
-            "formats": formats,
-        }
-    )
+    payload = {
+        "authors": authors,
+        "narrators": narrators,
+        "publishers": publishers,
+        "genres": genres,
+        "eras": eras,
+        "topics": topics,
+        "formats": formats,
+    }
+    _agg_cache_put("filters", payload)
+    return ojson(payload)
 
 
 @audiobooks_bp.route("/api/narrator-counts", methods=["GET"])
@@ -834,7 +891,7 @@ def get_narrator_counts() -> Response:
     counts = {row["narrator"]: row["count"] for row in cursor.fetchall()}
     conn.close()
 
-    return jsonify(counts)
+    return ojson(counts)
 
 
 @audiobooks_bp.route("/api/audiobooks/<int:audiobook_id>", methods=["GET"])
@@ -891,7 +948,7 @@ def get_audiobook(audiobook_id: int) -> FlaskResponse:
 
     conn.close()
 
-    return jsonify(book)
+    return ojson(book)
 
 
 def _ffprobe_chapters(file_path: Path) -> list[dict]:
@@ -28,9 +28,12 @@ This module is dedicated to:
    ``@auth_bp.route`` decorators register on the shared blueprint.
 """
 
+import hashlib
 import json
 import logging
 import sys
+import threading
+import time
 from pathlib import Path
 
 from flask import jsonify, redirect, request
@@ -84,11 +87,14 @@ from .auth_shared import (  # noqa: F401  (re-export)
     SESSION_DURATION_DEFAULT,
     SESSION_DURATION_REMEMBER,
     SESSION_RENEWAL_THRESHOLD,
+    SESSION_TOUCH_DEBOUNCE_SECONDS,
+    _cached_repo,
     _extract_recovery_fields,
     _format_claim_token,
     _pending_totp_secrets,
     _pending_webauthn_challenges,
     _recovery_warning,
+    _required_str,
     _session_cookie_httponly,
     _session_cookie_name,
     _session_cookie_samesite,
@@ -144,6 +150,7 @@ from .auth_shared import (  # noqa: F401  (re-export)
 # fine), and the cookie flags are read-only after init from this module's
 # perspective (only ``set_session_cookie`` / ``clear_session_cookie`` in
 # auth_shared write them, and they read auth_shared's own bindings).
+from .core import ojson
 from .rate_limit import auth_rate_limited
 
 # ``_auth_db`` is rebound (not just mutated) in auth_shared at runtime, so
@@ -212,15 +219,15 @@ def login():
     if not data:
         return jsonify({"error": "Request body required"}), 400
 
-    username = data.get("username", "").strip()
-    code = data.get("code", "").strip()
+    username = _required_str(data, "username")
+    code = _required_str(data, "code")
     remember_me = data.get("remember_me", False)
 
-    if not username or not code:
+    if username is None or code is None:
         return jsonify({"error": "Username and code are required"}), 400
 
     db = get_auth_db()
-    user_repo = UserRepository(db)
+    user_repo = _cached_repo(db, UserRepository)
 
     # Find user
     user = user_repo.get_by_username(username)
@@ -278,7 +285,7 @@ def login():
     }
     if remember_me:
         response_data["session_token"] = token
-    response = jsonify(response_data)
+    response = ojson(response_data)
 
     # Set session cookie (persistent if remember_me is true)
     return set_session_cookie(response, token, remember_me=remember_me)
@@ -322,7 +329,7 @@ def restore_session():
 
     raw_token = data["token"].strip()
     db = get_auth_db()
-    session_repo = SessionRepository(db)
+    session_repo = _cached_repo(db, SessionRepository)
 
     session = session_repo.get_by_token(raw_token)
     if session is None:
@@ -347,7 +354,7 @@ def restore_session():
     session.touch(db)
 
     # Get user info
-    user_repo = UserRepository(db)
+    user_repo = _cached_repo(db, UserRepository)
     user = user_repo.get_by_id(session.user_id)
     if user is None:
         session.invalidate(db)
@@ -387,10 +394,10 @@ def get_current_user_info():
 
     # Get active notifications
     db = get_auth_db()
-    notif_repo = NotificationRepository(db)
+    notif_repo = _cached_repo(db, NotificationRepository)
     notifications = notif_repo.get_active_for_user(user.ensured_id)
 
-    return jsonify(
+    return ojson(
         {
             "user": {
                 "id": user.id,
@@ -406,16 +413,7 @@ def get_current_user_info():
                 "created_at": (session.created_at.isoformat() if session.created_at else None),
                 "last_seen": (session.last_seen.isoformat() if session.last_seen else None),
             },
-            "notifications": [
-                {
-                    "id": n.id,
-                    "message": n.message,
-                    "type": n.type.value,
-                    "dismissable": n.dismissable,
-                    "priority": n.priority,
-                }
-                for n in notifications
-            ],
+            "notifications": [n.to_api_dict() for n in notifications],
         }
     )
 
@@ -438,7 +436,7 @@ def update_current_user():
     user = require_current_user()
     data = request.get_json() or {}
     db = get_auth_db()
-    user_repo = UserRepository(db)
+    user_repo = _cached_repo(db, UserRepository)
 
     new_username = data.get("username")
     if new_username is not None:
@@ -716,15 +714,32 @@ def check_auth():
     """
     Check if the user is authenticated (lightweight endpoint).
 
+    Polled at high frequency by clients, so authenticated responses carry
+    an ETag derived from the session and the payload fields, bucketed to
+    the minute. A polling client replaying it via If-None-Match gets a
+    bodyless 304 instead of fresh JSON, and still revalidates at least
+    once a minute.
+
     Returns:
         200: {"authenticated": true, "username": "..."} or {"authenticated": false}
+        304: (empty) when If-None-Match matches the current session state
     """
     user = get_current_user()
     if user:
-        return jsonify(
+        session = require_current_session()
+        minute_bucket = int(session.last_seen.timestamp() // 60) if session.last_seen else 0
+        etag = hashlib.blake2b(
+            f"{session.id}:{user.username}:{user.is_admin}:{minute_bucket}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        response = ojson(
             {"authenticated": True, "username": user.username, "is_admin": user.is_admin}
         )
-    return jsonify({"authenticated": False})
+        response.set_etag(etag)
+        # make_conditional turns the 200 into a bodyless 304 when the
+        # client's If-None-Match carries the same tag.
+        return response.make_conditional(request)
+    return ojson({"authenticated": False})
 
 
 # =============================================================================
@@ -745,7 +760,7 @@ def dismiss_notification(notification_id: int):
     user_id = require_current_user_id()
     # require_current_user_id() raises RuntimeError if called outside @login_required
     db = get_auth_db()
-    notif_repo = NotificationRepository(db)
+    notif_repo = _cached_repo(db, NotificationRepository)
 
     if notif_repo.dismiss(notification_id, user_id):
         return jsonify({"success": True})
@@ -756,26 +771,49 @@ def dismiss_notification(notification_id: int):
 # Health Check
 # =============================================================================
 
+# Orchestrator probes hit /auth/health every few seconds; db.verify() runs a
+# schema query plus a COUNT(*) over users against the encrypted DB on each.
+# A probe storm should not translate into DB load, so successful results are
+# served from this cache for a few seconds. Failures are never cached — an
+# orchestrator must see a broken DB on the very next probe.
+_HEALTH_CACHE_TTL_SECONDS = 5.0
+_health_cache: dict = {"ts": 0.0, "payload": None}
+_health_cache_lock = threading.Lock()
+
 
 @auth_bp.route("/health", methods=["GET"])
 def auth_health():
     """
     Check auth system health.
 
+    Successful results are cached for a few seconds so frequent liveness
+    probes do not each pay for a full db.verify(). Pass ``?fresh=1`` to
+    bypass the cache for a manual check.
+
     Returns:
         200: {"status": "ok", "auth_db": true}
     """
+    fresh = request.args.get("fresh") == "1"
+    if not fresh:
+        with _health_cache_lock:
+            payload = _health_cache["payload"]
+            if payload is not None and time.monotonic() - _health_cache["ts"] < (
+                _HEALTH_CACHE_TTL_SECONDS
+            ):
+                return jsonify(payload)
     try:
         db = get_auth_db()
         status = db.verify()
-        return jsonify(
-            {
-                "status": "ok",
-                "auth_db": status["can_connect"],
-                "schema_version": status["schema_version"],
-                "user_count": status["user_count"],
-            }
-        )
+        payload = {
+            "status": "ok",
+            "auth_db": status["can_connect"],
+            "schema_version": status["schema_version"],
+            "user_count": status["user_count"],
+        }
+        with _health_cache_lock:
+            _health_cache["ts"] = time.monotonic()
+            _health_cache["payload"] = payload
+        return jsonify(payload)
     except Exception as e:
         logger.error("Auth database health check failed: %s", e)
         return (
@@ -32,7 +32,13 @@ from auth import (
     hash_token,
 )
 from auth.models import SystemSettingsRepository
-from auth.totp import generate_qr_code, get_provisioning_uri, secret_to_base32, setup_totp
+from auth.totp import (
+    generate_qr_code,
+    get_provisioning_uri,
+    qr_code_base64,
+    secret_to_base32,
+    setup_totp,
+)
 from flask import jsonify, request
 
 from .auth_shared import (
@@ -50,6 +56,7 @@ from .auth_shared import (
     get_auth_db,
     require_current_user,
 )
+from .core import clamp_int
 
 
 def _auth_mod():
@@ -409,7 +416,7 @@ def list_access_requests():
         200: {"requests": [...], "pending_count": int}
     """
     status_filter = request.args.get("status", "pending")
-    limit = min(int(request.args.get("limit", 50)), 100)
+    limit = clamp_int(request.args, "limit", 50, 1, 100)
 
     db = get_auth_db()
     request_repo = AccessRequestRepository(db)
@@ -706,7 +713,7 @@ def list_users():
     Returns:
         200: {"users": [...], "total": int}
     """
-    limit = min(int(request.args.get("limit", 100)), 500)
+    limit = clamp_int(request.args, "limit", 100, 1, 500)
 
     db = get_auth_db()
     user_repo = UserRepository(db)
@@ -1488,8 +1495,8 @@ def admin_audit_log():
     """
     from auth.audit import AuditLogRepository
 
-    limit = min(int(request.args.get("limit", 50)), 500)
-    offset = int(request.args.get("offset", 0))
+    limit = clamp_int(request.args, "limit", 50, 1, 500)
+    offset = clamp_int(request.args, "offset", 0, 0, 2**31)
     action_filter = request.args.get("action")
     user_filter = request.args.get("user_id", type=int)
 
@@ -1526,8 +1533,9 @@ def _totp_setup_data(user: User) -> dict[str, str | None]:
         return {}
     b32 = secret_to_base32(user.auth_credential)
     qr_uri = get_provisioning_uri(user.auth_credential, user.username)
-    qr_png = generate_qr_code(user.auth_credential, user.username)
-    qr_b64 = base64.b64encode(qr_png).decode("ascii")
+    # Memoized: this renders the *stored* credential, so repeat views of the
+    # same user's setup data hit the LRU instead of re-encoding the PNG.
+    qr_b64 = qr_code_base64(user.auth_credential, user.username)
     return {"secret": b32, "qr_uri": qr_uri, "manual_key": b32, "qr_base64": qr_b64}
 
 
@@ -13,8 +13,12 @@ stable import path is what lets existing `@patch("...auth._send_admin_alert")`
 mocks continue to work after this extraction.
 """
 
+import logging
 import os
+import queue
 import smtplib
+import threading
+import time
 import urllib.parse
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -23,6 +27,10 @@ from typing import Optional
 from common_utils.secret_resolver import resolve_secret
 from flask import current_app, request
 
+from .email_templates import render_email
+
+logger = logging.getLogger(__name__)
+
 
 def _get_base_url() -> str:
     """Get the base URL for email links, auto-detecting from request if not
@@ -44,22 +52,150 @@ def _get_email_config() -> tuple[str, int, str, str, str]:
     )
 
 
+# ---------------------------------------------------------------------------
+# Background delivery for magic-link email
+#
+# The magic-link endpoints return an anti-enumeration response that does not
+# depend on delivery succeeding, yet the synchronous SMTP conversation
+# (connect, STARTTLS, AUTH, DATA) used to hold the Flask worker hostage for
+# the relay's round trip. Delivery for that path now goes through a bounded
+# in-process queue drained by a single daemon thread. MIME rendering stays in
+# the request thread — the worker only speaks SMTP. The other senders remain
+# synchronous: their callers (admin approval/denial/invite, inbox replies)
+# surface the returned success/failure to a human.
+# ---------------------------------------------------------------------------
+
+_mail_queue: "queue.Queue[tuple[str, str, MIMEMultipart, str, int, str, str]]" = queue.Queue(
+    maxsize=256
+)
+_mail_worker: Optional[threading.Thread] = None
+_mail_worker_lock = threading.Lock()
+
+
+# Idle time after which a cached SMTP connection is considered stale and
+# re-established rather than trusted (relays drop quiet connections).
+_MAIL_CONN_IDLE_SECONDS = 60
+
+
+class _SMTPConnectionCache:
+    """Reuse one live SMTP connection across queued sends.
+
+    Connect + STARTTLS + AUTH costs roughly as much as sending a small
+    message, so under burst recovery traffic the worker keeps its
+    connection open between jobs. Only the single sender thread touches
+    an instance, so there is no locking. The connection is validated
+    with NOOP on checkout, discarded after _MAIL_CONN_IDLE_SECONDS idle
+    or when the config key changes, and rebuilt once on a mid-send
+    disconnect (421/EOF).
+    """
+
+    def __init__(self) -> None:
+        self._conn: Optional[smtplib.SMTP] = None
+        self._key: Optional[tuple[str, int, str]] = None
+        self._last_used = 0.0
+
+    @staticmethod
+    def _open(host: str, port: int, user: str, password: str) -> smtplib.SMTP:
+        conn = smtplib.SMTP(host, port)
+        # TLS and AUTH once per connection, not per message
+        if user and password:
+            conn.starttls()
+            conn.login(user, password)
+        return conn
+
+    def _is_usable(self, key: tuple[str, int, str]) -> bool:
+        if self._conn is None or self._key != key:
+            return False
+        if time.monotonic() - self._last_used > _MAIL_CONN_IDLE_SECONDS:
+            return False
+        try:
+            return self._conn.noop()[0] == 250
+        except Exception:  # noqa: BLE001 — any failure means reconnect
+            return False
+
+    def discard(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:  # noqa: BLE001 — already-dead connection
+                pass
+        self._conn = None
+        self._key = None
+
+    def send(
+        self,
+        from_email: str,
+        to_email: str,
+        msg: MIMEMultipart,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+    ) -> None:
+        key = (host, port, user)
+        if not self._is_usable(key):
+            self.discard()
+            self._conn = self._open(host, port, user, password)
+            self._key = key
+        assert self._conn is not None
+        try:
+            # send_message serializes through BytesGenerator straight onto
+            # the socket — no intermediate str copy + re-encode the old
+            # sendmail(msg.as_string()) pattern paid per message.
+            self._conn.send_message(msg, from_email, to_email)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException):  # fmt: skip
+            # Relay dropped the cached connection — rebuild once and retry.
+            self.discard()
+            self._conn = self._open(host, port, user, password)
+            self._key = key
+            self._conn.send_message(msg, from_email, to_email)
+        self._last_used = time.monotonic()
+
+
+def _mail_worker_loop() -> None:
+    """Drain the mail queue forever, logging (never raising) on failure."""
+    smtp_cache = _SMTPConnectionCache()
+    while True:
+        job = _mail_queue.get()
+        try:
+            smtp_cache.send(*job)
+        except Exception as e:  # noqa: BLE001 — delivery is best-effort
+            smtp_cache.discard()
+            logger.error("Background email delivery failed: %s", type(e).__name__)
+        finally:
+            _mail_queue.task_done()
+
+
+def _ensure_mail_worker() -> None:
+    """Start the sender thread on first use (lazily, once per process)."""
+    global _mail_worker
+    with _mail_worker_lock:
+        if _mail_worker is None or not _mail_worker.is_alive():
+            _mail_worker = threading.Thread(
+                target=_mail_worker_loop, name="auth-mail-sender", daemon=True
+            )
+            _mail_worker.start()
+
+
 def _send_magic_link_email(
     to_email: str, username: str, magic_link: str, expires_minutes: int, locale: str = "en"
 ) -> bool:
-    """Send a magic link email for login recovery."""
-    from backend.api_modular.email_templates import render_email
+    """Queue a magic link email for login recovery.
 
-    smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
-    base_url = _get_base_url()
+    Returns True once the message is enqueued; the anti-enumeration
+    responses built from this value never depended on actual delivery.
+    False only when rendering fails or the queue is full.
+    """
+    try:
+        smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
+        base_url = _get_base_url()
 
-    full_link = f"{base_url}{magic_link}"
+        full_link = f"{base_url}{magic_link}"
 
-    subject, text_content, html_content = render_email(
-        "magic_link", locale, username=username, link=full_link, expires_minutes=expires_minutes
-    )
+        subject, text_content, html_content = render_email(
+            "magic_link", locale, username=username, link=full_link, expires_minutes=expires_minutes
+        )
 
-    try:
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = from_email
@@ -68,14 +204,15 @@ def _send_magic_link_email(
         msg.attach(MIMEText(text_content, "plain"))
         msg.attach(MIMEText(html_content, "html"))
 
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            if smtp_user and smtp_pass:
-                server.starttls()
-                server.login(smtp_user, smtp_pass)
-            server.sendmail(from_email, to_email, msg.as_string())
-
+        _ensure_mail_worker()
+        _mail_queue.put_nowait(
+            (from_email, to_email, msg, smtp_host, smtp_port, smtp_user, smtp_pass)
+        )
         return True
 
+    except queue.Full:
+        current_app.logger.error("Magic link email queue full; message dropped")
+        return False
     except Exception as e:
         current_app.logger.error(f"Failed to send magic link email: {type(e).__name__}")
         return False
@@ -83,8 +220,6 @@ def _send_magic_link_email(
 
 def _send_approval_email(to_email: str, username: str, locale: str = "en") -> bool:
     """Send approval email with setup instructions and claim URL."""
-    from backend.api_modular.email_templates import render_email
-
     smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
     base_url = _get_base_url()
 
@@ -120,8 +255,6 @@ def _send_denial_email(
     to_email: str, username: str, reason: Optional[str] = None, locale: str = "en"
 ) -> bool:
     """Send denial notification for access request."""
-    from backend.api_modular.email_templates import render_email
-
     smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
 
     reason_text = reason if reason else "No specific reason was provided."
@@ -192,8 +325,6 @@ View all messages:
 
 def _send_reply_email(to_email: str, username: str, reply_text: str, locale: str = "en") -> bool:
     """Send admin reply to user inbox message."""
-    from backend.api_modular.email_templates import render_email
-
     smtp_host, smtp_port, smtp_user, smtp_pass, smtp_from = _get_email_config()
 
     subject, body, html_content = render_email(
@@ -225,8 +356,6 @@ def _send_invitation_email(
     to_email: str, username: str, claim_token: str, locale: str = "en", expires_hours: int = 48
 ) -> bool:
     """Send invitation email with claim URL + token (TOTP flow)."""
-    from backend.api_modular.email_templates import render_email
-
     smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
     base_url = _get_base_url()
 
@@ -271,8 +400,6 @@ def _send_activation_email(
     to_email: str, username: str, activation_token: str, locale: str = "en", expires_hours: int = 48
 ) -> bool:
     """Send activation email (magic-link flow — single click, no TOTP)."""
-    from backend.api_modular.email_templates import render_email
-
     smtp_host, smtp_port, smtp_user, smtp_pass, from_email = _get_email_config()
     base_url = _get_base_url()
 
@@ -18,11 +18,10 @@ None of the helpers or routes in this module are imported or patched by any
 other module, so no re-exports from auth.py are required.
 """
 
-from datetime import datetime
+import json
 
 from auth import (
     AuthType,
-    PendingRecovery,
     PendingRecoveryRepository,
     Session,
     SessionRepository,
@@ -30,10 +29,12 @@ from auth import (
 )
 from auth.backup_codes import BackupCodeRepository
 from auth.totp import setup_totp
-from flask import current_app, jsonify, request
+from flask import Response, current_app, jsonify, request
 
 from .auth_email import _send_magic_link_email
 from .auth_shared import (
+    _cached_repo,
+    _required_str,
     _user_allows_multi_session,
     auth_bp,
     get_auth_db,
@@ -41,7 +42,34 @@ from .auth_shared import (
     require_current_user,
     set_session_cookie,
 )
-from .rate_limit import auth_rate_limited
+from .rate_limit import auth_rate_limited, request_rate_limited
+
+# The magic-link endpoints are unauthenticated and rate-limited by IP, which
+# makes them the cheapest place for a hostile client to burn server cycles.
+# A legitimate request body here is a handful of short JSON fields, so
+# anything bigger than this is garbage — reject it before Werkzeug buffers
+# and parses the whole thing.
+_MAX_JSON_BODY_BYTES = 4096
+
+
+def _bounded_json():
+    """Parse the request body with size and content-type gates up front.
+
+    Returns ``(data, None)`` on success or ``(None, (response, status))``
+    when the request should be rejected. Oversize bodies and non-JSON
+    content types are refused before ``get_json`` reads the body, so a
+    misbehaving client cannot force a full buffer-and-parse just to get a
+    400 back.
+    """
+    if request.content_length is not None and request.content_length > _MAX_JSON_BODY_BYTES:
+        return None, (jsonify({"error": "Request body too large"}), 413)
+    if not request.is_json:
+        return None, (jsonify({"error": "JSON body required"}), 415)
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data:
+        return None, (jsonify({"error": "Request body required"}), 400)
+    return data, None
+
 
 # =============================================================================
 # Recovery Endpoints
@@ -81,42 +109,47 @@ def recover_with_backup_code():
     if not data:
         return jsonify({"error": "Request body required"}), 400
 
-    username = data.get("username", "").strip()
-    backup_code = data.get("backup_code", "").strip()
+    username = _required_str(data, "username")
+    backup_code = _required_str(data, "backup_code")
 
-    if not username or not backup_code:
+    if username is None or backup_code is None:
         return jsonify({"error": "Username and backup_code are required"}), 400
 
     db = get_auth_db()
-    user_repo = UserRepository(db)
-    backup_repo = BackupCodeRepository(db)
+    user_repo = _cached_repo(db, UserRepository)
+    backup_repo = _cached_repo(db, BackupCodeRepository)
 
     # Find user (don't reveal if user exists)
     user = user_repo.get_by_username(username)
     if user is None:
         return jsonify({"error": "Invalid username or backup code"}), 401
 
-    # Verify and consume backup code
-    if not backup_repo.verify_and_consume(user.ensured_id, backup_code):
-        return jsonify({"error": "Invalid username or backup code"}), 401
+    # Generate the replacement TOTP secret before taking the write lock —
+    # pure CPU work that doesn't belong inside the transaction.
+    secret, base32_secret, uri = setup_totp(user.username)
 
-    # Check remaining codes before we replace them
-    remaining = backup_repo.get_remaining_count(user.ensured_id)
+    # One transaction for the whole rotation: consume the code, swap the
+    # credential, reissue backup codes, and invalidate sessions atomically.
+    # A failure at any step rolls back, leaving the backup code unconsumed.
+    with db.transaction():
+        # Verify and consume backup code
+        if not backup_repo.verify_and_consume(user.ensured_id, backup_code):
+            return jsonify({"error": "Invalid username or backup code"}), 401
 
-    # Generate new TOTP secret
-    secret, base32_secret, uri = setup_totp(user.username)
+        # Check remaining codes before we replace them
+        remaining = backup_repo.get_remaining_count(user.ensured_id)
 
-    # Update user's auth credential
-    user.auth_credential = secret
-    user.auth_type = AuthType.TOTP
-    user.save(db)
+        # Update user's auth credential
+        user.auth_credential = secret
+        user.auth_type = AuthType.TOTP
+        user.save(db)
 
-    # Generate new backup codes (replaces old unused codes)
-    new_backup_codes = backup_repo.create_codes_for_user(user.ensured_id)
+        # Generate new backup codes (replaces old unused codes)
+        new_backup_codes = backup_repo.create_codes_for_user(user.ensured_id)
 
-    # Invalidate any existing sessions (force re-login with new TOTP)
-    session_repo = SessionRepository(db)
-    session_repo.invalidate_user_sessions(user.ensured_id)
+        # Invalidate any existing sessions (force re-login with new TOTP)
+        session_repo = _cached_repo(db, SessionRepository)
+        session_repo.invalidate_user_sessions(user.ensured_id)
 
     return jsonify(
         {
@@ -155,7 +188,7 @@ def get_remaining_backup_codes():
     """
     user = require_current_user()
     db = get_auth_db()
-    backup_repo = BackupCodeRepository(db)
+    backup_repo = _cached_repo(db, BackupCodeRepository)
 
     return jsonify({"remaining": backup_repo.get_remaining_count(user.ensured_id)})
 
@@ -178,7 +211,7 @@ def regenerate_backup_codes():
     """
     user = require_current_user()
     db = get_auth_db()
-    backup_repo = BackupCodeRepository(db)
+    backup_repo = _cached_repo(db, BackupCodeRepository)
 
     # Generate new codes (this deletes old unused codes)
     new_codes = backup_repo.create_codes_for_user(user.ensured_id)
@@ -252,8 +285,38 @@ def update_recovery_contact():
 # Magic Link Login & Recovery
 # =============================================================================
 
+# The anti-enumeration paths answer the same body for every outcome —
+# unknown user, no recovery email, email sent, email failed — and they are
+# exactly the paths an abuser hammers. Serialize each body once at import
+# instead of re-running jsonify per request; the error paths stay on
+# jsonify since they vary and are cold.
+_MAGIC_LINK_LOGIN_OK = json.dumps(
+    {
+        "success": True,
+        "message": (
+            "If an account exists with that identifier, "
+            "a sign-in link has been sent. Please check your email."
+        ),
+    }
+).encode()
+_MAGIC_LINK_REQUEST_OK = json.dumps(
+    {
+        "success": True,
+        "message": (
+            "If an account exists with that username and has a registered email, "
+            "a login link has been sent. Please check your email."
+        ),
+    }
+).encode()
+
+
+def _generic_ok(body: bytes) -> Response:
+    """Wrap a prebuilt anti-enumeration body in a fresh 200 response."""
+    return Response(body, mimetype="application/json")
+
 
 @auth_bp.route("/magic-link/login", methods=["POST"])
+@request_rate_limited("magic-link-send", max_requests=5, window_seconds=3600, require_username=True)
 def magic_link_login():
     """
     Primary magic link login endpoint.
@@ -268,21 +331,16 @@ def magic_link_login():
     Returns:
         200: {"success": true, "message": "..."}
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Request body required"}), 400
+    data, reject = _bounded_json()
+    if reject is not None:
+        return reject
 
-    identifier = data.get("identifier", "").strip()
-    if not identifier:
+    identifier = _required_str(data, "identifier")
+    if identifier is None:
         return jsonify({"error": "Username or email is required"}), 400
 
     db = get_auth_db()
-    user_repo = UserRepository(db)
-
-    generic_message = (
-        "If an account exists with that identifier, "
-        "a sign-in link has been sent. Please check your email."
-    )
+    user_repo = _cached_repo(db, UserRepository)
 
     # Look up by username or email
     user = user_repo.get_by_username(identifier)
@@ -290,24 +348,23 @@ def magic_link_login():
         user = user_repo.get_by_email(identifier)
 
     if user is None:
-        return jsonify({"success": True, "message": generic_message})
+        return _generic_ok(_MAGIC_LINK_LOGIN_OK)
 
     # Magic link users always get a link; others need recovery_email
     if user.auth_type != AuthType.MAGIC_LINK:
         if not user.recovery_enabled or not user.recovery_email:
-            return jsonify({"success": True, "message": generic_message})
+            return _generic_ok(_MAGIC_LINK_LOGIN_OK)
 
     email = user.recovery_email
     if not email:
-        return jsonify({"success": True, "message": generic_message})
+        return _generic_ok(_MAGIC_LINK_LOGIN_OK)
 
     # Create recovery token (reuse PendingRecovery infrastructure)
-    recovery_repo = PendingRecoveryRepository(db)
-    recovery_repo.delete_for_user(user.ensured_id)
+    recovery_repo = _cached_repo(db, PendingRecoveryRepository)
 
     remember_me = data.get("remember_me", True)
 
-    _, raw_token = PendingRecovery.create(db, user.ensured_id, expiry_minutes=15)
+    _, raw_token = recovery_repo.replace_for_user(user.ensured_id, expiry_minutes=15)
 
     r_flag = "1" if remember_me else "0"
     magic_link_url = f"/verify.html?token={raw_token}&r={r_flag}"
@@ -316,10 +373,11 @@ def magic_link_login():
         to_email=email, username=user.username, magic_link=magic_link_url, expires_minutes=15
     )
 
-    return jsonify({"success": True, "message": generic_message})
+    return _generic_ok(_MAGIC_LINK_LOGIN_OK)
 
 
 @auth_bp.route("/magic-link", methods=["POST"])
+@request_rate_limited("magic-link-send", max_requests=5, window_seconds=3600, require_username=True)
 def request_magic_link():
     """
     Request a magic link for login recovery.
@@ -340,37 +398,29 @@ def request_magic_link():
     even if the username doesn't exist or has no recovery email. The message
     is intentionally vague.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Request body required"}), 400
+    data, reject = _bounded_json()
+    if reject is not None:
+        return reject
 
-    username = data.get("username", "").strip()
-    if not username:
+    username = _required_str(data, "username")
+    if username is None:
         return jsonify({"error": "Username is required"}), 400
 
     db = get_auth_db()
-    user_repo = UserRepository(db)
-
-    # Generic message to prevent username enumeration
-    generic_message = (
-        "If an account exists with that username and has a registered email, "
-        "a login link has been sent. Please check your email."
-    )
+    user_repo = _cached_repo(db, UserRepository)
 
     user = user_repo.get_by_username(username)
     if user is None:
         # User doesn't exist, but don't reveal this
-        return jsonify({"success": True, "message": generic_message})
+        return _generic_ok(_MAGIC_LINK_REQUEST_OK)
 
     if not user.recovery_enabled or not user.recovery_email:
         # User exists but has no recovery email
-        return jsonify({"success": True, "message": generic_message})
-
-    # Create recovery token
-    recovery_repo = PendingRecoveryRepository(db)
-    recovery_repo.delete_for_user(user.ensured_id)  # Remove any existing tokens
+        return _generic_ok(_MAGIC_LINK_REQUEST_OK)
 
-    _, raw_token = PendingRecovery.create(db, user.ensured_id, expiry_minutes=15)
+    # Create recovery token, replacing any existing ones atomically
+    recovery_repo = _cached_repo(db, PendingRecoveryRepository)
+    _, raw_token = recovery_repo.replace_for_user(user.ensured_id, expiry_minutes=15)
 
     # Send email with magic link
     magic_link_url = f"/verify.html?token={raw_token}"
@@ -383,16 +433,15 @@ def request_magic_link():
         expires_minutes=15,
     )
 
-    if email_sent:
-        return jsonify({"success": True, "message": generic_message})
-    else:
+    if not email_sent:
         # Email failed, but still return success for privacy
         # Log the error internally
         current_app.logger.error(f"Failed to send magic link email to user {user.id}")
-        return jsonify({"success": True, "message": generic_message})
+    return _generic_ok(_MAGIC_LINK_REQUEST_OK)
 
 
 @auth_bp.route("/magic-link/verify", methods=["POST"])
+@request_rate_limited("magic-link-verify", max_requests=20, window_seconds=60)
 def verify_magic_link():
     """
     Verify a magic link token and create a session.
@@ -411,60 +460,65 @@ def verify_magic_link():
         200: {"success": true, "message": "...", "activation": bool}
         400: {"error": "..."}
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Request body required"}), 400
+    data, reject = _bounded_json()
+    if reject is not None:
+        return reject
 
-    token = data.get("token", "").strip()
-    if not token:
+    token = _required_str(data, "token")
+    if token is None:
         return jsonify({"error": "Token is required"}), 400
 
     is_activation = data.get("activate", False)
 
     db = get_auth_db()
-    recovery_repo = PendingRecoveryRepository(db)
-
-    # Find the recovery request
-    recovery = recovery_repo.get_by_token(token)
-    if recovery is None:
-        return jsonify({"error": "Invalid or expired token"}), 400
-
-    if recovery.is_expired():
-        return jsonify({"error": "Token has expired. Please request a new link."}), 400
-
-    if recovery.is_used():
-        return jsonify({"error": "This link has already been used"}), 400
-
-    # Get the user
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(recovery.user_id)
-    if user is None:
-        return jsonify({"error": "User not found"}), 400
-
-    # Mark recovery as used
-    recovery.mark_used(db)
-
-    # Detect first-time activation
-    first_login = is_activation and user.last_login is None
-
-    # Create a persistent session (magic link users get persistent by default)
-    user_agent = request.headers.get("User-Agent", "")
-    ip_address = request.remote_addr or ""
-
-    remember_me = data.get("remember_me", True)
-    allow_multi = _user_allows_multi_session(user, db)
-    _, raw_token = Session.create_for_user(
-        db,
-        user.ensured_id,
-        user_agent,
-        ip_address,
-        remember_me=remember_me,
-        allow_multi=allow_multi,
-    )
-
-    # Update last login
-    user.last_login = datetime.now()
-    user.save(db)
+    recovery_repo = _cached_repo(db, PendingRecoveryRepository)
+
+    # Token lookup through session creation is one transaction: every call
+    # below shares a single connection (one SQLCipher key derivation, one
+    # commit) instead of paying a round-trip each, and a token can never be
+    # consumed twice concurrently.
+    with db.transaction():
+        # Find the recovery request. All failure modes — unknown token,
+        # expired, already used, orphaned user — collapse into one generic
+        # response after evaluating every check, so neither the body nor the
+        # branch shape tells a guesser which gate it hit. "Already used" in
+        # particular would confirm a stolen link belonged to a real login.
+        recovery = recovery_repo.get_by_token(token)
+        user_repo = _cached_repo(db, UserRepository)
+        user = user_repo.get_by_id(recovery.user_id) if recovery is not None else None
+        valid = (
+            recovery is not None
+            and not recovery.is_expired()
+            and not recovery.is_used()
+            and user is not None
+        )
+        if not valid:
+            return jsonify({"error": "Invalid or expired token"}), 400
+        assert recovery is not None and user is not None  # narrowed by `valid`
+
+        # Mark recovery as used
+        recovery.mark_used(db)
+
+        # Detect first-time activation
+        first_login = is_activation and user.last_login is None
+
+        # Create a persistent session (magic link users get persistent by default)
+        user_agent = request.headers.get("User-Agent", "")
+        ip_address = request.remote_addr or ""
+
+        remember_me = data.get("remember_me", True)
+        allow_multi = _user_allows_multi_session(user, db)
+        _, raw_token = Session.create_for_user(
+            db,
+            user.ensured_id,
+            user_agent,
+            ip_address,
+            remember_me=remember_me,
+            allow_multi=allow_multi,
+        )
+
+        # Update last login — single-column UPDATE, not a full-row save()
+        user.update_last_login(db)
 
     # Set session cookie and include token for client-side persistence
     message = "Welcome to The Library!" if first_login else "Login successful"
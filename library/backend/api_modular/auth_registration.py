@@ -33,6 +33,7 @@ from .auth_shared import (
     _extract_recovery_fields,
     _format_claim_token,
     _recovery_warning,
+    _required_str,
     _user_allows_multi_session,
     _validate_username,
     _verify_webauthn_credential,
@@ -882,12 +883,12 @@ def verify_registration():
     if not data:
         return jsonify({"error": "Request body required"}), 400
 
-    token = data.get("token", "").strip()
+    token = _required_str(data, "token")
     auth_type = data.get("auth_type", "totp").strip().lower()
     include_qr = data.get("include_qr", False)
     recovery_email, recovery_phone, recovery_enabled = _extract_recovery_fields(data)
 
-    if not token:
+    if token is None:
         return jsonify({"error": "Verification token required"}), 400
     if auth_type not in ("totp",):
         return jsonify({"error": "Unsupported auth type. Use 'totp'."}), 400
@@ -34,7 +34,7 @@ import urllib.parse
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TypedDict
 
 from flask import Blueprint, Response, current_app, g, jsonify, request
 
@@ -48,7 +48,7 @@ from auth import (
     Session,
     SessionRepository,
     User,
-    UserRepository,
+    UserRepository,  # noqa: F401  (re-exported via auth.py for tests)
 )
 from auth import webauthn_verify_registration as _shared_webauthn_verify_registration
 from auth.models import SESSION_HORIZON_REMEMBER_SECONDS, SystemSettingsRepository
@@ -62,6 +62,7 @@ __all__ = [
     "NotificationRepository",
     "_pending_totp_secrets",
     "_pending_webauthn_challenges",
+    "_required_str",
     "_validate_username",
     "_validate_username_strict",
     "_validate_email_format",
@@ -71,6 +72,7 @@ __all__ = [
     "_user_dict",
     # Additionally re-exported symbols consumed by auth_* modules
     "auth_bp",
+    "_cached_repo",
     "get_auth_db",
     "init_auth_routes",
     "login_required",
@@ -86,6 +88,7 @@ __all__ = [
     "SESSION_DURATION_DEFAULT",
     "SESSION_DURATION_REMEMBER",
     "SESSION_RENEWAL_THRESHOLD",
+    "SESSION_TOUCH_DEBOUNCE_SECONDS",
     "INVITATION_EXPIRY_HOURS",
     "_setup_totp_data",
     "_setup_passkey_data",
@@ -111,6 +114,25 @@ _session_cookie_secure = True  # Always use secure cookies
 _session_cookie_httponly = True
 _session_cookie_samesite = "Lax"
 
+# Prebuilt kwargs for response.set_cookie — built once instead of per
+# response. max_age stays a per-call argument (it depends on remember_me).
+# init_auth_routes mutates "secure" in place for dev mode.
+
+
+class _CookieKwargs(TypedDict):
+    httponly: bool
+    secure: bool
+    samesite: str
+    path: str
+
+
+_cookie_kwargs: _CookieKwargs = {
+    "httponly": _session_cookie_httponly,
+    "secure": _session_cookie_secure,
+    "samesite": _session_cookie_samesite,
+    "path": "/",
+}
+
 # Invitation claim tokens expire after this many hours
 INVITATION_EXPIRY_HOURS = 48
 
@@ -143,6 +165,13 @@ SESSION_DURATION_REMEMBER = SESSION_HORIZON_REMEMBER_SECONDS  # 400 days (browse
 # (one DB write + one Set-Cookie header) is rare rather than per-request.
 SESSION_RENEWAL_THRESHOLD = SESSION_DURATION_REMEMBER // 2  # seconds remaining
 
+# Skip the last_seen UPDATE when the session was already touched this
+# recently. last_seen only feeds is_stale() (120-minute grace), so minute
+# granularity is more than enough — and high-frequency polling endpoints
+# (/auth/check every few seconds per tab) otherwise turn every poll into
+# a SQLCipher write.
+SESSION_TOUCH_DEBOUNCE_SECONDS = 60
+
 
 # =============================================================================
 # DB init / accessor
@@ -198,6 +227,7 @@ def init_auth_routes(auth_db_path: Path, auth_key_path: Path, is_dev: bool = Fal
     # In dev mode, allow non-secure cookies for localhost
     if is_dev:
         _session_cookie_secure = False
+        _cookie_kwargs["secure"] = False
 
     # Log WebAuthn configuration at startup. Resolved through sys.modules to
     # avoid a cyclic-import edge: auth_webauthn imports this module, so a
@@ -251,13 +281,20 @@ def get_auth_db() -> AuthDatabase:
 # =============================================================================
 
 
+# Printable ASCII (0x20-0x7e) minus the HTML/escape hazards < > \.
+# Precompiled so the per-character Python-level ord() scan this replaces
+# becomes a single C-level match; the length and whitespace checks stay
+# separate because each has its own user-facing error message.
+_USERNAME_CHARS_RE = re.compile(r"[ -;=?-\[\]-~]+\Z")
+
+
 def _validate_username(username: str) -> tuple[dict, int] | None:
     """Validate username format. Returns (error_dict, status) or None if valid."""
     if not username or len(username) < 3:
         return {"error": "Username must be at least 3 characters"}, 400
     if len(username) > 24:
         return {"error": "Username must be at most 24 characters"}, 400
-    if not all(32 <= ord(c) <= 126 and c not in "<>\\" for c in username):
+    if not _USERNAME_CHARS_RE.match(username):
         return {"error": "Username contains invalid characters"}, 400
     if username != username.strip():
         return {"error": "Username cannot have leading or trailing spaces"}, 400
@@ -279,6 +316,23 @@ def _validate_username_strict(username: str) -> tuple[dict, int] | None:
     return None
 
 
+def _required_str(data: dict, key: str, min_len: int = 1, max_len: int = 256) -> str | None:
+    """Read a required string field from a parsed JSON body in one pass.
+
+    Replaces the ``data.get(key, "").strip()`` plus emptiness-check
+    boilerplate: returns the stripped value when it is a str whose length
+    lands in [min_len, max_len], else None. Non-string payloads (ints,
+    lists) yield None instead of raising AttributeError.
+    """
+    value = data.get(key)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if min_len <= len(value) <= max_len:
+        return value
+    return None
+
+
 def _validate_email_format(email: str) -> tuple[dict, int] | None:
     """Validate email format. Returns (error_dict, status) or None if valid."""
     import re as _re
@@ -482,6 +536,29 @@ def _verify_webauthn_credential(data, origin, rp_id):
     return webauthn_cred, challenge, None
 
 
+# =============================================================================
+# Repository accessors
+# =============================================================================
+
+# Repository objects are stateless wrappers around an AuthDatabase handle
+# (verified: each __init__ stores only ``self.db``), so one instance per
+# (repository class, db handle) pair can serve every request instead of the
+# hot auth path allocating fresh wrappers per call. The cache hangs off the
+# db handle itself rather than this module: test fixtures rebind ``_auth_db``
+# per Flask app, and a per-handle cache follows the rebind automatically —
+# a module-level singleton would leak a stale handle across apps.
+
+
+def _cached_repo(db: AuthDatabase, repo_cls: type):
+    """Return the per-db singleton instance of ``repo_cls``."""
+    cache = db.__dict__.setdefault("_repo_cache", {})
+    repo = cache.get(repo_cls)
+    if repo is None:
+        repo = repo_cls(db)
+        cache[repo_cls] = repo
+    return repo
+
+
 # =============================================================================
 # Session Middleware
 # =============================================================================
@@ -506,11 +583,12 @@ def get_current_user() -> Optional[User]:
         return None
 
     db = get_auth_db()
-    session_repo = SessionRepository(db)
-    user_repo = UserRepository(db)
+    session_repo = _cached_repo(db, SessionRepository)
 
-    # Look up session
-    session = session_repo.get_by_token(token)
+    # Look up session + user in one JOIN — with SQLCipher the per-query page
+    # decryption dominates, so collapsing the two SELECTs roughly halves the
+    # lookup cost on every authenticated request.
+    session, user = session_repo.get_session_and_user(token)
     if session is None:
         return None
 
@@ -529,14 +607,21 @@ def get_current_user() -> Optional[User]:
         session.invalidate(db)
         return None
 
-    # Get user
-    user = user_repo.get_by_id(session.user_id)
+    # User row deleted while the session row survived — clean it up
     if user is None:
         session.invalidate(db)
         return None
 
-    # Update last seen
-    session.touch(db)
+    # Update last seen — debounced. Stacked decorators already share one
+    # lookup via the g._current_user memo above; this additionally spares
+    # the UPDATE itself when the row was touched within the last minute
+    # (e.g. /auth/check polling), leaving last_seen at most a minute stale,
+    # which is invisible next to the 120-minute is_stale() grace.
+    if (
+        session.last_seen is None
+        or (datetime.now() - session.last_seen).total_seconds() >= SESSION_TOUCH_DEBOUNCE_SECONDS
+    ):
+        session.touch(db)
 
     g._current_user = user
     g._current_session = session
@@ -676,6 +761,21 @@ def effective_client_address() -> str:
     return remote_addr
 
 
+def _auth_enabled() -> bool:
+    """AUTH_ENABLED for the current request, memoized on ``g``.
+
+    The flag is fixed per deployment but read through Flask's app-context
+    proxy; stacked decorators on one route each re-resolved it. One
+    lookup per request keeps test fixtures free to flip the config per
+    app while the request path pays the proxy traversal only once.
+    """
+    enabled = g.get("_auth_enabled")
+    if enabled is None:
+        enabled = bool(current_app.config.get("AUTH_ENABLED", False))
+        g._auth_enabled = enabled
+    return enabled
+
+
 def _client_is_localhost() -> bool:
     """True when the effective client address is the local machine."""
     return is_loopback_address(effective_client_address())
@@ -711,7 +811,7 @@ def auth_if_enabled(f: Callable) -> Callable:
 
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        if not current_app.config.get("AUTH_ENABLED", False):
+        if not _auth_enabled():
             # Auth disabled - allow through
             return f(*args, **kwargs)
         # Auth enabled - require login
@@ -733,7 +833,7 @@ def download_permission_required(f: Callable) -> Callable:
 
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        if not current_app.config.get("AUTH_ENABLED", False):
+        if not _auth_enabled():
             # Auth disabled - allow through
             return f(*args, **kwargs)
         # Auth enabled - require login + download permission
@@ -757,7 +857,7 @@ def admin_if_enabled(f: Callable) -> Callable:
 
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        if not current_app.config.get("AUTH_ENABLED", False):
+        if not _auth_enabled():
             # Auth disabled - allow through (single-user mode = admin)
             return f(*args, **kwargs)
         # Auth enabled - require admin
@@ -783,7 +883,7 @@ def guest_allowed(f: Callable) -> Callable:
 
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        if not current_app.config.get("AUTH_ENABLED", False):
+        if not _auth_enabled():
             # Auth disabled — allow through (single-user mode)
             return f(*args, **kwargs)
         # Auth enabled — try to populate user, but allow guest access
@@ -806,7 +906,7 @@ def admin_or_localhost(f: Callable) -> Callable:
 
     @wraps(f)
     def decorated(*args: Any, **kwargs: Any) -> Any:
-        if current_app.config.get("AUTH_ENABLED", False):
+        if _auth_enabled():
             # Remote mode: require authenticated admin
             user = get_current_user()
             if user is None:
@@ -840,15 +940,7 @@ def set_session_cookie(response: Response, token: str, remember_me: bool = False
     if not isinstance(token, str) or not _SAFE_SESSION_TOKEN_RE.match(token):
         raise ValueError("invalid session token format")
     max_age = SESSION_DURATION_REMEMBER if remember_me else SESSION_DURATION_DEFAULT
-    response.set_cookie(
-        _session_cookie_name,
-        token,
-        httponly=_session_cookie_httponly,
-        secure=_session_cookie_secure,
-        samesite=_session_cookie_samesite,
-        max_age=max_age,
-        path="/",
-    )
+    response.set_cookie(_session_cookie_name, token, max_age=max_age, **_cookie_kwargs)
     return response
 
 
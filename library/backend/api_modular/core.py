@@ -2,13 +2,20 @@
 Core API utilities - Database connection, CORS, and shared helpers.
 """
 
+import json
 import os
+import queue
 import sqlite3
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
 from flask import Response
 
+try:  # Optional accelerator — hot endpoints fall back to stdlib json without it
+    import orjson
+except ImportError:  # pragma: no cover - exercised only on minimal installs
+    orjson = None  # type: ignore[assignment]
+
 # Type alias for Flask route return types
 FlaskResponse = Union[Response, tuple[Response, int], tuple[str, int]]
 
@@ -18,6 +25,15 @@ FlaskResponse = Union[Response, tuple[Response, int], tuple[str, int]]
 CORS_ORIGIN = os.environ.get("CORS_ORIGIN", "*")
 
 
+def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply the standard per-connection PRAGMA setup."""
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-8000")  # 8MB cache (negative = KiB)
+    conn.execute("PRAGMA busy_timeout=5000")  # Wait 5s on lock instead of failing
+
+
 def get_db(db_path: Path) -> sqlite3.Connection:
     """Get database connection with Row factory and WAL mode.
 
@@ -26,14 +42,113 @@ def get_db(db_path: Path) -> sqlite3.Connection:
     """
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys=ON")
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA cache_size=-8000")  # 8MB cache (negative = KiB)
-    conn.execute("PRAGMA busy_timeout=5000")  # Wait 5s on lock instead of failing
+    _apply_connection_pragmas(conn)
     return conn
 
 
+class PooledConnection:
+    """Proxy that returns its connection to the pool on ``close()``.
+
+    Call sites keep the ``conn = acquire(); ...; conn.close()`` shape used
+    with real connections everywhere else, so a route can switch to the
+    pool without restructuring its error paths.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, pool: "ConnectionPool"):
+        # None once closed, so a double close() can't release twice
+        self._conn: Optional[sqlite3.Connection] = conn
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool._release(conn)
+
+
+class ConnectionPool:
+    """Reuse SQLite connections across requests for hot endpoints.
+
+    Opening per request pays connect() syscalls plus the PRAGMA setup in
+    ``get_db`` every time, and every connection starts with a cold page
+    cache. The pool keeps up to ``max_size`` configured connections idle
+    and hands them back out, so repeat requests hit a warm cache.
+    ``_release`` rolls back any uncommitted transaction before a
+    connection is reused, so state never leaks between requests.
+    Connections are created with ``check_same_thread=False`` because the
+    gevent worker services requests from multiple greenlets.
+    """
+
+    def __init__(self, db_path: Path, max_size: int = 4):
+        self.db_path = db_path
+        self._idle: queue.Queue = queue.Queue(maxsize=max_size)
+
+    def acquire(self) -> PooledConnection:
+        """Get an idle connection, or open a fresh one if none is cached."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            # cached_statements above the default: pooled connections live
+            # across requests, so sqlite3's per-connection statement cache
+            # actually gets repeat hits — sized to hold every field-subset
+            # variant the CRUD update/delete paths generate
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            _apply_connection_pragmas(conn)
+        return PooledConnection(conn, self)
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.rollback()
+            self._idle.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):  # fmt: skip
+            # Broken or surplus connection — close for real instead of caching
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def close_all(self) -> None:
+        """Close every idle connection (re-init / tests)."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except (queue.Empty, sqlite3.Error):  # fmt: skip
+                return
+
+
+def ojson(obj: Any, status: int = 200) -> Response:
+    """Serialize ``obj`` to a JSON response, using orjson when available.
+
+    Drop-in for ``jsonify`` on hot endpoints: orjson encodes 2-5x faster
+    than stdlib json and emits UTF-8 directly instead of ASCII-escaping
+    every non-Latin character (title/author strings are routinely CJK
+    here, so the payload shrinks too). Callers keep their explicit
+    ``.isoformat()`` conversions so the stdlib fallback produces an
+    identical body byte-for-byte semantics-wise.
+    """
+    if orjson is not None:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return Response(body, status=status, mimetype="application/json")
+
+
+def clamp_int(args, name: str, default: int, lo: int, hi: int) -> int:
+    """Parse an integer query arg once and clamp it to ``[lo, hi]``.
+
+    Uses werkzeug's ``type=int`` conversion, which yields None for a
+    malformed value instead of raising — so ``?page=abc`` falls back to
+    the default rather than surfacing a 500 from a bare ``int()`` call.
+    """
+    value = args.get(name, default=default, type=int)
+    if value is None:
+        value = default
+    return max(lo, min(hi, value))
+
+
 def add_cors_headers(response: Response) -> Response:
     """
     Add CORS headers to all responses.
@@ -57,6 +57,7 @@ from __future__ import annotations
 import html
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -182,20 +183,32 @@ def _wrap_html(heading: str, inner: str) -> str:
 # attaching to an email message.
 
 
-def _render_magic_link(locale: str, v: Dict[str, Any]) -> Tuple[str, str, str]:
-    subject = _format_plain(_t("email.magic_link.subject", locale), v)
-    text = _format_plain(_t("email.magic_link.text", locale), v)
+@lru_cache(maxsize=len(SUPPORTED_LOCALES))
+def _compiled_magic_link(locale: str) -> Tuple[str, str, str]:
+    """Merge the magic-link scaffold with its catalog slots, once per locale.
 
-    greeting = _format_html(_t("email.common.greeting", locale), v)
-    intro = _format_html(_t("email.magic_link.intro", locale), v)
-    button_label = _format_html(_t("email.magic_link.button", locale), v)
-    expiry_note = _format_html(_t("email.magic_link.expiry", locale), v)
-    fallback = _format_html(_t("email.magic_link.fallback", locale), v)
+    The magic link is the one template rendered on a request hot path (every
+    recovery send), so its catalog lookups and markup assembly are hoisted
+    here and memoized. The returned strings still carry the ``{username}``
+    / ``{link}`` / ``{expires_minutes}`` placeholders from the catalog; the
+    per-send work in :func:`_render_magic_link` collapses to a single
+    ``format_map`` pass each for subject, text, and HTML — with the HTML
+    pass escaping user values exactly as before. Catalog-mutating tests must
+    call ``_compiled_magic_link.cache_clear()``.
+    """
+    subject = _t("email.magic_link.subject", locale)
+    text = _t("email.magic_link.text", locale)
+
+    greeting = _t("email.common.greeting", locale)
+    intro = _t("email.magic_link.intro", locale)
+    button_label = _t("email.magic_link.button", locale)
+    expiry_note = _t("email.magic_link.expiry", locale)
+    fallback = _t("email.magic_link.fallback", locale)
+    heading = _t("email.common.heading", locale)
 
-    safe_link = html.escape(str(v.get("link", "")), quote=True)
     button_html = (
         f'<div style="text-align: center; margin: 30px 0;">'
-        f'<a href="{safe_link}"'
+        f'<a href="{{link}}"'
         f' style="background: linear-gradient(to bottom, #ffd700, #daa520, #8b7355);'
         f" color: #1a1a1a; padding: 18px 40px; text-decoration: none;"
         f' font-weight: bold; font-size: 1.1em; letter-spacing: 2px;">'
@@ -209,11 +222,22 @@ def _render_magic_link(locale: str, v: Dict[str, Any]) -> Tuple[str, str, str]:
         f'    <p style="line-height: 1.8;">{expiry_note}</p>\n'
         f'    <p style="color: #888; font-size: 0.9em; text-align: center;">'
         f"{fallback}<br>"
-        f'<a href="{safe_link}" style="color: #daa520; word-break: break-all;">'
-        f"{safe_link}</a></p>\n"
+        f'<a href="{{link}}" style="color: #daa520; word-break: break-all;">'
+        f"{{link}}</a></p>\n"
+    )
+    # Plain .replace(), not .format(): inner/heading still contain the
+    # per-send placeholders, which .format() would try to resolve now.
+    html_tmpl = _BASE_HTML.replace("{heading}", heading).replace("{inner}", inner)
+    return subject, text, html_tmpl
+
+
+def _render_magic_link(locale: str, v: Dict[str, Any]) -> Tuple[str, str, str]:
+    subject_tmpl, text_tmpl, html_tmpl = _compiled_magic_link(locale)
+    return (
+        _format_plain(subject_tmpl, v),
+        _format_plain(text_tmpl, v),
+        _format_html(html_tmpl, v),
     )
-    heading = _format_html(_t("email.common.heading", locale), v)
-    return subject, text, _wrap_html(heading, inner)
 
 
 def _render_approval(locale: str, v: Dict[str, Any]) -> Tuple[str, str, str]:
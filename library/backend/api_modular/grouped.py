@@ -105,35 +105,111 @@ def get_grouped_audiobooks() -> FlaskResponse:
         conn.close()
 
 
+# Book columns for grouped responses, in SELECT order. The SELECT string is
+# derived from this tuple so the keys and the column list cannot drift.
+_BOOK_KEYS = (
+    "id",
+    "title",
+    "author",
+    "narrator",
+    "publisher",
+    "series",
+    "series_sequence",
+    "duration_hours",
+    "duration_formatted",
+    "file_size_mb",
+    "cover_path",
+    "format",
+    "published_date",
+    "published_year",
+    "release_date",
+)
+_BOOK_COLUMNS = ", ".join(f"a.{key}" for key in _BOOK_KEYS)
+
+
 def _get_book_columns() -> str:
     """Return the SELECT columns for books in grouped responses."""
-    return (
-        "a.id, a.title, a.author, a.narrator, a.publisher, a.series, "
-        "a.series_sequence, a.duration_hours, a.duration_formatted, "
-        "a.file_size_mb, a.cover_path, a.format, "
-        "a.published_date, a.published_year, a.release_date"
-    )
+    return _BOOK_COLUMNS
 
 
 def _row_to_book(row: sqlite3.Row) -> dict:
-    """Convert a database row to a book dict for the grouped response."""
-    return {
-        "id": row["id"],
-        "title": row["title"],
-        "author": row["author"],
-        "narrator": row["narrator"],
-        "publisher": row["publisher"],
-        "series": row["series"],
-        "series_sequence": row["series_sequence"],
-        "duration_hours": row["duration_hours"],
-        "duration_formatted": row["duration_formatted"],
-        "file_size_mb": row["file_size_mb"],
-        "cover_path": row["cover_path"],
-        "format": row["format"],
-        "published_date": row["published_date"],
-        "published_year": row["published_year"],
-        "release_date": row["release_date"],
-    }
+    """Convert a database row to a book dict for the grouped response.
+
+    ``dict(zip(...))`` pairs the leading columns positionally at C level —
+    one call instead of fifteen per-key Row lookups per row. Trailing
+    group_id/group_name columns fall off the end of the shorter keys tuple.
+    """
+    return dict(zip(_BOOK_KEYS, row))
+
+
+# ── Precomputed grouping SQL ──────────────────────────────────────────────
+#
+# The grouped queries vary only on a tiny finite cross-product —
+# (author|narrator) × (pinyin sort on|off) — and every fragment is a
+# module-level constant. Build all eight statements once at import so each
+# request is a dict lookup and SQLite re-sees byte-identical SQL (keeping
+# its prepared-statement cache warm) instead of re-parsing a freshly
+# concatenated string.
+_PINYIN_JOIN = " LEFT JOIN audiobook_translations at ON at.audiobook_id = a.id AND at.locale = ?"
+_PINYIN_TITLE_SORT = "COALESCE(NULLIF(at.pinyin_sort, ''), a.title) COLLATE NOCASE"
+_PLAIN_TITLE_SORT = "a.title COLLATE NOCASE"
+
+# group_by -> (entity join SQL, entity alias, junction table for orphan check)
+_GROUP_JOINS = {
+    "author": (
+        " JOIN book_authors ba ON a.id = ba.book_id JOIN authors auth ON ba.author_id = auth.id",
+        "auth",
+        "book_authors",
+    ),
+    "narrator": (
+        " JOIN book_narrators bn ON a.id = bn.book_id"
+        " JOIN narrators narr ON bn.narrator_id = narr.id",
+        "narr",
+        "book_narrators",
+    ),
+}
+
+
+def _build_group_sql(
+    entity_join: str, alias: str, orphan_junction: str, use_pinyin: bool
+) -> tuple[str, str]:
+    """Return (main_sql, orphan_sql) for one grouping × pinyin variant.
+
+    All interpolated fragments are module-level constants, not user input.
+    """
+    title_sort = _PINYIN_TITLE_SORT if use_pinyin else _PLAIN_TITLE_SORT
+    join_clause = _PINYIN_JOIN if use_pinyin else ""
+    # Publication date sort: prefer published_date (YYYY-MM-DD), fall back to
+    # published_year, then release_date, then title. NULLS LAST via COALESCE.
+    main = (
+        f"SELECT {_BOOK_COLUMNS}, {alias}.id AS group_id, {alias}.name AS group_name,"  # nosec B608  # noqa: S608
+        f" {alias}.sort_name AS group_sort_name"
+        " FROM audiobooks a"
+        f"{entity_join}"
+        f"{join_clause}"
+        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
+        f" ORDER BY {alias}.sort_name COLLATE NOCASE,"
+        " COALESCE(a.published_date, a.release_date,"
+        " CAST(a.published_year AS TEXT) || '-01-01',"
+        " '9999-12-31') ASC,"
+        f" {title_sort}"
+    )
+    orphan = (
+        f"SELECT {_BOOK_COLUMNS}"  # nosec B608  # noqa: S608
+        " FROM audiobooks a"
+        f"{join_clause}"
+        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
+        f" AND a.id NOT IN (SELECT book_id FROM {orphan_junction})"
+        f" ORDER BY {title_sort}"
+    )
+    return main, orphan
+
+
+_GROUP_SQL = {
+    (group_by, use_pinyin): _build_group_sql(entity_join, alias, orphan_junction, use_pinyin)
+    for group_by, (entity_join, alias, orphan_junction) in _GROUP_JOINS.items()
+    for use_pinyin in (False, True)
+}
 
 
 def _group_by_author(
@@ -147,46 +223,18 @@ def _group_by_author(
     ordered grid. English queries are unchanged.
     """
     cursor = conn.cursor()
-    book_cols = _get_book_columns()
+    main_sql, orphan_sql = _GROUP_SQL[("author", use_pinyin)]
+    sort_params: list = [locale] if use_pinyin else []
 
-    # Fetch all books with their authors, sorted by author sort_name then publication date
-    # Publication date sort: prefer published_date (YYYY-MM-DD), fall back to
-    # published_year, then release_date, then title. NULLS LAST via COALESCE.
-    # AUDIOBOOK_FILTER and book_cols are hardcoded constants, not user input
-    if use_pinyin:
-        title_sort_expr = "COALESCE(NULLIF(at.pinyin_sort, ''), a.title) COLLATE NOCASE"
-        join_clause = (
-            " LEFT JOIN audiobook_translations at ON at.audiobook_id = a.id AND at.locale = ?"
-        )
-        sort_params: list = [locale]
-    else:
-        title_sort_expr = "a.title COLLATE NOCASE"
-        join_clause = ""
-        sort_params = []
-
-    query = (
-        f"SELECT {book_cols}, auth.id AS group_id, auth.name AS group_name,"  # nosec B608  # noqa: S608
-        " auth.sort_name AS group_sort_name"
-        " FROM audiobooks a"
-        " JOIN book_authors ba ON a.id = ba.book_id"
-        " JOIN authors auth ON ba.author_id = auth.id"
-        f"{join_clause}"
-        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
-        " ORDER BY auth.sort_name COLLATE NOCASE,"
-        " COALESCE(a.published_date, a.release_date,"
-        " CAST(a.published_year AS TEXT) || '-01-01',"
-        " '9999-12-31') ASC,"
-        f" {title_sort_expr}"
-    )
-    cursor.execute(query, sort_params + [TRANSLATED_PATH_PATTERN])
-    rows = cursor.fetchall()
+    cursor.execute(main_sql, sort_params + [TRANSLATED_PATH_PATTERN])
 
-    # Build groups preserving query order
+    # Build groups preserving query order, iterating the cursor directly
+    # so the full Row list is never materialized
     groups: list[dict] = []
     group_map: dict[int, dict] = {}
     all_book_ids: set[int] = set()
 
-    for row in rows:
+    for row in cursor:
         gid = row["group_id"]
         all_book_ids.add(row["id"])
 
@@ -201,24 +249,11 @@ def _group_by_author(
         group_map[gid]["books"].append(_row_to_book(row))
 
     # Find orphan books (no junction rows) — "Unknown Author" group
-    # AUDIOBOOK_FILTER is a hardcoded constant
-    query = (
-        f"SELECT {book_cols}"  # nosec B608  # noqa: S608
-        " FROM audiobooks a"
-        f"{join_clause}"
-        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
-        " AND a.id NOT IN (SELECT book_id FROM book_authors)"
-        f" ORDER BY {title_sort_expr}"
-    )
-    cursor.execute(query, sort_params + [TRANSLATED_PATH_PATTERN])
-    orphan_rows = cursor.fetchall()
-
-    if orphan_rows:
-        orphan_books = []
-        for row in orphan_rows:
-            all_book_ids.add(row["id"])
-            orphan_books.append(_row_to_book(row))
+    cursor.execute(orphan_sql, sort_params + [TRANSLATED_PATH_PATTERN])
+    orphan_books = [_row_to_book(row) for row in cursor]
 
+    if orphan_books:
+        all_book_ids.update(book["id"] for book in orphan_books)
         groups.append(
             {
                 "key": {
@@ -241,42 +276,16 @@ def _group_by_narrator(
     See ``_group_by_author`` for the pinyin sort semantics.
     """
     cursor = conn.cursor()
-    book_cols = _get_book_columns()
+    main_sql, orphan_sql = _GROUP_SQL[("narrator", use_pinyin)]
+    sort_params: list = [locale] if use_pinyin else []
 
-    if use_pinyin:
-        title_sort_expr = "COALESCE(NULLIF(at.pinyin_sort, ''), a.title) COLLATE NOCASE"
-        join_clause = (
-            " LEFT JOIN audiobook_translations at ON at.audiobook_id = a.id AND at.locale = ?"
-        )
-        sort_params: list = [locale]
-    else:
-        title_sort_expr = "a.title COLLATE NOCASE"
-        join_clause = ""
-        sort_params = []
-
-    # AUDIOBOOK_FILTER and book_cols are hardcoded constants, not user input
-    query = (
-        f"SELECT {book_cols}, narr.id AS group_id, narr.name AS group_name,"  # nosec B608  # noqa: S608
-        " narr.sort_name AS group_sort_name"
-        " FROM audiobooks a"
-        " JOIN book_narrators bn ON a.id = bn.book_id"
-        " JOIN narrators narr ON bn.narrator_id = narr.id"
-        f"{join_clause}"
-        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
-        " ORDER BY narr.sort_name COLLATE NOCASE,"
-        " COALESCE(a.published_date, a.release_date,"
-        " CAST(a.published_year AS TEXT) || '-01-01',"
-        " '9999-12-31') ASC,"
-        f" {title_sort_expr}"
-    )
-    cursor.execute(query, sort_params + [TRANSLATED_PATH_PATTERN])
-    rows = cursor.fetchall()
+    cursor.execute(main_sql, sort_params + [TRANSLATED_PATH_PATTERN])
 
     groups: list[dict] = []
     group_map: dict[int, dict] = {}
     all_book_ids: set[int] = set()
 
-    for row in rows:
+    for row in cursor:
         gid = row["group_id"]
         all_book_ids.add(row["id"])
 
@@ -291,24 +300,11 @@ def _group_by_narrator(
         group_map[gid]["books"].append(_row_to_book(row))
 
     # Orphan books — "Unknown Narrator"
-    # AUDIOBOOK_FILTER is a hardcoded constant
-    query = (
-        f"SELECT {book_cols}"  # nosec B608  # noqa: S608
-        " FROM audiobooks a"
-        f"{join_clause}"
-        f" WHERE {AUDIOBOOK_FILTER} AND {TRANSLATED_PATH_EXCLUSION}"
-        " AND a.id NOT IN (SELECT book_id FROM book_narrators)"
-        f" ORDER BY {title_sort_expr}"
-    )
-    cursor.execute(query, sort_params + [TRANSLATED_PATH_PATTERN])
-    orphan_rows = cursor.fetchall()
-
-    if orphan_rows:
-        orphan_books = []
-        for row in orphan_rows:
-            all_book_ids.add(row["id"])
-            orphan_books.append(_row_to_book(row))
+    cursor.execute(orphan_sql, sort_params + [TRANSLATED_PATH_PATTERN])
+    orphan_books = [_row_to_book(row) for row in cursor]
 
+    if orphan_books:
+        all_book_ids.update(book["id"] for book in orphan_books)
         groups.append(
             {
                 "key": {"id": None, "name": "Unknown Narrator", "sort_name": "\uffff"},
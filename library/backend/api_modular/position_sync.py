@@ -263,11 +263,16 @@ def update_position(audiobook_id: int):
         cursor = conn.cursor()
 
         # Verify audiobook exists and get title for denormalized storage
-        cursor.execute("SELECT id, title FROM audiobooks WHERE id = ?", (audiobook_id,))
+        # (current position rides along to detect no-op saves below)
+        cursor.execute(
+            "SELECT id, title, playback_position_ms FROM audiobooks WHERE id = ?",
+            (audiobook_id,),
+        )
         book_row = cursor.fetchone()
         if not book_row:
             return jsonify({"error": "Audiobook not found"}), 404
         book_title = book_row[1]
+        current_position_ms = book_row[2]
 
         now = datetime.now().isoformat()
 
@@ -281,7 +286,7 @@ def update_position(audiobook_id: int):
                 _update_listening_history(user.id, audiobook_id, position_ms, title=book_title)
             else:
                 return jsonify({"error": "User not found"}), 401
-        else:
+        elif position_ms != current_position_ms:
             # Single-user mode: update global position
             cursor.execute(
                 """
@@ -304,6 +309,9 @@ def update_position(audiobook_id: int):
             )
 
             conn.commit()
+        # else: paused players resend the same position every auto-save tick;
+        # skipping the no-op write avoids a row rewrite, a duplicate
+        # playback_history insert, and a WAL commit per tick.
 
         return jsonify(
             {
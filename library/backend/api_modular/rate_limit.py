@@ -183,7 +183,7 @@ def _request_username() -> str:
         return "-"
     if not isinstance(data, dict):
         return "-"
-    for field in ("username", "user", "email"):
+    for field in ("username", "user", "email", "identifier"):
         value = data.get(field)
         if isinstance(value, str) and value.strip():
             return value.strip().lower()[:128]
@@ -222,6 +222,82 @@ def _status_of(result: Any) -> Optional[int]:
     return status if isinstance(status, int) else None
 
 
+class RequestWindowLimiter:
+    """Thread-safe sliding-window counter over *all* requests for a key.
+
+    The failure-based limiter above cannot protect the magic-link routes:
+    they deliberately answer 200 to everything (anti-enumeration), so
+    there is never a failure to count. Here every request spends budget,
+    which is the right model for endpoints whose cost is the request
+    itself (an SMTP send, a token-table lookup)."""
+
+    def __init__(self) -> None:
+        self._hits: dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, key: str, max_requests: int, window_seconds: int) -> Optional[int]:
+        """Spend one unit of budget. Returns None if allowed, else the
+        number of seconds until the oldest in-window request expires."""
+        now = time.monotonic()
+        with self._lock:
+            stamps = self._hits.get(key)
+            if stamps is None:
+                stamps = deque()
+                self._hits[key] = stamps
+            cutoff = now - window_seconds
+            while stamps and stamps[0] < cutoff:
+                stamps.popleft()
+            if len(stamps) >= max_requests:
+                return max(1, int(stamps[0] + window_seconds - now) + 1)
+            stamps.append(now)
+            return None
+
+    def clear(self) -> None:
+        """Drop all state. Test-support; never called by request handling."""
+        with self._lock:
+            self._hits.clear()
+
+
+_request_limiter = RequestWindowLimiter()
+
+
+def get_request_limiter() -> RequestWindowLimiter:
+    """Return the process-wide all-requests limiter."""
+    return _request_limiter
+
+
+def request_rate_limited(
+    scope: str, max_requests: int, window_seconds: int, require_username: bool = False
+) -> Callable:
+    """Cap total request volume on an endpoint, successes included.
+
+    Used where the response never reveals failure (magic-link flows) and
+    the resource being protected is the request's side effect. With
+    ``require_username=True``, requests whose body carries no username
+    bypass the limiter — those are rejected as 400 before any email is
+    sent, and counting them would let junk POSTs exhaust the shared
+    body-less bucket. The key is (address, username), same shape as the
+    failure limiter, so the cap throttles an attacker without letting
+    them lock a victim's recovery from a different address.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated(*args: Any, **kwargs: Any) -> Any:
+            if require_username and _request_username() == "-":
+                return f(*args, **kwargs)
+            key = _rate_limit_key(scope)
+            retry_after = _request_limiter.check(key, max_requests, window_seconds)
+            if retry_after is not None:
+                logger.warning("Request rate limit: refused scope=%s", scope)
+                return _too_many_requests(retry_after)
+            return f(*args, **kwargs)
+
+        return decorated
+
+    return decorator
+
+
 def auth_rate_limited(scope: str) -> Callable:
     """Throttle repeated credential failures on an auth endpoint.
 
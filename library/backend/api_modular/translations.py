@@ -245,7 +245,7 @@ def upsert_translation(book_id):
     conn = _get_db()
     try:
         # Verify the audiobook exists
-        book = conn.execute("SELECT id FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
+        book = conn.execute("SELECT 1 FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
         if not book:
             return jsonify({"error": "Audiobook not found"}), 404
 
@@ -34,6 +34,7 @@ from flask import Blueprint, jsonify, request
 
 from .audiobooks import AUDIOBOOK_FILTER
 from .auth import get_auth_db, login_required, require_current_user
+from .core import clamp_int
 
 # Per-chapter translation artifacts (e.g. ``Book.ch001.zh-Hans.opus``) live
 # under a ``translated/`` subdirectory and are stored in the audiobooks table
@@ -82,14 +83,8 @@ def get_history():
         offset: Pagination offset (default 0)
     """
     user = require_current_user()
-    try:
-        limit = max(1, min(int(request.args.get("limit", 50)), 200))
-    except (ValueError, TypeError):  # fmt: skip
-        limit = 50
-    try:
-        offset = max(0, int(request.args.get("offset", 0)))
-    except (ValueError, TypeError):  # fmt: skip
-        offset = 0
+    limit = clamp_int(request.args, "limit", 50, 1, 200)
+    offset = clamp_int(request.args, "offset", 0, 0, 2**31)
 
     auth_db = get_auth_db()
     repo = ListeningHistoryRepository(auth_db)
@@ -132,14 +127,8 @@ def get_downloads():
         offset: Pagination offset (default 0)
     """
     user = require_current_user()
-    try:
-        limit = max(1, min(int(request.args.get("limit", 50)), 200))
-    except (ValueError, TypeError):  # fmt: skip
-        limit = 50
-    try:
-        offset = max(0, int(request.args.get("offset", 0)))
-    except (ValueError, TypeError):  # fmt: skip
-        offset = 0
+    limit = clamp_int(request.args, "limit", 50, 1, 200)
+    offset = clamp_int(request.args, "offset", 0, 0, 2**31)
 
     auth_db = get_auth_db()
     repo = DownloadRepository(auth_db)
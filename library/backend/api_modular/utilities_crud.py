@@ -9,8 +9,10 @@ from pathlib import Path
 
 from flask import Blueprint, Response, jsonify, request
 
+from .audiobooks import invalidate_aggregate_cache
 from .auth import admin_if_enabled, auth_if_enabled
-from .core import FlaskResponse, get_db
+from .core import ConnectionPool, FlaskResponse
+from .core import get_db as _connect_db
 
 # Import COVER_DIR for cover file cleanup on delete
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -19,63 +21,81 @@ from config import COVER_DIR
 utilities_crud_bp = Blueprint("utilities_crud", __name__)
 logger = logging.getLogger(__name__)
 
-# Module-level db_path, set once by init_crud_routes()
+# Module-level db_path and connection pool, set once by init_crud_routes()
 _db_path: Path = Path()
+_pool = ConnectionPool(_db_path)
 
-# Fields allowed for single-audiobook update
-_UPDATE_ALLOWED_FIELDS = [
-    "title",
-    "author",
-    "narrator",
-    "publisher",
-    "series",
-    "series_sequence",
-    "published_year",
-    "asin",
-    "isbn",
-    "description",
-    "content_type",
-    "source",
-    "edition",
-    "acquired_date",
-    # Enrichment fields
-    "subtitle",
-    "language",
-    "format_type",
-    "runtime_length_min",
-    "release_date",
-    "publisher_summary",
-    "rating_overall",
-    "rating_performance",
-    "rating_story",
-    "num_ratings",
-    "num_reviews",
-    "audible_image_url",
-    "sample_url",
-    "audible_sku",
-    "is_adult_product",
-    "merchandising_summary",
-]
+
+def get_db(db_path: Path):
+    """Acquire a connection for *db_path*, pooled when it is the configured DB.
+
+    Kept as a module-level function (same name and signature as core.get_db,
+    which the routes previously imported) so tests can patch it in place.
+    """
+    if db_path == _pool.db_path:
+        return _pool.acquire()
+    return _connect_db(db_path)
+
+
+# Fields allowed for single-audiobook update (frozenset: O(1) membership on
+# every PUT, and intersecting with data.keys() skips the per-request scan)
+_UPDATE_ALLOWED_FIELDS = frozenset(
+    {
+        "title",
+        "author",
+        "narrator",
+        "publisher",
+        "series",
+        "series_sequence",
+        "published_year",
+        "asin",
+        "isbn",
+        "description",
+        "content_type",
+        "source",
+        "edition",
+        "acquired_date",
+        # Enrichment fields
+        "subtitle",
+        "language",
+        "format_type",
+        "runtime_length_min",
+        "release_date",
+        "publisher_summary",
+        "rating_overall",
+        "rating_performance",
+        "rating_story",
+        "num_ratings",
+        "num_reviews",
+        "audible_image_url",
+        "sample_url",
+        "audible_sku",
+        "is_adult_product",
+        "merchandising_summary",
+    }
+)
 
 # Fields allowed for bulk update
-_BULK_UPDATE_ALLOWED_FIELDS = [
-    "narrator",
-    "series",
-    "publisher",
-    "published_year",
-    "content_type",
-    "source",
-    "edition",
-    "acquired_date",
-    "author",
-    "asin",
-    # Enrichment fields
-    "subtitle",
-    "language",
-    "format_type",
-    "release_date",
-    "is_adult_product",
-]
+_BULK_UPDATE_ALLOWED_FIELDS = frozenset(
+    {
+        "narrator",
+        "series",
+        "publisher",
+        "published_year",
+        "content_type",
+        "source",
+        "edition",
+        "acquired_date",
+        "author",
+        "asin",
+        # Enrichment fields
+        "subtitle",
+        "language",
+        "format_type",
+        "release_date",
+        "is_adult_product",
+    }
+)
 
 # Related tables to clean up when deleting audiobooks
 # Maps table_name -> foreign key column name
@@ -91,16 +111,30 @@ _RELATED_TABLES = {
 }
 
 
+# SQLite caps bound parameters per statement (999 on older builds); chunk
+# IN-lists well under that so a bulk request with thousands of ids doesn't
+# raise "too many SQL variables"
+_SQL_BATCH_SIZE = 500
+
+
 # ── Helper functions ──────────────────────────────────────────────────
 
 
-def _delete_related_records(cursor, ids, placeholders):
+def _id_batches(ids, size=_SQL_BATCH_SIZE):
+    """Yield (batch, placeholders) pairs sized under the parameter cap."""
+    for i in range(0, len(ids), size):
+        batch = list(ids[i : i + size])
+        yield batch, ",".join("?" * len(batch))
+
+
+def _delete_related_records(cursor, ids):
     """Delete all related records for given audiobook IDs across junction tables."""
-    for table, col in _RELATED_TABLES.items():
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"DELETE FROM {table} WHERE {col} IN ({placeholders})",  # nosec B608 — table,col from _RELATED_TABLES code-defined dict at L82; placeholders = ','.join('?'*N); ids parameter-bound  # noqa: S608
-            ids,
-        )
+    for batch, placeholders in _id_batches(ids):
+        for table, col in _RELATED_TABLES.items():
+            cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+                f"DELETE FROM {table} WHERE {col} IN ({placeholders})",  # nosec B608 — table,col from _RELATED_TABLES code-defined dict at L82; placeholders = ','.join('?'*N); ids parameter-bound  # noqa: S608
+                batch,
+            )
 
 
 def _cleanup_cover_files(cover_names):
@@ -128,20 +162,21 @@ def _delete_audiobook_files(file_paths):
     return deleted_files, failed_files
 
 
-def _collect_paths_for_deletion(cursor, ids, placeholders, delete_files):
+def _collect_paths_for_deletion(cursor, ids, delete_files):
     """Collect file and cover paths before deleting audiobook records."""
     files_to_delete = []
     covers_to_delete = []
-    cursor.execute(
-        "SELECT id, file_path, cover_path FROM audiobooks"  # nosec B608  # noqa: S608
-        f" WHERE id IN ({placeholders})",
-        ids,
-    )
-    for row in cursor.fetchall():
-        if delete_files and row["file_path"]:
-            files_to_delete.append(Path(row["file_path"]))
-        if row["cover_path"]:
-            covers_to_delete.append(row["cover_path"])
+    for batch, placeholders in _id_batches(ids):
+        cursor.execute(
+            "SELECT id, file_path, cover_path FROM audiobooks"  # nosec B608  # noqa: S608
+            f" WHERE id IN ({placeholders})",
+            batch,
+        )
+        for row in cursor.fetchall():
+            if delete_files and row["file_path"]:
+                files_to_delete.append(Path(row["file_path"]))
+            if row["cover_path"]:
+                covers_to_delete.append(row["cover_path"])
     return files_to_delete, covers_to_delete
 
 
@@ -182,58 +217,73 @@ def _validate_bulk_request(data, required_key, entity_label):
             None,
             (jsonify({"success": False, "error": "mode must be 'add' or 'remove'"}), 400),
         )
-    return ids, names, mode, None
+    # Dedupe (order-preserving) so repeated ids/names in a bulk request don't
+    # produce redundant junction writes or oversized IN-lists downstream.
+    return list(dict.fromkeys(ids)), list(dict.fromkeys(names)), mode, None
 
 
-def _bulk_add_tags(cursor, ids, names, table, id_column, entity_table):
-    """Add tag associations (genres/topics/eras) for multiple audiobooks."""
-    affected = 0
-    for name in names:
-        name = name.strip()
-        if not name:
-            continue
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"INSERT OR IGNORE INTO {entity_table} (name) VALUES (?)",  # nosec B608 — entity_table is literal "genres"/"topics"/"eras" from callers L549/L652/L738; name is parameter-bound  # noqa: S608
-            (name,),
-        )
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"SELECT id FROM {entity_table} WHERE name = ?",  # nosec B608 — same allowlist; name is parameter-bound  # noqa: S608
-            (name,),
+def _resolve_tag_ids(cursor, names, entity_table, create_missing):
+    """Map cleaned tag names to their entity-table ids with two statements.
+
+    Replaces the old per-name INSERT+SELECT round trips: one executemany to
+    upsert all names (when ``create_missing``), then one ``IN (...)`` SELECT
+    to fetch every id. Returns the id list in input order, skipping names
+    that don't exist when ``create_missing`` is False.
+    """
+    cleaned = [n for n in (name.strip() for name in names) if n]
+    if not cleaned:
+        return []
+    if create_missing:
+        cursor.executemany(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+            f"INSERT OR IGNORE INTO {entity_table} (name) VALUES (?)",  # nosec B608 — entity_table is literal "genres"/"topics"/"eras" from callers; names are parameter-bound  # noqa: S608
+            [(n,) for n in cleaned],
         )
-        tag_id = cursor.fetchone()["id"]
-        for book_id in ids:
-            cursor.execute(
-                f"INSERT OR IGNORE INTO {table}"  # nosec B608  # noqa: S608
-                f" (audiobook_id, {id_column}) VALUES (?, ?)",
-                (book_id, tag_id),
-            )
-            affected += cursor.rowcount
-    return affected
+    placeholders = ",".join("?" * len(cleaned))
+    cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+        f"SELECT id, name FROM {entity_table} WHERE name IN ({placeholders})",  # nosec B608 — same allowlist; placeholders = ','.join('?'*N); names parameter-bound  # noqa: S608
+        cleaned,
+    )
+    by_name = {row["name"]: row["id"] for row in cursor.fetchall()}
+    return [by_name[n] for n in cleaned if n in by_name]
+
+
+def _bulk_add_tags(cursor, ids, names, table, id_column, entity_table):
+    """Add tag associations (genres/topics/eras) for multiple audiobooks.
+
+    Batched: one upsert+SELECT for the tag names, then one executemany over
+    the (book, tag) cross-product instead of a per-book INSERT loop.
+    """
+    tag_ids = _resolve_tag_ids(cursor, names, entity_table, create_missing=True)
+    if not tag_ids:
+        return 0
+    cursor.executemany(
+        f"INSERT OR IGNORE INTO {table}"  # nosec B608  # noqa: S608
+        f" (audiobook_id, {id_column}) VALUES (?, ?)",
+        [(book_id, tag_id) for tag_id in tag_ids for book_id in ids],
+    )
+    # executemany rowcount is the total modified across the batch; ignored
+    # duplicates don't count, matching the old per-row accumulation.
+    return cursor.rowcount
 
 
 def _bulk_remove_tags(cursor, ids, names, table, id_column, entity_table):
-    """Remove tag associations (genres/topics/eras) for multiple audiobooks."""
-    affected = 0
-    placeholders = ",".join("?" * len(ids))
-    for name in names:
-        name = name.strip()
-        if not name:
-            continue
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"SELECT id FROM {entity_table} WHERE name = ?",  # nosec B608 — entity_table is literal "genres"/"topics"/"eras" from callers; name is parameter-bound  # noqa: S608
-            (name,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            continue
-        tag_id = row["id"]
-        cursor.execute(
-            f"DELETE FROM {table}"  # nosec B608  # noqa: S608
-            f" WHERE {id_column} = ? AND audiobook_id IN ({placeholders})",
-            [tag_id] + list(ids),
-        )
-        affected += cursor.rowcount
-    return affected
+    """Remove tag associations (genres/topics/eras) for multiple audiobooks.
+
+    Batched: one SELECT resolves all tag names, then a single DELETE with
+    both columns in IN-lists instead of one DELETE per name.
+    """
+    tag_ids = _resolve_tag_ids(cursor, names, entity_table, create_missing=False)
+    if not tag_ids:
+        return 0
+    id_placeholders = ",".join("?" * len(ids))
+    tag_placeholders = ",".join("?" * len(tag_ids))
+    cursor.execute(
+        f"DELETE FROM {table}"  # nosec B608  # noqa: S608
+        f" WHERE {id_column} IN ({tag_placeholders})"
+        f" AND audiobook_id IN ({id_placeholders})",
+        list(tag_ids) + list(ids),
+    )
+    return cursor.rowcount
 
 
 def _set_tags_for_audiobook(cursor, audiobook_id, names, junction_table, id_column, entity_table):
@@ -242,23 +292,12 @@ def _set_tags_for_audiobook(cursor, audiobook_id, names, junction_table, id_colu
         f"DELETE FROM {junction_table} WHERE audiobook_id = ?",  # nosec B608 — junction_table is literal "audiobook_genres"/"audiobook_topics"/"audiobook_eras" from callers L549/L652/L738; audiobook_id is int parameter-bound  # noqa: S608
         (audiobook_id,),
     )
-    for name in names:
-        name = name.strip()
-        if not name:
-            continue
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"INSERT OR IGNORE INTO {entity_table} (name) VALUES (?)",  # nosec B608 — entity_table is literal "genres"/"topics"/"eras" from callers; name is parameter-bound  # noqa: S608
-            (name,),
-        )
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"SELECT id FROM {entity_table} WHERE name = ?",  # nosec B608 — same allowlist; name is parameter-bound  # noqa: S608
-            (name,),
-        )
-        tag_id = cursor.fetchone()["id"]
-        cursor.execute(
+    tag_ids = _resolve_tag_ids(cursor, names, entity_table, create_missing=True)
+    if tag_ids:
+        cursor.executemany(
             f"INSERT OR IGNORE INTO {junction_table}"  # nosec B608  # noqa: S608
             f" (audiobook_id, {id_column}) VALUES (?, ?)",
-            (audiobook_id, tag_id),
+            [(audiobook_id, tag_id) for tag_id in tag_ids],
         )
 
 
@@ -274,12 +313,9 @@ def update_audiobook(id: int) -> FlaskResponse:
     if not data:
         return jsonify({"success": False, "error": "No data provided"}), 400
 
-    updates = []
-    values = []
-    for field in _UPDATE_ALLOWED_FIELDS:
-        if field in data:
-            updates.append(f"{field} = ?")
-            values.append(data[field])
+    fields = sorted(data.keys() & _UPDATE_ALLOWED_FIELDS)
+    updates = [f"{field} = ?" for field in fields]
+    values = [data[field] for field in fields]
 
     if not updates:
         return (jsonify({"success": False, "error": "No valid fields to update"}), 400)
@@ -296,6 +332,7 @@ def update_audiobook(id: int) -> FlaskResponse:
         conn.close()
 
         if rows_affected > 0:
+            invalidate_aggregate_cache()
             return jsonify({"success": True, "updated": rows_affected})
         else:
             return jsonify({"success": False, "error": "Audiobook not found"}), 404
@@ -316,7 +353,9 @@ def delete_audiobook(id: int) -> FlaskResponse:
     cursor = conn.cursor()
 
     try:
-        cursor.execute("BEGIN TRANSACTION")
+        # IMMEDIATE takes the write lock up front; a deferred transaction
+        # that upgrades mid-way can hit SQLITE_BUSY after doing half its reads
+        cursor.execute("BEGIN IMMEDIATE")
 
         # Collect cover_path before deletion for cleanup
         cursor.execute("SELECT cover_path FROM audiobooks WHERE id = ?", (id,))
@@ -324,7 +363,7 @@ def delete_audiobook(id: int) -> FlaskResponse:
         cover_to_delete = row["cover_path"] if row and row["cover_path"] else None
 
         # Delete related records first (all enrichment junction tables)
-        _delete_related_records(cursor, (id,), "?")
+        _delete_related_records(cursor, (id,))
 
         # Delete the audiobook
         cursor.execute("DELETE FROM audiobooks WHERE id = ?", (id,))
@@ -333,6 +372,7 @@ def delete_audiobook(id: int) -> FlaskResponse:
         if rows_affected > 0:
             conn.commit()
             conn.close()
+            invalidate_aggregate_cache()
             if cover_to_delete:
                 _cleanup_cover_files([cover_to_delete])
             return jsonify({"success": True, "deleted": rows_affected})
@@ -347,21 +387,50 @@ def delete_audiobook(id: int) -> FlaskResponse:
         return jsonify({"success": False, "error": "Database deletion failed"}), 500
 
 
+def _bulk_update_per_id(cursor, field, pairs):
+    """Apply per-id values for *field* with one CASE UPDATE per batch.
+
+    *pairs* is a list of (id, value) tuples. Each batch binds three
+    parameters per id (WHEN/THEN plus the IN-list entry), so batches are
+    sized at a third of the usual cap. Returns the total rowcount.
+    """
+    updated_count = 0
+    for batch, placeholders in _id_batches(pairs, size=_SQL_BATCH_SIZE // 3):
+        case_sql = " ".join("WHEN ? THEN ?" for _ in batch)
+        id_placeholders = ",".join("?" * len(batch))
+        # CodeQL: field is validated against allowed_fields allowlist by caller
+        query = (  # nosec B608  # noqa: S608
+            f"UPDATE audiobooks SET {field} = CASE id {case_sql} END"
+            f" WHERE id IN ({id_placeholders})"
+        )
+        params = [p for pair in batch for p in pair] + [pair[0] for pair in batch]
+        cursor.execute(query, params)  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+        updated_count += cursor.rowcount
+    return updated_count
+
+
 @utilities_crud_bp.route("/api/audiobooks/bulk-update", methods=["POST"])
 @admin_if_enabled
 def bulk_update_audiobooks() -> FlaskResponse:
-    """Update a field for multiple audiobooks"""
+    """Update a field for multiple audiobooks.
+
+    Two request shapes:
+        {"ids": [...], "field": f, "value": v}   — same value for every id
+        {"values": {id: v, ...}, "field": f}     — per-id values, applied in
+                                                   one CASE UPDATE per batch
+    """
     data = request.get_json()
 
-    if not data or "ids" not in data or "field" not in data:
+    if not data or "field" not in data or ("ids" not in data and "values" not in data):
         return (
             jsonify({"success": False, "error": "Missing required fields: ids, field, value"}),
             400,
         )
 
-    ids = data["ids"]
+    ids = data.get("ids", [])
     field = data["field"]
     value = data.get("value")
+    values_map = data.get("values")
 
     if field not in _BULK_UPDATE_ALLOWED_FIELDS:
         return (
@@ -369,20 +438,32 @@ def bulk_update_audiobooks() -> FlaskResponse:
             400,
         )
 
-    if not ids:
+    if values_map is not None:
+        try:
+            pairs = [(int(book_id), book_value) for book_id, book_value in values_map.items()]
+        except (TypeError, ValueError):  # fmt: skip
+            return (jsonify({"success": False, "error": "Invalid id in values"}), 400)
+        if not pairs:
+            return (jsonify({"success": False, "error": "No audiobook IDs provided"}), 400)
+    elif not ids:
         return (jsonify({"success": False, "error": "No audiobook IDs provided"}), 400)
 
     conn = get_db(_db_path)
     cursor = conn.cursor()
 
     try:
-        placeholders = ",".join("?" * len(ids))
-        # CodeQL: field is validated against allowed_fields allowlist above
-        query = f"UPDATE audiobooks SET {field} = ? WHERE id IN ({placeholders})"  # nosec B608  # nosemgrep: python.django.security.injection.tainted-sql-string.tainted-sql-string,python.flask.security.injection.tainted-sql-string.tainted-sql-string  # noqa: S608
-        cursor.execute(query, [value] + ids)  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+        if values_map is not None:
+            updated_count = _bulk_update_per_id(cursor, field, pairs)
+        else:
+            updated_count = 0
+            for batch, placeholders in _id_batches(ids):
+                # CodeQL: field is validated against allowed_fields allowlist above
+                query = f"UPDATE audiobooks SET {field} = ? WHERE id IN ({placeholders})"  # nosec B608  # nosemgrep: python.django.security.injection.tainted-sql-string.tainted-sql-string,python.flask.security.injection.tainted-sql-string.tainted-sql-string  # noqa: S608
+                cursor.execute(query, [value] + batch)  # nosec B608  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+                updated_count += cursor.rowcount
         conn.commit()
-        updated_count = cursor.rowcount
         conn.close()
+        invalidate_aggregate_cache()
 
         return jsonify({"success": True, "updated_count": updated_count})
     except Exception as e:
@@ -415,27 +496,26 @@ def bulk_delete_audiobooks() -> FlaskResponse:
     cursor = conn.cursor()
 
     try:
-        placeholders = ",".join("?" * len(ids))
-
         # STEP 1: Collect file paths and cover paths BEFORE deletion
-        files_to_delete, covers_to_delete = _collect_paths_for_deletion(
-            cursor, ids, placeholders, delete_files
-        )
+        files_to_delete, covers_to_delete = _collect_paths_for_deletion(cursor, ids, delete_files)
 
         # STEP 2: Delete from database first (in transaction)
-        cursor.execute("BEGIN TRANSACTION")
-        _delete_related_records(cursor, ids, placeholders)
+        cursor.execute("BEGIN IMMEDIATE")
+        _delete_related_records(cursor, ids)
 
         # Delete audiobooks
-        cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
-            f"DELETE FROM audiobooks WHERE id IN ({placeholders})",  # nosec B608 — placeholders = ','.join('?'*len(ids)) — literal '?' chars only; ids parameter-bound  # nosemgrep: python.django.security.injection.tainted-sql-string.tainted-sql-string,python.flask.security.injection.tainted-sql-string.tainted-sql-string  # noqa: S608
-            ids,
-        )
-        deleted_count = cursor.rowcount
+        deleted_count = 0
+        for batch, placeholders in _id_batches(ids):
+            cursor.execute(  # nosemgrep: python.sqlalchemy.security.sqlalchemy-execute-raw-query.sqlalchemy-execute-raw-query
+                f"DELETE FROM audiobooks WHERE id IN ({placeholders})",  # nosec B608 — placeholders = ','.join('?'*len(batch)) — literal '?' chars only; ids parameter-bound  # nosemgrep: python.django.security.injection.tainted-sql-string.tainted-sql-string,python.flask.security.injection.tainted-sql-string.tainted-sql-string  # noqa: S608
+                batch,
+            )
+            deleted_count += cursor.rowcount
 
         # Commit database changes first
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
 
         # STEP 3: Only delete files AFTER successful DB commit
         deleted_files, failed_files = [], []
@@ -540,15 +620,16 @@ def set_audiobook_genres(id: int) -> FlaskResponse:
     cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT id FROM audiobooks WHERE id = ?", (id,))
+        cursor.execute("SELECT 1 FROM audiobooks WHERE id = ?", (id,))
         if not cursor.fetchone():
             conn.close()
             return jsonify({"success": False, "error": "Audiobook not found"}), 404
 
-        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute("BEGIN IMMEDIATE")
         _set_tags_for_audiobook(cursor, id, genre_names, "audiobook_genres", "genre_id", "genres")
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
 
         return jsonify({"success": True, "genres": genre_names})
     except Exception as e:
@@ -579,7 +660,7 @@ def bulk_manage_genres() -> FlaskResponse:
     cursor = conn.cursor()
 
     try:
-        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute("BEGIN IMMEDIATE")
 
         if mode == "add":
             affected = _bulk_add_tags(
@@ -592,6 +673,7 @@ def bulk_manage_genres() -> FlaskResponse:
 
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
 
         return jsonify(
             {
@@ -645,15 +727,16 @@ def set_audiobook_topics(id: int) -> FlaskResponse:
     conn = get_db(_db_path)
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT id FROM audiobooks WHERE id = ?", (id,))
+        cursor.execute("SELECT 1 FROM audiobooks WHERE id = ?", (id,))
         if not cursor.fetchone():
             conn.close()
             return jsonify({"success": False, "error": "Audiobook not found"}), 404
 
-        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute("BEGIN IMMEDIATE")
         _set_tags_for_audiobook(cursor, id, topic_names, "audiobook_topics", "topic_id", "topics")
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
         return jsonify({"success": True, "topics": topic_names})
     except Exception as e:
         logger.exception("Error setting topics for audiobook %d: %s", int(id), e)
@@ -674,7 +757,7 @@ def bulk_manage_topics() -> FlaskResponse:
     conn = get_db(_db_path)
     cursor = conn.cursor()
     try:
-        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute("BEGIN IMMEDIATE")
 
         if mode == "add":
             affected = _bulk_add_tags(
@@ -687,6 +770,7 @@ def bulk_manage_topics() -> FlaskResponse:
 
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
         return jsonify({"success": True, "mode": mode, "affected": affected})
     except Exception:
         logger.exception("Error in bulk topic %s", mode)
@@ -731,15 +815,16 @@ def set_audiobook_eras(id: int) -> FlaskResponse:
     conn = get_db(_db_path)
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT id FROM audiobooks WHERE id = ?", (id,))
+        cursor.execute("SELECT 1 FROM audiobooks WHERE id = ?", (id,))
         if not cursor.fetchone():
             conn.close()
             return jsonify({"success": False, "error": "Audiobook not found"}), 404
 
-        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute("BEGIN IMMEDIATE")
         _set_tags_for_audiobook(cursor, id, era_names, "audiobook_eras", "era_id", "eras")
         conn.commit()
         conn.close()
+        invalidate_aggregate_cache()
         return jsonify({"success": True, "eras": era_names})
     except Exception as e:
         logger.exception("Error setting eras for audiobook %d: %s", int(id), e)
@@ -777,7 +862,7 @@ def add_editorial_review(id: int) -> FlaskResponse:
     conn = get_db(_db_path)
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT id FROM audiobooks WHERE id = ?", (id,))
+        cursor.execute("SELECT 1 FROM audiobooks WHERE id = ?", (id,))
         if not cursor.fetchone():
             conn.close()
             return jsonify({"success": False, "error": "Audiobook not found"}), 404
@@ -887,6 +972,8 @@ def get_enrichment_stats() -> Response:
 
 def init_crud_routes(db_path):
     """Initialize CRUD routes with database path."""
-    global _db_path
+    global _db_path, _pool
     _db_path = db_path
+    _pool.close_all()  # drop connections to any previously configured DB
+    _pool = ConnectionPool(db_path)
     return utilities_crud_bp
@@ -15,8 +15,14 @@ Why this exists:
 import select
 import subprocess  # nosec B404 — import subprocess — subprocess usage is intentional; all calls use hardcoded system tool names
 import time
+from collections import deque
 from typing import Any
 
+# Only the tail of the output survives into the result (it is truncated to
+# 2000 chars anyway), so retain a bounded window of lines instead of holding
+# a multi-hour scan's entire stdout in memory.
+_OUTPUT_TAIL_LINES = 100
+
 
 def _make_result(success, output_lines, stderr="", returncode=None, timed_out=False, error=None):
     """Build a standard result dict."""
@@ -124,7 +130,7 @@ def run_with_progress(cmd, *, line_callback, timeout_secs, operation_name="Opera
     # stdout/stderr are guaranteed non-None because popen_kwargs sets them to PIPE.
     if process.stdout is None or process.stderr is None:
         raise RuntimeError("Popen stdout/stderr unexpectedly None despite PIPE configuration")
-    output_lines: list[str] = []
+    output_lines: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
 
     try:
         fd = process.stdout.fileno()
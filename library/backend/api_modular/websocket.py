@@ -13,9 +13,26 @@ import sqlite3
 import threading
 import time
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only on minimal installs
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _encode_message(message) -> str:
+    """Serialize a broadcast payload to a JSON text frame.
+
+    orjson when available (same pattern as core.ojson); compact stdlib json
+    otherwise. Decoded to str so the WebSocket frame stays text — clients
+    JSON.parse event.data and would choke on a binary frame.
+    """
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class ConnectionManager:
     """Manages active WebSocket connections in-memory.
 
@@ -93,7 +110,7 @@ class ConnectionManager:
 
     def broadcast(self, message):
         """Send a message to all connected clients."""
-        payload = json.dumps(message) if isinstance(message, dict) else message
+        payload = _encode_message(message) if isinstance(message, dict) else message
         dead = []
         with self._lock:
             for sid, conn in self._connections.items():
@@ -140,11 +157,18 @@ def init_notification_poller(db_path):
         return
 
     def _poll_loop():
+        # One long-lived connection for the lifetime of the poller instead
+        # of an open/PRAGMA/parse cycle every 5 seconds. The poller is a
+        # single greenlet, so the connection is never shared. On any poll
+        # error the connection is discarded and reopened next tick — a
+        # stale handle (e.g. after the DB file is replaced by a restore)
+        # heals itself within one interval.
+        conn = None
         while True:
-            conn = None
             try:
-                conn = sqlite3.connect(str(_db_path_for_poller))
-                conn.row_factory = sqlite3.Row
+                if conn is None:
+                    conn = sqlite3.connect(str(_db_path_for_poller))
+                    conn.row_factory = sqlite3.Row
                 rows = conn.execute("""SELECT id, notification_type, payload
                        FROM maintenance_notifications
                        WHERE delivered = 0
@@ -165,14 +189,12 @@ def init_notification_poller(db_path):
                 conn.commit()
             except Exception as e:
                 logger.error("Notification poll error: %s", e)
-            finally:
-                # Always close — try/finally guards against leaks if an
-                # exception fires before the original close() was reached.
                 if conn is not None:
                     try:
                         conn.close()
-                    except Exception:  # nosec B110 — best-effort close in finally; the real poll error was already logged above
+                    except Exception:  # nosec B110 — best-effort close; the real poll error was already logged above
                         pass
+                    conn = None
 
             gevent.sleep(5)
 
@@ -15,8 +15,10 @@ import os  # noqa: E402
 import sys  # noqa: E402
 from pathlib import Path  # noqa: E402
 
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for config import (guarded against duplicates)
+_LIBRARY_ROOT = str(Path(__file__).parent.parent)
+if _LIBRARY_ROOT not in sys.path:
+    sys.path.insert(0, _LIBRARY_ROOT)
 from api_modular import create_app  # noqa: E402
 
 from config import API_PORT, DATABASE_PATH, PROJECT_DIR, SUPPLEMENTS_DIR  # noqa: E402
@@ -0,0 +1,24 @@
+-- Migration 026: reverse-direction indexes on the tag junction tables.
+--
+-- Context:
+--   audiobook_genres/audiobook_topics/audiobook_eras all carry a composite
+--   PRIMARY KEY (audiobook_id, <tag>_id), which only serves lookups that
+--   lead with audiobook_id. The other direction — "which books carry this
+--   tag?" — has no index at all, so every query that filters by tag id
+--   full-scans the junction table:
+--
+--     * the library listing's genre filter
+--       (audiobooks.py: id IN (SELECT audiobook_id FROM audiobook_genres
+--        ag JOIN genres g ... WHERE g.name LIKE ?))
+--     * bulk tag removal (utilities_crud.py: DELETE ... WHERE genre_id IN
+--       (...) AND audiobook_id IN (...))
+--
+--   O(N) scans per request on the largest junction tables become O(log N)
+--   seeks. book_authors/book_narrators already have their reverse indexes
+--   (idx_book_authors_author, idx_book_narrators_narrator from 011).
+--
+-- Idempotency: CREATE INDEX IF NOT EXISTS — safe to re-run.
+
+CREATE INDEX IF NOT EXISTS idx_audiobook_genres_genre ON audiobook_genres(genre_id);
+CREATE INDEX IF NOT EXISTS idx_audiobook_topics_topic ON audiobook_topics(topic_id);
+CREATE INDEX IF NOT EXISTS idx_audiobook_eras_era ON audiobook_eras(era_id);
@@ -0,0 +1,27 @@
+-- Migration 027: partial indexes for the missing-metadata dashboard scans.
+--
+-- Context:
+--   /api/audiobooks/missing-narrator and /api/audiobooks/missing-hash
+--   (utilities_crud.py) filter on "metadata absent" predicates and sort by
+--   title COLLATE NOCASE with LIMIT 200. Without an index each request
+--   full-scans audiobooks and temp-sorts the matches. A partial index on
+--   title COLLATE NOCASE restricted to the deficient rows serves both the
+--   filter and the sort: SQLite walks the index in order and stops at 200.
+--
+--   Partial indexes only store the deficient rows (typically a few hundred,
+--   shrinking as metadata is backfilled), so the write-side cost on inserts
+--   and enrichment updates is negligible.
+--
+--   The WHERE clauses must stay textually in sync with the queries in
+--   utilities_crud.py — SQLite only uses a partial index when the query's
+--   WHERE provably implies the index's.
+--
+-- Idempotency: CREATE INDEX IF NOT EXISTS — safe to re-run.
+
+CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_narrator
+    ON audiobooks(title COLLATE NOCASE)
+    WHERE narrator IS NULL OR narrator = '' OR narrator = 'Unknown Narrator';
+
+CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_hash
+    ON audiobooks(title COLLATE NOCASE)
+    WHERE sha256_hash IS NULL OR sha256_hash = '';
@@ -9,6 +9,7 @@ small JSON files rather than parse audio metadata via ffprobe.
 import json
 import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directories to path for config import
@@ -36,12 +37,14 @@ def main():
     chapters_files = list(AUDIOBOOKS_LIBRARY.rglob("chapters.json"))
     print(f"Found {len(chapters_files)} chapters.json files")
 
-    # Build mapping: directory -> ASIN
+    # Build mapping: directory -> ASIN. The files are thousands of small
+    # JSONs, so this is seek-bound; a thread pool overlaps the reads (the
+    # GIL is released during file I/O).
     asin_map = {}
-    for cf in chapters_files:
-        asin = extract_asin(cf)
-        if asin:
-            asin_map[str(cf.parent)] = asin
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for cf, asin in zip(chapters_files, executor.map(extract_asin, chapters_files)):
+            if asin:
+                asin_map[str(cf.parent)] = asin
 
     print(f"Extracted {len(asin_map)} ASINs")
 
@@ -54,18 +57,15 @@ def main():
     audiobooks = cursor.fetchall()
     print(f"Found {len(audiobooks)} audiobooks without ASINs")
 
-    # Update audiobooks with matching ASINs
-    updated = 0
-    for audiobook_id, file_path in audiobooks:
-        # Get directory of audiobook file
-        audiobook_dir = str(Path(file_path).parent)
-        if audiobook_dir in asin_map:
-            cursor.execute(
-                "UPDATE audiobooks SET asin = ? WHERE id = ?",
-                (asin_map[audiobook_dir], audiobook_id),
-            )
-            updated += 1
-
+    # Update audiobooks with matching ASINs — one executemany in one
+    # transaction (single statement compile, single commit/fsync)
+    updates = [
+        (asin_map[audiobook_dir], audiobook_id)
+        for audiobook_id, file_path in audiobooks
+        if (audiobook_dir := str(Path(file_path).parent)) in asin_map
+    ]
+    cursor.executemany("UPDATE audiobooks SET asin = ? WHERE id = ?", updates)
+    updated = cursor.rowcount
     conn.commit()
     print(f"✓ Updated {updated} audiobooks with ASINs")
 
@@ -9,6 +9,7 @@ and polled from the API endpoints.
 """
 
 import threading
+import time
 from datetime import datetime
 from enum import Enum
 from typing import Callable, Optional
@@ -234,19 +235,42 @@ def get_tracker() -> OperationTracker:
     return OperationTracker()
 
 
+# Minimum seconds between same-percent publishes from a progress callback.
+# Scanners call their callback per file, so a large library generates thousands
+# of updates that all round to the same percent; each one takes the tracker
+# lock that the progress-poll endpoints also need.
+_PROGRESS_PUBLISH_INTERVAL = 0.25
+
+
 def create_progress_callback(operation_id: str) -> Callable[[int, int, str], None]:
     """
     Create a progress callback function for use with long-running operations.
 
-    Returns a callback(current, total, message) that updates the operation status.
+    Returns a callback(current, total, message) that updates the operation
+    status. Updates are coalesced: a publish is skipped when the computed
+    percent hasn't changed and the last publish was under
+    ``_PROGRESS_PUBLISH_INTERVAL`` seconds ago. The 100% update always goes
+    through so completion is never dropped.
     """
     tracker = get_tracker()
+    last_percent: Optional[int] = None
+    last_publish = 0.0
 
     def callback(current: int, total: int, message: str):
+        nonlocal last_percent, last_publish
         if total > 0:
             progress = int((current / total) * 100)
         else:
             progress = current  # Assume current is already percentage
+        now = time.monotonic()
+        if (
+            progress == last_percent
+            and progress < 100
+            and now - last_publish < _PROGRESS_PUBLISH_INTERVAL
+        ):
+            return
+        last_percent = progress
+        last_publish = now
         tracker.update_progress(operation_id, progress, message)
 
     return callback
@@ -147,6 +147,23 @@ CREATE TABLE IF NOT EXISTS audiobook_topics (
     FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
 );
 
+-- Reverse-direction junction indexes: the composite PKs above only serve
+-- audiobook_id-led lookups; tag-led queries (listing genre filter, bulk tag
+-- removal) need these (see migration 026).
+CREATE INDEX IF NOT EXISTS idx_audiobook_genres_genre ON audiobook_genres(genre_id);
+CREATE INDEX IF NOT EXISTS idx_audiobook_topics_topic ON audiobook_topics(topic_id);
+CREATE INDEX IF NOT EXISTS idx_audiobook_eras_era ON audiobook_eras(era_id);
+
+-- Partial indexes for the missing-metadata dashboard scans; WHERE clauses
+-- must stay textually in sync with the queries in utilities_crud.py
+-- (see migration 027).
+CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_narrator
+    ON audiobooks(title COLLATE NOCASE)
+    WHERE narrator IS NULL OR narrator = '' OR narrator = 'Unknown Narrator';
+CREATE INDEX IF NOT EXISTS idx_audiobooks_missing_hash
+    ON audiobooks(title COLLATE NOCASE)
+    WHERE sha256_hash IS NULL OR sha256_hash = '';
+
 -- Normalized author/narrator tables (many-to-many)
 CREATE TABLE IF NOT EXISTS authors (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
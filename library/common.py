@@ -6,6 +6,7 @@ Consolidates common operations used across scanner and scripts.
 import hashlib
 import ipaddress
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -17,9 +18,17 @@ DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
 _LOOPBACK_NAMES = frozenset({"localhost"})
 
 
+@lru_cache(maxsize=256)
 def is_loopback_address(address: Optional[str]) -> bool:
     """Return True if ``address`` denotes the local machine.
 
+    Memoized: the gate runs on every request to a localhost-only or
+    admin route, and real deployments see a handful of distinct peer
+    addresses (the proxy's loopback plus a few clients), so the
+    ``ipaddress.ip_address`` parse — the expensive part — is paid once
+    per distinct string rather than per request. The cache key is the
+    raw string; the function is pure.
+
     Single canonical loopback test for the whole project — shared by the
     reverse proxy (which decides what client address to forward) and the
     Flask ``localhost_only`` / ``admin_or_localhost`` decorators (which
@@ -304,14 +304,28 @@ def deploy_to_vm(ensure_vm_running):
         pytest.fail(f"upgrade.sh --remote failed:\n{result.stderr}\n{result.stdout}")
 
 
+# In-memory database holding the executed schema, built on first use. Cloning
+# it via SQLite's backup API copies pages directly, so repeated database
+# initialisations skip re-parsing and re-executing the schema DDL.
+_schema_template: sqlite3.Connection | None = None
+
+
+def _get_schema_template() -> sqlite3.Connection:
+    global _schema_template
+    if _schema_template is None:
+        _schema_template = sqlite3.connect(":memory:")
+        _schema_template.executescript(SCHEMA_PATH.read_text())
+    return _schema_template
+
+
 def init_test_database(db_path: Path) -> None:
     """Initialize a test database with the schema.
 
-    Creates all tables, indices, views, and triggers from schema.sql.
+    Creates all tables, indices, views, and triggers from schema.sql by
+    cloning a cached in-memory template database.
     """
     conn = sqlite3.connect(db_path)
-    with open(SCHEMA_PATH) as f:
-        conn.executescript(f.read())
+    _get_schema_template().backup(conn)
     conn.close()
 
 
@@ -454,8 +468,10 @@ def auth_app(auth_temp_dir):
     auth_db_path = Path(tmpdir) / "auth.db"
     auth_key_path = Path(tmpdir) / "auth.key"
 
-    # Create main database with full schema + test audiobooks
-    conn = sqlite3.connect(main_db_path)
+    # Create main database with full schema + test audiobooks.
+    # isolation_level=None: autocommit, so executescript doesn't open and
+    # commit an extra wrapping transaction around the bootstrap DDL.
+    conn = sqlite3.connect(main_db_path, isolation_level=None)
     conn.executescript("""
         CREATE TABLE audiobooks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -656,8 +672,7 @@ def auth_app(auth_temp_dir):
     )
     admin.save(auth_db)
 
-    # Create Flask app
-    sys.path.insert(0, str(LIBRARY_DIR / "backend"))
+    # Create Flask app (backend/ is already on sys.path from module top)
     from api_modular import create_app
 
     app = create_app(
@@ -736,9 +751,13 @@ def _make_session_cookie(auth_db_instance, user_id: int) -> str:
 @pytest.fixture
 def admin_client(auth_app, auth_db):
     """Test client authenticated as an admin user."""
-    from auth.models import AuthType, User, UserRepository
+    from auth.models import AuthType, User, UserRepository, _drop_cached_username
 
     user_repo = UserRepository(auth_db)
+    # The app under test holds its own AuthDatabase handle with its own
+    # user-row cache; API-side deletes don't invalidate this handle's
+    # entries. Bypass the cache so the fixture sees authoritative state.
+    _drop_cached_username(auth_db, "testadmin_fix")
     admin = user_repo.get_by_username("testadmin_fix")
     if admin is None:
         admin = User(
@@ -759,9 +778,12 @@ def admin_client(auth_app, auth_db):
 @pytest.fixture
 def test_user(auth_db):
     """A regular (non-admin) TOTP user."""
-    from auth.models import AuthType, User, UserRepository
+    from auth.models import AuthType, User, UserRepository, _drop_cached_username
 
     user_repo = UserRepository(auth_db)
+    # Bypass this handle's user-row cache: API-side writes go through the
+    # app's own AuthDatabase handle and can't invalidate entries here.
+    _drop_cached_username(auth_db, "regularuser_fix")
     existing = user_repo.get_by_username("regularuser_fix")
     if existing is not None:
         return existing
@@ -10,21 +10,29 @@ This authenticator uses "none" attestation format (no attestation statement),
 which matches the server's AttestationConveyancePreference.NONE setting.
 """
 
-import hashlib
 import json
 import os
+import re
 import struct
 from base64 import urlsafe_b64decode, urlsafe_b64encode
 from dataclasses import dataclass, field
+from hashlib import sha256 as _sha256
 
 import cbor2
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.hashes import SHA256
 
 
 def _b64url_encode(data: bytes) -> str:
-    """Base64url encode without padding."""
-    return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    """Base64url encode without padding.
+
+    The pad length is fully determined by len(data) % 3, so slice it off
+    directly instead of scanning the tail with rstrip.
+    """
+    raw = urlsafe_b64encode(data)
+    pad = (-len(data)) % 3
+    return (raw[:-pad] if pad else raw).decode("ascii")
 
 
 def _b64url_decode(s: str) -> bytes:
@@ -33,6 +41,61 @@ def _b64url_decode(s: str) -> bytes:
     return urlsafe_b64decode(s)
 
 
+# Pre-compiled packers for the fixed formats used on every ceremony
+# (skips struct format-string parsing per call).
+_FLAGS_COUNT_PACK = struct.Struct(">BI").pack
+_U16_PACK = struct.Struct(">H").pack
+
+# Characters that would need JSON string escaping; challenges are base64url
+# and origins are plain https URLs, so this never matches in practice.
+_JSON_NEEDS_ESCAPE = re.compile(r'["\\\x00-\x1f]')
+
+
+def _client_data(type_: str, challenge_b64: str, origin: str) -> bytes:
+    """Build compact clientDataJSON without invoking the json encoder.
+
+    The schema is fixed and the values are escape-free in practice, so an
+    f-string suffices; falls back to json.dumps if a value would need escaping.
+    """
+    if _JSON_NEEDS_ESCAPE.search(challenge_b64) or _JSON_NEEDS_ESCAPE.search(origin):
+        return json.dumps(
+            {"type": type_, "challenge": challenge_b64, "origin": origin, "crossOrigin": False},
+            separators=(",", ":"),
+        ).encode("utf-8")
+    return (
+        f'{{"type":"{type_}","challenge":"{challenge_b64}"'
+        f',"origin":"{origin}","crossOrigin":false}}'
+    ).encode("utf-8")
+
+
+# Pre-encoded CBOR for the invariant parts of the registration response, so
+# make_credential splices bytes instead of running a full cbor2 map encode
+# per call. Verified byte-for-byte against cbor2 at import time below.
+#
+# attestationObject prefix: map(3) | "fmt" | "none" | "attStmt" | {} | "authData"
+_ATT_OBJ_PREFIX = bytes.fromhex("a363666d74646e6f6e656761747453746d74a0686175746844617461")
+# COSE_Key for EC2 P-256: map(5) | 1:2 (kty EC2) | 3:-7 (ES256) | -1:1 (P-256)
+# | -2: <32-byte x> ... | -3: <32-byte y>
+_COSE_KEY_HEAD = bytes.fromhex("a5010203262001215820")
+_COSE_KEY_MID = bytes.fromhex("225820")
+
+
+def _cbor_bytes_header(length: int) -> bytes:
+    """CBOR major-type-2 (byte string) header for the given payload length."""
+    if length < 24:
+        return bytes([0x40 | length])
+    if length < 0x100:
+        return bytes([0x58, length])
+    return b"\x59" + _U16_PACK(length)
+
+
+# Fail loudly at import if the hand-written constants ever drift from cbor2.
+assert _ATT_OBJ_PREFIX + b"\x40" == cbor2.dumps({"fmt": "none", "attStmt": {}, "authData": b""})
+assert _COSE_KEY_HEAD + b"\x00" * 32 + _COSE_KEY_MID + b"\x00" * 32 == cbor2.dumps(
+    {1: 2, 3: -7, -1: 1, -2: b"\x00" * 32, -3: b"\x00" * 32}
+)
+
+
 def _encode_cose_public_key(public_key: ec.EllipticCurvePublicKey) -> bytes:
     """Encode an EC public key in COSE_Key format (CBOR map).
 
@@ -42,28 +105,86 @@ def _encode_cose_public_key(public_key: ec.EllipticCurvePublicKey) -> bytes:
        -1 (crv): 1 (P-256)
        -2 (x): 32-byte x-coordinate
        -3 (y): 32-byte y-coordinate
+
+    Splices the coordinates into the pre-encoded map rather than re-encoding
+    the fixed keys with cbor2 each time.
     """
     numbers = public_key.public_numbers()
     x = numbers.x.to_bytes(32, "big")
     y = numbers.y.to_bytes(32, "big")
-    cose_key = {
-        1: 2,  # kty: EC2
-        3: -7,  # alg: ES256
-        -1: 1,  # crv: P-256
-        -2: x,  # x-coordinate
-        -3: y,  # y-coordinate
-    }
-    return cbor2.dumps(cose_key)
+    return _COSE_KEY_HEAD + x + _COSE_KEY_MID + y
+
+
+# Pre-generated P-256 keys so registration-heavy tests don't pay ECDSA
+# keygen inside each ceremony. The pool is filled once at import (this module
+# is only imported by WebAuthn test modules); make_credential falls back to
+# generating on the spot when the pool runs dry.
+_KEY_POOL: list[ec.EllipticCurvePrivateKey] = []
+
+
+def _refill_key_pool(n: int = 16) -> None:
+    """Top the key pool back up to *n* pre-generated P-256 keys."""
+    while len(_KEY_POOL) < n:
+        _KEY_POOL.append(ec.generate_private_key(ec.SECP256R1()))
+
+
+_refill_key_pool()
+
+# Batched entropy for credential ids: one os.urandom syscall covers 128
+# credentials instead of one each. Fine for a test authenticator — the ids
+# only need uniqueness, not forward secrecy.
+_RANDOM_POOL = bytearray()
+
+# AAGUID for the software authenticator (all zeros = no attestation); one
+# shared bytes object for every instance.
+_AAGUID = b"\x00" * 16
+
+
+def _rand32() -> bytes:
+    """Return 32 random bytes, drawn from a batched os.urandom pool."""
+    if len(_RANDOM_POOL) < 32:
+        _RANDOM_POOL.extend(os.urandom(4096))
+    out = bytes(_RANDOM_POOL[:32])
+    del _RANDOM_POOL[:32]
+    return out
 
 
-@dataclass
 class StoredCredential:
-    """A credential stored by the software authenticator."""
+    """A credential stored by the software authenticator.
+
+    A plain __slots__ class rather than a dataclass: no per-instance
+    __dict__, so credential-heavy tests pay less allocation and attribute
+    lookups hit slot descriptors directly.
+    """
 
-    credential_id: bytes
-    private_key: ec.EllipticCurvePrivateKey
-    rp_id: str
-    sign_count: int = 0
+    __slots__ = (
+        "credential_id",
+        "private_key",
+        "rp_id",
+        "sign_count",
+        "rp_id_hash",
+        "credential_id_b64",
+    )
+
+    def __init__(
+        self,
+        credential_id: bytes,
+        private_key: ec.EllipticCurvePrivateKey,
+        rp_id: str,
+        sign_count: int = 0,
+        rp_id_hash: bytes = b"",
+        credential_id_b64: str = "",
+    ):
+        self.credential_id = credential_id
+        self.private_key = private_key
+        self.rp_id = rp_id
+        self.sign_count = sign_count
+        # SHA-256 of rp_id, computed once at registration so assertions
+        # don't redo the encode+hash per call.
+        self.rp_id_hash = rp_id_hash
+        # base64url form of credential_id, encoded once at registration;
+        # used as the id/rawId fields of both ceremony responses.
+        self.credential_id_b64 = credential_id_b64
 
 
 @dataclass
@@ -75,8 +196,12 @@ class SoftwareAuthenticator:
     """
 
     credentials: dict[bytes, StoredCredential] = field(default_factory=dict)
-    # AAGUID for our software authenticator (all zeros = no attestation)
-    aaguid: bytes = field(default=b"\x00" * 16)
+    # AAGUID for our software authenticator
+    aaguid: bytes = _AAGUID
+    # Raw credential ids keyed by their base64url form, so the
+    # allowCredentials scan in get_assertion matches ids without a base64
+    # decode per entry.
+    _credentials_by_b64: dict[str, bytes] = field(default_factory=dict)
 
     def make_credential(self, options: dict, origin: str) -> dict:
         """Perform a WebAuthn registration ceremony (navigator.credentials.create).
@@ -96,37 +221,38 @@ class SoftwareAuthenticator:
         # Extract RP ID
         rp_id = options["rp"]["id"]
 
-        # Generate credential
-        private_key = ec.generate_private_key(ec.SECP256R1())
-        credential_id = os.urandom(32)
+        # Generate credential (pooled key when available)
+        private_key = _KEY_POOL.pop() if _KEY_POOL else ec.generate_private_key(ec.SECP256R1())
+        credential_id = _rand32()
+        credential_id_b64 = _b64url_encode(credential_id)
+        rp_id_hash = _sha256(rp_id.encode("utf-8")).digest()
 
         # Store credential
         self.credentials[credential_id] = StoredCredential(
-            credential_id=credential_id, private_key=private_key, rp_id=rp_id, sign_count=0
+            credential_id=credential_id,
+            private_key=private_key,
+            rp_id=rp_id,
+            sign_count=0,
+            rp_id_hash=rp_id_hash,
+            credential_id_b64=credential_id_b64,
         )
+        self._credentials_by_b64[credential_id_b64] = credential_id
 
         # Build clientDataJSON
-        client_data = json.dumps(
-            {
-                "type": "webauthn.create",
-                "challenge": challenge_b64,
-                "origin": origin,
-                "crossOrigin": False,
-            },
-            separators=(",", ":"),
-        ).encode("utf-8")
+        client_data = _client_data("webauthn.create", challenge_b64, origin)
 
         # Build authenticator data
         auth_data = self._build_auth_data_registration(
-            rp_id, credential_id, private_key.public_key()
+            rp_id_hash, credential_id, private_key.public_key()
         )
 
-        # Build attestation object (none format)
-        attestation_object = cbor2.dumps({"fmt": "none", "attStmt": {}, "authData": auth_data})
+        # Build attestation object (none format) by splicing authData onto
+        # the pre-encoded CBOR prefix
+        attestation_object = _ATT_OBJ_PREFIX + _cbor_bytes_header(len(auth_data)) + auth_data
 
         return {
-            "id": _b64url_encode(credential_id),
-            "rawId": _b64url_encode(credential_id),
+            "id": credential_id_b64,
+            "rawId": credential_id_b64,
             "type": "public-key",
             "response": {
                 "clientDataJSON": _b64url_encode(client_data),
@@ -151,11 +277,15 @@ class SoftwareAuthenticator:
         """
         challenge_b64 = options["challenge"]
 
-        # Find the credential to use
+        # Find the credential to use. The b64 index avoids decoding every
+        # allowCredentials entry; fall back to a decode for credentials
+        # registered outside make_credential.
         if credential_id is None:
             allow_creds = options.get("allowCredentials", [])
             for ac in allow_creds:
-                cid = _b64url_decode(ac["id"])
+                cid = self._credentials_by_b64.get(ac["id"])
+                if cid is None:
+                    cid = _b64url_decode(ac["id"])
                 if cid in self.credentials:
                     credential_id = cid
                     break
@@ -167,28 +297,24 @@ class SoftwareAuthenticator:
         stored.sign_count += 1
 
         # Build clientDataJSON
-        client_data = json.dumps(
-            {
-                "type": "webauthn.get",
-                "challenge": challenge_b64,
-                "origin": origin,
-                "crossOrigin": False,
-            },
-            separators=(",", ":"),
-        ).encode("utf-8")
+        client_data = _client_data("webauthn.get", challenge_b64, origin)
 
         # Build authenticator data (no attested credential data for assertion)
-        rp_id_hash = hashlib.sha256(stored.rp_id.encode("utf-8")).digest()
+        rp_id_hash = stored.rp_id_hash or _sha256(stored.rp_id.encode("utf-8")).digest()
         flags = 0x05  # UP (0x01) + UV (0x04)
-        auth_data = rp_id_hash + struct.pack(">BI", flags, stored.sign_count)
+        auth_data = rp_id_hash + _FLAGS_COUNT_PACK(flags, stored.sign_count)
 
-        # Sign: authData || SHA-256(clientDataJSON)
-        client_data_hash = hashlib.sha256(client_data).digest()
-        signature = stored.private_key.sign(auth_data + client_data_hash, ec.ECDSA(SHA256()))
+        # Sign: authData || SHA-256(clientDataJSON). Hash the signed payload
+        # here with two update() calls and pass the digest as Prehashed, so
+        # cryptography neither concatenates the buffers nor re-hashes them.
+        h = _sha256(auth_data)
+        h.update(_sha256(client_data).digest())
+        signature = stored.private_key.sign(h.digest(), ec.ECDSA(Prehashed(SHA256())))
 
+        credential_id_b64 = stored.credential_id_b64 or _b64url_encode(credential_id)
         return {
-            "id": _b64url_encode(credential_id),
-            "rawId": _b64url_encode(credential_id),
+            "id": credential_id_b64,
+            "rawId": credential_id_b64,
             "type": "public-key",
             "response": {
                 "clientDataJSON": _b64url_encode(client_data),
@@ -199,25 +325,24 @@ class SoftwareAuthenticator:
         }
 
     def _build_auth_data_registration(
-        self, rp_id: str, credential_id: bytes, public_key: ec.EllipticCurvePublicKey
+        self, rp_id_hash: bytes, credential_id: bytes, public_key: ec.EllipticCurvePublicKey
     ) -> bytes:
         """Build authenticator data for registration with attested credential data.
 
         Layout: rpIdHash (32) | flags (1) | signCount (4) | attestedCredData (variable)
         attestedCredData: aaguid (16) | credIdLen (2) | credId (N) | coseKey (variable)
         """
-        rp_id_hash = hashlib.sha256(rp_id.encode("utf-8")).digest()
         # Flags: UP (0x01) | UV (0x04) | AT (0x40) = 0x45
         flags = 0x45
         sign_count = 0
 
         # Attested credential data
-        cred_id_len = struct.pack(">H", len(credential_id))
+        cred_id_len = _U16_PACK(len(credential_id))
         cose_key = _encode_cose_public_key(public_key)
 
         return (
             rp_id_hash
-            + struct.pack(">BI", flags, sign_count)
+            + _FLAGS_COUNT_PACK(flags, sign_count)
             + self.aaguid
             + cred_id_len
             + credential_id
@@ -669,6 +669,24 @@ class TestBulkOperations:
         )
         assert response.status_code == 400
 
+    def test_bulk_update_per_id_empty_values(self, app_client):
+        """Test per-id bulk update with an empty values mapping."""
+        response = app_client.post(
+            "/api/audiobooks/bulk-update",
+            data=json.dumps({"values": {}, "field": "narrator"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+
+    def test_bulk_update_per_id_invalid_id(self, app_client):
+        """Test per-id bulk update with a non-integer id key."""
+        response = app_client.post(
+            "/api/audiobooks/bulk-update",
+            data=json.dumps({"values": {"not-an-id": "Test"}, "field": "narrator"}),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+
     def test_bulk_delete_missing_ids(self, app_client):
         """Test bulk delete with missing IDs."""
         response = app_client.post(
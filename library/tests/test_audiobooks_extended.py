@@ -222,7 +222,9 @@ class TestGetStatsEdgeCases:
         """Lines 124-125: OSError when reading database file size."""
         with audiobooks_app.test_client() as c:
             with patch("os.path.getsize", side_effect=OSError("permission denied")):
-                resp = c.get("/api/stats")
+                # fresh=1 bypasses the aggregate TTL cache so the patched
+                # getsize is actually exercised.
+                resp = c.get("/api/stats?fresh=1")
                 assert resp.status_code == 200
                 data = resp.get_json()
                 # database_size_mb should be 0.0 on error
@@ -581,7 +581,7 @@ class TestTokenHashing:
         token, token_hash = generate_session_token()
 
         assert len(token) > 30
-        assert len(token_hash) == 64  # SHA-256 produces 64 hex chars
+        assert len(token_hash) == 64  # BLAKE2b-256 produces 64 hex chars
         assert hash_token(token) == token_hash
 
 
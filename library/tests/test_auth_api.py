@@ -10,6 +10,8 @@ Tests cover:
 """
 
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -24,12 +26,52 @@ from auth.totp import TOTPAuthenticator  # noqa: E402
 # auth_app and auth_temp_dir fixtures come from conftest.py (session-scoped)
 
 
+@lru_cache(maxsize=32)
+def _code_for_window(secret: bytes, window: int) -> str:
+    return TOTPAuthenticator(secret).current_code()
+
+
+def _cached_code(secret: bytes) -> str:
+    """TOTP code for *secret*, cached per 30s window.
+
+    Every call inside the same TOTP step returns the same code, so the
+    HMAC-SHA1 + base32 work only runs once per (secret, window). Tests that
+    deliberately span windows keep calling current_code() directly.
+    """
+    return _code_for_window(secret, int(time.time() // 30))
+
+
 @pytest.fixture
 def client(auth_app):
     """Create test client."""
     return auth_app.test_client()
 
 
+@pytest.fixture(scope="class")
+def logged_in_client(auth_app):
+    """A client already logged in as testuser1, shared by the test class.
+
+    One login (TOTP generation + /auth/login round-trip) per class instead
+    of per test. Only for tests that read session state — anything that
+    mutates it (logout, re-login) must own a function-scoped client.
+    """
+    test_client = auth_app.test_client()
+    auth = TOTPAuthenticator(auth_app.test_user_secret)
+    r = test_client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+    assert r.status_code == 200, f"fixture login failed: {r.get_json()}"
+    return test_client
+
+
+@pytest.fixture(scope="class")
+def admin_logged_in_client(auth_app):
+    """A client already logged in as adminuser, shared by the test class."""
+    test_client = auth_app.test_client()
+    auth = TOTPAuthenticator(auth_app.admin_secret)
+    r = test_client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+    assert r.status_code == 200, f"fixture login failed: {r.get_json()}"
+    return test_client
+
+
 def _register_and_claim(client, auth_app, username, **claim_kwargs):
     """Register a user through the full v5 flow: start -> admin approve -> claim.
 
@@ -44,9 +86,8 @@ def _register_and_claim(client, auth_app, username, **claim_kwargs):
 
     # Step 2: Admin approves via a separate client (to avoid polluting session)
     admin_client = auth_app.test_client()
-    admin_auth = TOTPAuthenticator(auth_app.admin_secret)
     admin_client.post(
-        "/auth/login", json={"username": "adminuser", "code": admin_auth.current_code()}
+        "/auth/login", json={"username": "adminuser", "code": _cached_code(auth_app.admin_secret)}
     )
     r = admin_client.post(f"/auth/admin/access-requests/{request_id}/approve")
     assert r.status_code == 200, f"approve failed: {r.get_json()}"
@@ -59,6 +100,24 @@ def _register_and_claim(client, auth_app, username, **claim_kwargs):
     return r.get_json()
 
 
+@pytest.fixture
+def make_user(client, auth_app):
+    """Factory: register + claim a user, returning (username, authenticator, claim data).
+
+    Wraps _register_and_claim and builds the TOTPAuthenticator once, so
+    tests don't each repeat the base32 decode and authenticator
+    construction after claiming.
+    """
+    from auth.totp import base32_to_secret
+
+    def _make(username, **claim_kwargs):
+        data = _register_and_claim(client, auth_app, username, **claim_kwargs)
+        authenticator = TOTPAuthenticator(base32_to_secret(data["totp_secret"]))
+        return username, authenticator, data
+
+    return _make
+
+
 class TestAuthCheck:
     """Tests for /auth/check endpoint."""
 
@@ -69,20 +128,45 @@ class TestAuthCheck:
         data = r.get_json()
         assert data["authenticated"] is False
 
-    def test_check_authenticated(self, client, auth_app):
+    def test_check_authenticated(self, logged_in_client):
         """Test check returns true when logged in."""
-        # Login first
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        code = auth.current_code()
-
-        client.post("/auth/login", json={"username": "testuser1", "code": code})
-
-        r = client.get("/auth/check")
+        r = logged_in_client.get("/auth/check")
         assert r.status_code == 200
         data = r.get_json()
         assert data["authenticated"] is True
         assert data["username"] == "testuser1"
 
+    def test_check_touch_is_debounced(self, logged_in_client, auth_app):
+        """last_seen writes are debounced — rapid polls don't touch the row,
+        but a row stale past the debounce window gets refreshed."""
+        client = logged_in_client
+
+        def last_seen():
+            with auth_app.auth_db.connection() as conn:
+                row = conn.execute(
+                    "SELECT last_seen FROM sessions WHERE user_id = ?",
+                    (auth_app.test_user_id,),
+                ).fetchone()
+            return row[0]
+
+        client.get("/auth/check")
+        first = last_seen()
+        # Immediate re-poll: within the 60s window, no write
+        client.get("/auth/check")
+        assert last_seen() == first
+
+        # Backdate past the debounce window: the next request must touch
+        from datetime import datetime, timedelta
+
+        stale = (datetime.now() - timedelta(seconds=120)).isoformat(sep=" ")
+        with auth_app.auth_db.connection() as conn:
+            conn.execute(
+                "UPDATE sessions SET last_seen = ? WHERE user_id = ?",
+                (stale, auth_app.test_user_id),
+            )
+        client.get("/auth/check")
+        assert last_seen() != stale
+
 
 class TestLogin:
     """Tests for /auth/login endpoint."""
@@ -139,8 +223,8 @@ class TestLogout:
     def test_logout_success(self, client, auth_app):
         """Test successful logout."""
         # Login first
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         # Logout
         r = client.post("/auth/logout")
@@ -161,12 +245,9 @@ class TestLogout:
 class TestCurrentUser:
     """Tests for /auth/me endpoint."""
 
-    def test_me_authenticated(self, client, auth_app):
+    def test_me_authenticated(self, admin_logged_in_client):
         """Test /auth/me returns user info when logged in."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
-
-        r = client.get("/auth/me")
+        r = admin_logged_in_client.get("/auth/me")
         assert r.status_code == 200
         data = r.get_json()
         assert data["user"]["username"] == "adminuser"
@@ -280,6 +361,26 @@ class TestAuthHealth:
         assert data["auth_db"] is True
         assert data["schema_version"] == 10
 
+    def test_health_served_from_cache_until_fresh(self, client):
+        """Probes within the TTL reuse the cached payload; ?fresh=1 bypasses."""
+        import time
+
+        from api_modular import auth as auth_mod
+
+        sentinel = {"status": "ok", "auth_db": True, "schema_version": 10, "user_count": 9999}
+        auth_mod._health_cache["ts"] = time.monotonic()
+        auth_mod._health_cache["payload"] = sentinel
+        try:
+            r = client.get("/auth/health")
+            assert r.get_json()["user_count"] == 9999
+
+            r = client.get("/auth/health?fresh=1")
+            assert r.status_code == 200
+            assert r.get_json()["user_count"] != 9999
+        finally:
+            auth_mod._health_cache["ts"] = 0.0
+            auth_mod._health_cache["payload"] = None
+
 
 class TestRegistrationWithRecovery:
     """Tests for registration with recovery options."""
@@ -375,12 +476,9 @@ class TestBackupCodeRecovery:
 class TestBackupCodeManagement:
     """Tests for backup code management endpoints."""
 
-    def test_get_remaining_codes_authenticated(self, client, auth_app):
+    def test_get_remaining_codes_authenticated(self, logged_in_client):
         """Test getting remaining backup code count when logged in."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
-
-        r = client.post("/auth/recover/remaining-codes")
+        r = logged_in_client.post("/auth/recover/remaining-codes")
         assert r.status_code == 200
         data = r.get_json()
         assert "remaining" in data
@@ -390,18 +488,13 @@ class TestBackupCodeManagement:
         r = client.post("/auth/recover/remaining-codes")
         assert r.status_code == 401
 
-    def test_regenerate_codes_authenticated(self, client, auth_app):
+    def test_regenerate_codes_authenticated(self, client, make_user):
         """Test regenerating backup codes when logged in."""
-        data = _register_and_claim(client, auth_app, "regenuser")
+        username, auth, data = make_user("regenuser")
         old_codes = data["backup_codes"]
-        secret = data["totp_secret"]
 
         # Login
-        from auth.totp import base32_to_secret
-
-        totp_secret = base32_to_secret(secret)
-        auth = TOTPAuthenticator(totp_secret)
-        client.post("/auth/login", json={"username": "regenuser", "code": auth.current_code()})
+        client.post("/auth/login", json={"username": username, "code": auth.current_code()})
 
         # Regenerate codes
         r = client.post("/auth/recover/regenerate-codes")
@@ -421,17 +514,12 @@ class TestBackupCodeManagement:
 class TestRecoveryContactManagement:
     """Tests for recovery contact update endpoints."""
 
-    def test_update_recovery_contact(self, client, auth_app):
+    def test_update_recovery_contact(self, client, make_user):
         """Test updating recovery contact when logged in."""
-        data = _register_and_claim(client, auth_app, "contactuser")
-        secret = data["totp_secret"]
+        username, auth, _ = make_user("contactuser")
 
         # Login
-        from auth.totp import base32_to_secret
-
-        totp_secret = base32_to_secret(secret)
-        auth = TOTPAuthenticator(totp_secret)
-        client.post("/auth/login", json={"username": "contactuser", "code": auth.current_code()})
+        client.post("/auth/login", json={"username": username, "code": auth.current_code()})
 
         # Add recovery email
         r = client.post("/auth/recover/update-contact", json={"recovery_email": "new@example.com"})
@@ -441,17 +529,12 @@ class TestRecoveryContactManagement:
         assert data["success"] is True
         assert data["recovery_enabled"] is True
 
-    def test_remove_recovery_contact(self, client, auth_app):
+    def test_remove_recovery_contact(self, client, make_user):
         """Test removing recovery contact."""
-        data = _register_and_claim(client, auth_app, "rmcontact", recovery_email="has@example.com")
-        secret = data["totp_secret"]
+        username, auth, _ = make_user("rmcontact", recovery_email="has@example.com")
 
         # Login
-        from auth.totp import base32_to_secret
-
-        totp_secret = base32_to_secret(secret)
-        auth = TOTPAuthenticator(totp_secret)
-        client.post("/auth/login", json={"username": "rmcontact", "code": auth.current_code()})
+        client.post("/auth/login", json={"username": username, "code": auth.current_code()})
 
         # Remove recovery email
         r = client.post("/auth/recover/update-contact", json={"recovery_email": None})
@@ -510,24 +593,24 @@ class TestProtectedEndpointsAuthenticated:
 
     def test_audiobooks_accessible_when_logged_in(self, client, auth_app):
         """Test /api/audiobooks works when authenticated."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/audiobooks")
         assert r.status_code == 200
 
     def test_stats_accessible_when_logged_in(self, client, auth_app):
         """Test /api/stats works when authenticated."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/stats")
         assert r.status_code == 200
 
     def test_collections_accessible_when_logged_in(self, client, auth_app):
         """Test /api/collections works when authenticated."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/collections")
         assert r.status_code == 200
@@ -538,8 +621,8 @@ class TestAdminEndpointsNonAdmin:
 
     def test_delete_requires_admin(self, client, auth_app):
         """Test DELETE /api/audiobooks/<id> requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.delete("/api/audiobooks/1")
         assert r.status_code == 403
@@ -547,16 +630,16 @@ class TestAdminEndpointsNonAdmin:
 
     def test_vacuum_requires_admin(self, client, auth_app):
         """Test POST /api/utilities/vacuum requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/api/utilities/vacuum")
         assert r.status_code == 403
 
     def test_delete_duplicates_requires_admin(self, client, auth_app):
         """Test POST /api/duplicates/delete requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/api/duplicates/delete", json={"ids": []})
         assert r.status_code == 403
@@ -567,8 +650,8 @@ class TestAdminEndpointsWithAdmin:
 
     def test_vacuum_allowed_for_admin(self, client, auth_app):
         """Test POST /api/utilities/vacuum works for admin."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.post("/api/utilities/vacuum")
         # Should succeed (200) or handle gracefully - not 401/403
@@ -582,8 +665,8 @@ class TestDownloadPermissionEndpoints:
         """Test streaming works for any authenticated user (no download permission
         needed)."""
         # testuser1 has can_download=False but should still be able to stream
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/stream/1")
         # Should succeed or 404 (file doesn't exist on disk), but not 403
@@ -591,8 +674,8 @@ class TestDownloadPermissionEndpoints:
 
     def test_supplement_download_without_permission(self, client, auth_app):
         """Test supplement download requires download permission."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/supplements/1/download")
         assert r.status_code == 403
@@ -600,8 +683,8 @@ class TestDownloadPermissionEndpoints:
     def test_supplement_download_with_permission(self, client, auth_app):
         """Test supplement download works with download permission."""
         # adminuser has can_download=True
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.get("/api/supplements/1/download")
         # Should succeed or 404 (supplement doesn't exist), but not 403
@@ -610,8 +693,8 @@ class TestDownloadPermissionEndpoints:
     def test_audiobook_download_without_permission(self, client, auth_app):
         """Test audiobook download requires download permission."""
         # testuser1 has can_download=False
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/api/download/1")
         assert r.status_code == 403
@@ -620,8 +703,8 @@ class TestDownloadPermissionEndpoints:
     def test_audiobook_download_with_permission(self, client, auth_app):
         """Test audiobook download works with download permission."""
         # adminuser has can_download=True
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.get("/api/download/1")
         # Should succeed or 404 (file doesn't exist on disk), but not 403
@@ -633,8 +716,8 @@ class TestAdminOnlyEndpoints:
 
     def test_download_audiobooks_requires_admin(self, client, auth_app):
         """Test POST /api/utilities/download-audiobooks-async requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/api/utilities/download-audiobooks-async")
         assert r.status_code == 403
@@ -645,8 +728,8 @@ class TestPerUserPositionTracking:
 
     def test_get_position_returns_user_position(self, client, auth_app):
         """Test GET /api/position/<id> returns user's personal position."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         # Getting position should work (returns 0 or saved position)
         r = client.get("/api/position/1")
@@ -655,8 +738,8 @@ class TestPerUserPositionTracking:
 
     def test_update_position_saves_per_user(self, client, auth_app):
         """Test PUT /api/position/<id> saves to user's personal position."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.put("/api/position/1", json={"position_ms": 120000})
         # Should succeed or 404 if audiobook doesn't exist
@@ -677,6 +760,17 @@ class TestMagicLinkRequest:
         assert r.status_code == 400
         assert "Username is required" in r.get_json()["error"]
 
+    def test_magic_link_request_oversize_body_rejected(self, client):
+        """Oversize bodies are refused before parsing (413)."""
+        padding = "x" * 8192
+        r = client.post("/auth/magic-link", json={"username": "u", "padding": padding})
+        assert r.status_code == 413
+
+    def test_magic_link_request_non_json_rejected(self, client):
+        """Non-JSON content types are refused before reading the body (415)."""
+        r = client.post("/auth/magic-link", data="username=foo", content_type="text/plain")
+        assert r.status_code == 415
+
     def test_magic_link_request_nonexistent_user(self, client):
         """Test magic link request for nonexistent user returns success (privacy)."""
         r = client.post("/auth/magic-link", json={"username": "nonexistent_user_12345"})
@@ -772,10 +866,12 @@ class TestMagicLinkVerify:
         r = client.post("/auth/magic-link/verify", json={"token": raw_token})
         assert r.status_code == 200
 
-        # Second use - should fail
+        # Second use - should fail with the same generic error as an
+        # unknown token (revealing "already used" would confirm the link
+        # belonged to a real login).
         r = client.post("/auth/magic-link/verify", json={"token": raw_token})
         assert r.status_code == 400
-        assert "already been used" in r.get_json()["error"]
+        assert "Invalid or expired" in r.get_json()["error"]
 
     def test_magic_link_expired_token(self, client, auth_app):
         """Test magic link verify fails with expired token."""
@@ -813,8 +909,8 @@ class TestContactEndpoint:
 
     def test_contact_success_inapp_reply(self, client, auth_app):
         """Test sending contact message with in-app reply."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact",
@@ -828,8 +924,8 @@ class TestContactEndpoint:
 
     def test_contact_success_email_reply(self, client, auth_app):
         """Test sending contact message with email reply."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact",
@@ -846,8 +942,8 @@ class TestContactEndpoint:
 
     def test_contact_missing_message(self, client, auth_app):
         """Test contact fails with missing/empty message."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/auth/contact", json={"message": "", "reply_via": "in-app"})
         assert r.status_code == 400
@@ -855,8 +951,8 @@ class TestContactEndpoint:
 
     def test_contact_email_reply_requires_email(self, client, auth_app):
         """Test contact with email reply requires email address."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact",
@@ -872,8 +968,8 @@ class TestContactEndpoint:
 
     def test_contact_message_too_long(self, client, auth_app):
         """Test contact fails with message over 2000 chars."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/auth/contact", json={"message": "x" * 2001, "reply_via": "in-app"})
 
@@ -886,16 +982,16 @@ class TestAdminNotificationsEndpoints:
 
     def test_list_notifications_requires_admin(self, client, auth_app):
         """Test listing notifications requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/auth/admin/notifications")
         assert r.status_code == 403
 
     def test_list_notifications_as_admin(self, client, auth_app):
         """Test admin can list notifications."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.get("/auth/admin/notifications")
         assert r.status_code == 200
@@ -905,8 +1001,8 @@ class TestAdminNotificationsEndpoints:
 
     def test_create_notification_requires_admin(self, client, auth_app):
         """Test creating notification requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/admin/notifications", json={"message": "Test notification", "type": "info"}
@@ -915,8 +1011,8 @@ class TestAdminNotificationsEndpoints:
 
     def test_create_notification_as_admin(self, client, auth_app):
         """Test admin can create notification."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.post(
             "/auth/admin/notifications",
@@ -930,8 +1026,8 @@ class TestAdminNotificationsEndpoints:
 
     def test_create_notification_personal_requires_user(self, client, auth_app):
         """Test personal notification requires target user."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.post(
             "/auth/admin/notifications",
@@ -947,16 +1043,16 @@ class TestAdminNotificationsEndpoints:
 
     def test_delete_notification_requires_admin(self, client, auth_app):
         """Test deleting notification requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.delete("/auth/admin/notifications/1")
         assert r.status_code == 403
 
     def test_delete_notification_as_admin(self, client, auth_app):
         """Test admin can delete notification."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         # First create a notification
         r = client.post(
@@ -971,8 +1067,8 @@ class TestAdminNotificationsEndpoints:
 
     def test_delete_nonexistent_notification(self, client, auth_app):
         """Test deleting nonexistent notification fails gracefully."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.delete("/auth/admin/notifications/99999")
         assert r.status_code == 404
@@ -983,16 +1079,16 @@ class TestAdminInboxEndpoints:
 
     def test_inbox_list_requires_admin(self, client, auth_app):
         """Test listing inbox requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/auth/admin/inbox")
         assert r.status_code == 403
 
     def test_inbox_list_as_admin(self, client, auth_app):
         """Test admin can list inbox messages."""
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         r = client.get("/auth/admin/inbox")
         assert r.status_code == 200
@@ -1002,8 +1098,8 @@ class TestAdminInboxEndpoints:
 
     def test_inbox_read_message_requires_admin(self, client, auth_app):
         """Test reading inbox message requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/auth/admin/inbox/1")
         assert r.status_code == 403
@@ -1011,8 +1107,8 @@ class TestAdminInboxEndpoints:
     def test_inbox_read_marks_as_read(self, client, auth_app):
         """Test reading a message marks it as read."""
         # First, create a message as a regular user
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact", json={"message": "Test message for reading", "reply_via": "in-app"}
@@ -1021,8 +1117,8 @@ class TestAdminInboxEndpoints:
 
         # Logout and login as admin
         client.post("/auth/logout")
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         # Read the message
         r = client.get(f"/auth/admin/inbox/{message_id}")
@@ -1032,8 +1128,8 @@ class TestAdminInboxEndpoints:
 
     def test_inbox_reply_requires_admin(self, client, auth_app):
         """Test replying to inbox message requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/auth/admin/inbox/1/reply", json={"reply": "Thanks for your message!"})
         assert r.status_code == 403
@@ -1041,8 +1137,8 @@ class TestAdminInboxEndpoints:
     def test_inbox_reply_as_admin(self, client, auth_app):
         """Test admin can reply to inbox message."""
         # Create a message as regular user
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact",
@@ -1052,8 +1148,8 @@ class TestAdminInboxEndpoints:
 
         # Logout and login as admin
         client.post("/auth/logout")
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         # Reply to message
         r = client.post(
@@ -1067,8 +1163,8 @@ class TestAdminInboxEndpoints:
 
     def test_inbox_archive_requires_admin(self, client, auth_app):
         """Test archiving inbox message requires admin."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/auth/admin/inbox/1/archive")
         assert r.status_code == 403
@@ -1076,8 +1172,8 @@ class TestAdminInboxEndpoints:
     def test_inbox_archive_as_admin(self, client, auth_app):
         """Test admin can archive inbox message."""
         # Create a message as regular user
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post(
             "/auth/contact", json={"message": "Just wanted to say thanks!", "reply_via": "in-app"}
@@ -1086,8 +1182,8 @@ class TestAdminInboxEndpoints:
 
         # Logout and login as admin
         client.post("/auth/logout")
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         # Archive message
         r = client.post(f"/auth/admin/inbox/{message_id}/archive")
@@ -1106,8 +1202,8 @@ class TestNotificationDismiss:
     def test_dismiss_own_notification(self, client, auth_app):
         """Test user can dismiss their own notification."""
         # Admin creates a notification for testuser1
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
 
         # Get testuser1's ID from the database
         user_repo = UserRepository(auth_app.auth_db)
@@ -1127,8 +1223,8 @@ class TestNotificationDismiss:
 
         # Logout and login as testuser1
         client.post("/auth/logout")
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         # Dismiss the notification
         r = client.post(f"/auth/notifications/dismiss/{notification_id}")
@@ -1137,8 +1233,8 @@ class TestNotificationDismiss:
 
     def test_dismiss_nonexistent_notification(self, client, auth_app):
         """Test dismissing nonexistent notification fails gracefully."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.post("/auth/notifications/dismiss/99999")
         # Should return an error (400 = not found/applicable, 404 = not found)
@@ -1150,8 +1246,8 @@ class TestNotificationsInAuthMe:
 
     def test_auth_me_includes_notifications(self, client, auth_app):
         """Test /auth/me response includes notifications array."""
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
 
         r = client.get("/auth/me")
         assert r.status_code == 200
@@ -1168,13 +1264,13 @@ class TestAdminUserManagement:
     """
 
     def _admin_login(self, client, auth_app):
-        auth = TOTPAuthenticator(auth_app.admin_secret)
-        client.post("/auth/login", json={"username": "adminuser", "code": auth.current_code()})
+        code = _cached_code(auth_app.admin_secret)
+        client.post("/auth/login", json={"username": "adminuser", "code": code})
         return client
 
     def _user_login(self, client, auth_app):
-        auth = TOTPAuthenticator(auth_app.test_user_secret)
-        client.post("/auth/login", json={"username": "testuser1", "code": auth.current_code()})
+        code = _cached_code(auth_app.test_user_secret)
+        client.post("/auth/login", json={"username": "testuser1", "code": code})
         return client
 
     def test_list_users_requires_admin(self, client, auth_app):
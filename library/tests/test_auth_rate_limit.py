@@ -24,8 +24,10 @@ from api_modular.rate_limit import (  # noqa: E402
     CONFIG_MAX_FAILURES,
     CONFIG_WINDOW_SECONDS,
     DEFAULT_MAX_FAILURES,
+    RequestWindowLimiter,
     SlidingWindowLimiter,
     get_limiter,
+    get_request_limiter,
 )
 from auth import AuthType, User  # noqa: E402
 from auth.totp import TOTPAuthenticator, setup_totp  # noqa: E402
@@ -35,10 +37,12 @@ WRONG_CODE = "000000"
 
 @pytest.fixture(autouse=True)
 def clean_limiter():
-    """Every test starts with an empty limiter and leaves one behind."""
+    """Every test starts with empty limiters and leaves them behind."""
     get_limiter().clear()
+    get_request_limiter().clear()
     yield
     get_limiter().clear()
+    get_request_limiter().clear()
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -252,3 +256,71 @@ class TestDecoratorCoverage:
             "a generous default defeats the purpose — a six-digit code needs "
             "the attempt budget to be small"
         )
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Request-volume limiting on the magic-link routes
+# ──────────────────────────────────────────────────────────────────────
+
+
+class TestRequestWindowLimiter:
+    def test_allows_until_the_cap(self):
+        limiter = RequestWindowLimiter()
+        for _ in range(3):
+            assert limiter.check("k", 3, 60) is None
+        assert limiter.check("k", 3, 60) is not None, "the 4th request must be refused"
+
+    def test_refusal_reports_a_positive_retry_after(self):
+        limiter = RequestWindowLimiter()
+        limiter.check("k", 1, 60)
+        retry_after = limiter.check("k", 1, 60)
+        assert retry_after is not None and retry_after >= 1
+
+    def test_keys_are_independent(self):
+        limiter = RequestWindowLimiter()
+        limiter.check("a", 1, 60)
+        assert limiter.check("b", 1, 60) is None
+
+    def test_budget_returns_as_the_window_slides(self):
+        limiter = RequestWindowLimiter()
+        limiter.check("k", 1, 0)
+        time.sleep(0.01)
+        assert limiter.check("k", 1, 0) is None, "expired stamps must free the budget"
+
+
+class TestMagicLinkRequestThrottling:
+    """The magic-link routes answer 200 to everything (anti-enumeration),
+    so they need a volume cap, not a failure counter — every accepted
+    request costs an SMTP send or a token-table probe."""
+
+    def test_magic_link_requests_hit_the_cap(self, auth_app):
+        client = auth_app.test_client()
+        for attempt in range(5):
+            r = client.post("/auth/magic-link", json={"username": "ml_throttle_target"})
+            assert r.status_code == 200, f"attempt {attempt} is within budget"
+        r = client.post("/auth/magic-link", json={"username": "ml_throttle_target"})
+        assert r.status_code == 429
+        assert r.headers.get("Retry-After")
+
+    def test_other_usernames_keep_their_own_budget(self, auth_app):
+        client = auth_app.test_client()
+        for _ in range(6):
+            client.post("/auth/magic-link", json={"username": "ml_throttle_victim"})
+        r = client.post("/auth/magic-link", json={"username": "ml_throttle_bystander"})
+        assert r.status_code == 200, "one username's cap must not starve another's recovery"
+
+    def test_bodyless_requests_bypass_the_username_cap(self, auth_app):
+        """Requests without a username 400 before any email is sent;
+        counting them would let junk POSTs exhaust a shared bucket."""
+        client = auth_app.test_client()
+        for _ in range(10):
+            r = client.post("/auth/magic-link", json={})
+            assert r.status_code == 400
+
+    def test_verify_guessing_is_capped_per_address(self, auth_app):
+        client = auth_app.test_client()
+        refused = 0
+        for _ in range(25):
+            r = client.post("/auth/magic-link/verify", json={"token": "not-a-real-token"})
+            refused += r.status_code == 429
+        assert refused > 0, "sustained token guessing must start drawing 429s"
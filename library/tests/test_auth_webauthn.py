@@ -23,6 +23,7 @@ LIBRARY_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(LIBRARY_DIR))
 
 from auth import AuthDatabase, AuthType, User, UserRepository  # noqa: E402
+from auth.models import _drop_cached_user  # noqa: E402
 from auth.passkey import (  # noqa: E402
     CHALLENGE_TIMEOUT_SECONDS,
     DEFAULT_RP_ID,
@@ -537,12 +538,14 @@ class TestAuthTypeIntegration:
             created_at=stored_cred.created_at,
         )
 
-        # Update in database
+        # Update in database (raw SQL bypasses the user-row TTL cache,
+        # so drop the entry before re-reading)
         with temp_db.connection() as conn:
             conn.execute(
                 "UPDATE users SET auth_credential = ? WHERE id = ?",
                 (updated_cred.to_json().encode("utf-8"), user_id),
             )
+        _drop_cached_user(temp_db, user_id)
 
         # Verify update
         final = repo.get_by_id(user_id)
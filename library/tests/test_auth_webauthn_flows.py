@@ -23,6 +23,7 @@ LIBRARY_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(LIBRARY_DIR))
 
 from auth import AuthType, UserRepository  # noqa: E402
+from auth.models import _drop_cached_user  # noqa: E402
 from auth.passkey import WebAuthnCredential  # noqa: E402
 from webauthn.helpers import bytes_to_base64url  # noqa: E402
 
@@ -200,18 +201,22 @@ class TestWebAuthnSwitchComplete:
         assert data["success"] is True
         assert data["auth_type"] == "passkey"
 
-        # Verify user's auth_type updated in DB
+        # Verify user's auth_type updated in DB (the app wrote through its
+        # own AuthDatabase handle, so drop this handle's cached row first)
+        _drop_cached_user(auth_db, test_user.id)
         repo = UserRepository(auth_db)
         updated = repo.get_by_id(test_user.id)
         assert updated is not None
         assert updated.auth_type == AuthType.PASSKEY
 
-        # Clean up: reset user back to TOTP for other tests
+        # Clean up: reset user back to TOTP for other tests (raw SQL
+        # bypasses the user-row TTL cache, so drop the entry too)
         with auth_db.connection() as conn:
             conn.execute(
                 "UPDATE users SET auth_type = ?, auth_credential = ? WHERE id = ?",
                 ("totp", b"testsecret", test_user.id),
             )
+        _drop_cached_user(auth_db, test_user.id)
 
     @patch("api_modular.auth.webauthn_verify_registration")
     @patch("api_modular.auth.get_webauthn_config")
@@ -239,7 +244,8 @@ class TestWebAuthnSwitchComplete:
         data = resp.get_json()
         assert data["auth_type"] == "fido2"
 
-        # Verify auth_type in DB
+        # Verify auth_type in DB (drop this handle's cached row first)
+        _drop_cached_user(auth_db, test_user.id)
         repo = UserRepository(auth_db)
         updated = repo.get_by_id(test_user.id)
         assert updated is not None
@@ -251,6 +257,7 @@ class TestWebAuthnSwitchComplete:
                 "UPDATE users SET auth_type = ?, auth_credential = ? WHERE id = ?",
                 ("totp", b"testsecret", test_user.id),
             )
+        _drop_cached_user(auth_db, test_user.id)
 
     def test_complete_missing_credential(self, user_client):
         resp = user_client.post(
@@ -841,7 +848,7 @@ class TestLoginWebAuthnComplete:
         mock_config.return_value = ("localhost", "TestApp", "http://localhost:5001")
         mock_verify.return_value = 6  # new sign_count
 
-        _make_passkey_user(auth_db)
+        passkey_user = _make_passkey_user(auth_db)
 
         client = auth_app.test_client()
         resp = client.post(
@@ -864,7 +871,9 @@ class TestLoginWebAuthnComplete:
         set_cookie_header = resp.headers.get("Set-Cookie", "")
         assert "audiobooks_session=" in set_cookie_header
 
-        # Verify sign_count updated in DB
+        # Verify sign_count updated in DB (the login wrote through the app's
+        # own AuthDatabase handle, so drop this handle's cached row first)
+        _drop_cached_user(auth_db, passkey_user.id)
         repo = UserRepository(auth_db)
         user = repo.get_by_username("passkeylogin_fix")
         assert user is not None
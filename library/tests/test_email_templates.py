@@ -122,6 +122,21 @@ def test_username_is_html_escaped_in_html_body() -> None:
     assert "&lt;script&gt;" in html_body
 
 
+def test_magic_link_url_is_escaped_in_href() -> None:
+    """A link value that tries to break out of the href must be escaped.
+
+    The link lands in three places (button href, fallback href, fallback
+    anchor text) — a quote or tag in it must never terminate the
+    attribute or open new markup in any of them.
+    """
+    payload = 'https://evil.example/"><script>alert(1)</script>'
+    variables = {**_TEMPLATE_VARS["magic_link"], "link": payload}
+
+    _subject, _text, html_body = email_templates.render_email("magic_link", "en", **variables)
+    assert "<script>" not in html_body
+    assert "&quot;&gt;&lt;script&gt;" in html_body
+
+
 def test_reply_text_is_html_escaped() -> None:
     """Reply bodies often contain user prose — must also be escaped."""
     payload = "<img src=x onerror=alert(1)>"
@@ -140,12 +155,16 @@ def test_reply_text_is_html_escaped() -> None:
 def test_missing_zh_key_falls_back_to_english() -> None:
     """If a zh-Hans slot is missing the renderer must pull from English."""
     removed = email_templates._CATALOGS["zh-Hans"].pop("email.magic_link.intro")
+    # The magic-link scaffold is compiled once per locale — drop the
+    # compiled form so this render sees the mutated catalog.
+    email_templates._compiled_magic_link.cache_clear()
     try:
         _subject, _text, html_body = email_templates.render_email(
             "magic_link", "zh-Hans", **_TEMPLATE_VARS["magic_link"]
         )
     finally:
         email_templates._CATALOGS["zh-Hans"]["email.magic_link.intro"] = removed
+        email_templates._compiled_magic_link.cache_clear()
 
     # The English intro text must appear in the otherwise-Chinese body.
     english_intro_fragment = "Click the big gold button"
@@ -500,6 +500,36 @@ class TestCreateProgressCallback:
         status = fresh_tracker.get_status(op_id)
         assert status["progress"] == 75
 
+    def test_callback_coalesces_same_percent(self, fresh_tracker):
+        """Test that rapid same-percent updates are coalesced."""
+        from backend.operation_status import create_progress_callback
+
+        op_id = fresh_tracker.create_operation("test", "Test")
+        fresh_tracker.start_operation(op_id)
+
+        callback = create_progress_callback(op_id)
+        callback(1, 1000, "file 1")
+        callback(2, 1000, "file 2")  # still 0% and within interval — dropped
+
+        status = fresh_tracker.get_status(op_id)
+        assert status["message"] == "file 1"
+
+    def test_callback_always_publishes_completion(self, fresh_tracker):
+        """Test that the 100% update is never dropped by coalescing."""
+        from backend.operation_status import create_progress_callback
+
+        op_id = fresh_tracker.create_operation("test", "Test")
+        fresh_tracker.start_operation(op_id)
+
+        callback = create_progress_callback(op_id)
+        callback(999, 1000, "almost")  # 99%
+        callback(1000, 1000, "done")  # 100%
+        callback(1000, 1000, "really done")  # repeat 100% — still published
+
+        status = fresh_tracker.get_status(op_id)
+        assert status["progress"] == 100
+        assert status["message"] == "really done"
+
 
 class TestOperationLifecycle:
     """Integration tests for complete operation lifecycle scenarios."""
@@ -85,8 +85,11 @@ class TestDeleteOwnAccount:
     def test_delete_own_account(self, user_client, test_user, auth_db):
         resp = user_client.delete("/auth/account")
         assert resp.status_code == 200
-        from auth.models import UserRepository
+        from auth.models import UserRepository, _drop_cached_user
 
+        # The delete went through the app's own AuthDatabase handle; drop
+        # this handle's cached row so the lookup hits the database.
+        _drop_cached_user(auth_db, test_user.id)
         assert UserRepository(auth_db).get_by_id(test_user.id) is None
 
     def test_delete_clears_session_cookie(self, user_client):
@@ -227,7 +227,12 @@ class TestBroadcast:
         self.mgr.register("s1", ws, "alice")
         msg = {"type": "test", "data": 42}
         self.mgr.broadcast(msg)
-        ws.send.assert_called_once_with(json.dumps(msg))
+        ws.send.assert_called_once()
+        sent = ws.send.call_args[0][0]
+        # Frame must be text (clients JSON.parse event.data); exact byte
+        # formatting depends on whether orjson is installed.
+        assert isinstance(sent, str)
+        assert json.loads(sent) == msg
 
     def test_broadcast_string_sent_as_is(self):
         ws = MagicMock()
@@ -275,9 +280,14 @@ class TestBroadcast:
         payload = {"type": "update", "version": 3}
         self.mgr.broadcast(payload)
 
-        expected = json.dumps(payload)
-        ws1.send.assert_called_once_with(expected)
-        ws2.send.assert_called_once_with(expected)
+        ws1.send.assert_called_once()
+        ws2.send.assert_called_once()
+        # Both sockets get the identical serialized frame (one encode per
+        # broadcast) and it round-trips to the original payload.
+        sent1 = ws1.send.call_args[0][0]
+        sent2 = ws2.send.call_args[0][0]
+        assert sent1 == sent2
+        assert json.loads(sent1) == payload
 
 
 class TestAdminConnectionsList: